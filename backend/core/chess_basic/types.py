@@ -236,3 +236,23 @@ class BoardState:
         """创建棋盘状态的深拷贝 Create deep copy of board state"""
         from copy import deepcopy
         return deepcopy(self)
+
+    def copy_into(self, target: "BoardState") -> "BoardState":
+        """
+        将当前状态复制到已有对象中（复用对象，避免分配）
+        Copy this state into an existing object (reuses it instead of allocating)
+
+        Pieces and squares are immutable, so sharing them is safe; the board
+        list and castling rights are copied so the two states stay independent.
+        """
+        target.board[:] = self.board
+        target.turn = self.turn
+        rights = target.castling_rights
+        rights.white_kingside = self.castling_rights.white_kingside
+        rights.white_queenside = self.castling_rights.white_queenside
+        rights.black_kingside = self.castling_rights.black_kingside
+        rights.black_queenside = self.castling_rights.black_queenside
+        target.en_passant_square = self.en_passant_square
+        target.halfmove_clock = self.halfmove_clock
+        target.fullmove_number = self.fullmove_number
+        return target
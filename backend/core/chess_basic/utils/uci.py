@@ -5,6 +5,8 @@ UCI 走法解析与生成
 UCI (Universal Chess Interface) move parsing and generation.
 """
 
+from functools import lru_cache
+
 from ..types import Move, Square
 from ..constants import PieceType, PIECE_SYMBOLS
 from ..errors import UCIParseError
@@ -25,11 +27,23 @@ def parse_uci_move(uci: str) -> Move:
         UCIParseError: If UCI string is invalid
     """
     try:
-        return Move.from_uci(uci)
+        return _parse_uci_cached(uci)
     except ValueError as e:
         raise UCIParseError(str(e), uci) from e
 
 
+@lru_cache(maxsize=4096)
+def _parse_uci_cached(uci: str) -> Move:
+    """
+    缓存的 UCI 解析（Move 不可变，可共享）
+    Cached UCI parsing; Move is immutable, so one instance per string is shared
+
+    4096 covers every from/to square pair plus promotions that occur in play.
+    Invalid strings raise and are never cached.
+    """
+    return Move.from_uci(uci)
+
+
 def move_to_uci(move: Move) -> str:
     """
     将走法转换为 UCI 字符串
@@ -0,0 +1,118 @@
+"""Shared cloud-eval cache backed by RedisJSON.
+
+Optional: enabled only when ``settings.ENGINE_CACHE_URL`` is set and the
+``redis`` package is installed. Any cache error is treated as a miss so the
+engine path never depends on Redis being up.
+"""
+from __future__ import annotations
+
+import json
+
+from core.config import settings
+from core.chess_engine.fen_codec import fen_cache_key
+from core.log.log_chess_engine import logger
+
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+CACHE_KEY_PREFIX = "ce:"
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+class _OrjsonEncoder:
+    """Minimal encoder shim so redis-py JSON commands go through orjson."""
+
+    def encode(self, obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+
+class _OrjsonDecoder:
+    """Minimal decoder shim so redis-py JSON commands go through orjson."""
+
+    def decode(self, s):
+        return orjson.loads(s)
+
+
+class CloudEvalCache:
+    """
+    Cross-process cache of Lichess cloud-eval payloads.
+
+    Each entry is stored as a JSON document ``{"multipv": n, "pvs": [...]}``
+    under ``ce:{key}``, where ``key`` hashes the compact binary FEN. Reads
+    fetch only ``$.pvs[:multipv]`` so large documents are not re-parsed in
+    full.
+    """
+
+    def __init__(self, client, ttl: int = DEFAULT_TTL_SECONDS):
+        self.client = client
+        self.ttl = ttl
+        if HAS_ORJSON:
+            self._json = client.json(encoder=_OrjsonEncoder(), decoder=_OrjsonDecoder())
+        else:
+            self._json = client.json(encoder=json.JSONEncoder(), decoder=json.JSONDecoder())
+
+    @classmethod
+    def from_settings(cls) -> "CloudEvalCache | None":
+        """Build a cache from settings, or return None when disabled."""
+        url = settings.ENGINE_CACHE_URL
+        if not url:
+            return None
+        if not HAS_REDIS:
+            logger.warning("ENGINE_CACHE_URL is set but redis is not installed; cache disabled")
+            return None
+        try:
+            client = redis.Redis.from_url(url)
+        except Exception as exc:
+            logger.error(f"Invalid ENGINE_CACHE_URL, cache disabled: {exc}")
+            return None
+        logger.info("Cloud-eval cache enabled (Redis)")
+        return cls(client, ttl=settings.ENGINE_CACHE_TTL)
+
+    @staticmethod
+    def make_key(fen: str) -> str:
+        try:
+            return f"{CACHE_KEY_PREFIX}{fen_cache_key(fen)}"
+        except ValueError:
+            # Malformed FEN: still cacheable, just not compact
+            return f"{CACHE_KEY_PREFIX}{fen}"
+
+    def get_pvs(self, fen: str, multipv: int) -> list[dict] | None:
+        """
+        Return the first ``multipv`` PVs cached for ``fen``, or None on miss.
+
+        Entries cached with a smaller multipv than requested count as a miss.
+        """
+        try:
+            found = self._json.get(self.make_key(fen), "$.multipv", f"$.pvs[:{multipv}]")
+        except Exception as exc:
+            logger.warning(f"Cloud-eval cache read failed: {exc}")
+            return None
+        if not found:
+            return None
+        stored_multipv = found.get("$.multipv") or [0]
+        if stored_multipv[0] < multipv:
+            return None
+        pvs = found.get(f"$.pvs[:{multipv}]")
+        return pvs or None
+
+    def set_eval(self, fen: str, multipv: int, data: dict) -> None:
+        """Store a raw cloud-eval payload for ``fen``."""
+        key = self.make_key(fen)
+        doc = {"multipv": multipv, "pvs": data.get("pvs", [])}
+        try:
+            pipe = self._json.pipeline(transaction=False)
+            pipe.set(key, "$", doc)
+            pipe.expire(key, self.ttl)
+            pipe.execute()
+        except Exception as exc:
+            logger.warning(f"Cloud-eval cache write failed: {exc}")
@@ -1,12 +1,17 @@
 # core/chess_engine/client.py
 import requests
 import time
+from requests.adapters import HTTPAdapter
 from core.config import settings
 from core.chess_engine.schemas import EngineResult, EngineLine
+from core.chess_engine.cache import CloudEvalCache
 from core.chess_engine.fallback import analyze_legal_moves
 from core.log.log_chess_engine import logger
 from core.errors import ChessEngineError, ChessEngineTimeoutError
 
+CONNECT_TIMEOUT = 2  # seconds; fail fast on connect stalls
+DEFAULT_RETRY_AFTER = 60  # seconds; Lichess asks clients to wait a minute after a 429
+
 
 class EngineClient:
     """
@@ -18,6 +23,10 @@ class EngineClient:
         self.base_url = settings.LICHESS_CLOUD_EVAL_URL
         self.sf_url = settings.ENGINE_URL or "https://sf.catachess.com/engine/analyze"
         self.timeout = timeout or settings.ENGINE_TIMEOUT
+        self.cache = CloudEvalCache.from_settings()
+        self.session = self._build_session()
+        # Monotonic deadline before which Cloud Eval is skipped (set on 429)
+        self._cloud_retry_at = 0.0
         logger.info(f"EngineClient initialized with Lichess Cloud Eval: {self.base_url}")
 
     def analyze(
@@ -28,15 +37,24 @@ class EngineClient:
         engine: str | None = None,
     ) -> EngineResult:
         if settings.ENGINE_DISABLE_CLOUD:
-            logger.info("Cloud Eval disabled; using sf.catachess")
+            logger.debug("Cloud Eval disabled; using sf.catachess")
             return self._analyze_sf(fen, depth, multipv)
 
         if engine == "sf":
-            logger.info("Engine override: SFCata")
+            logger.debug("Engine override: SFCata")
             return self._analyze_sf(fen, depth, multipv)
 
-        logger.info(f"Analyzing (Cloud Eval): fen={fen[:50]}..., multipv={multipv}")
-        
+        logger.debug("Analyzing (Cloud Eval): fen=%.50s multipv=%d", fen, multipv)
+
+        if self.cache is not None:
+            cached_pvs = self.cache.get_pvs(fen, multipv)
+            if cached_pvs is not None:
+                return self._parse_cloud_eval({"pvs": cached_pvs})
+
+        if time.monotonic() < self._cloud_retry_at:
+            logger.debug("Cloud Eval rate-limited; skipping until Retry-After expires")
+            return self._analyze_rate_limited(fen, depth, multipv)
+
         try:
             # Lichess Cloud Eval API
             # GET https://lichess.org/api/cloud-eval?fen={fen}&multiPv={multipv}
@@ -46,26 +64,22 @@ class EngineClient:
                 # "variant": "standard" # Default
             }
             
-            resp = requests.get(
+            resp = self.session.get(
                 self.base_url,
                 params=params,
-                timeout=self.timeout
+                timeout=(CONNECT_TIMEOUT, self.timeout)
             )
             
             if resp.status_code == 429:
-                # Rate limit
-                logger.warning("Lichess Cloud Eval rate limit (429)")
-                try:
-                    return self._analyze_sf(fen, depth, multipv)
-                except Exception as sf_exc:
-                    logger.error(f"sf.catachess fallback failed: {sf_exc}")
-                    if settings.ENGINE_FALLBACK_MODE != "off":
-                        return analyze_legal_moves(fen, depth, multipv)
-                    raise ChessEngineError("Rate limit exceeded")
+                # Rate limit: back off Lichess for Retry-After, serve from sf meanwhile
+                retry_after = self._parse_retry_after(resp.headers.get("Retry-After"))
+                self._cloud_retry_at = time.monotonic() + retry_after
+                logger.warning("Lichess Cloud Eval rate limit (429); backing off %ss", retry_after)
+                return self._analyze_rate_limited(fen, depth, multipv)
                 
             if resp.status_code == 404:
                 # Not found (no cloud eval available for this position)
-                logger.info("Cloud eval not found (404)")
+                logger.debug("Cloud eval not found (404)")
                 try:
                     return self._analyze_sf(fen, depth, multipv)
                 except Exception as sf_exc:
@@ -76,7 +90,10 @@ class EngineClient:
                 
             resp.raise_for_status()
             data = resp.json()
-            return self._parse_cloud_eval(data)
+            result = self._parse_cloud_eval(data)
+            if self.cache is not None:
+                self.cache.set_eval(fen, multipv, data)
+            return result
             
         except requests.exceptions.Timeout:
             logger.error(f"Cloud Eval timeout after {self.timeout}s")
@@ -98,8 +115,36 @@ class EngineClient:
                     return analyze_legal_moves(fen, depth, multipv)
                 raise ChessEngineError(f"Engine call failed: {str(e)}")
 
+    def _analyze_rate_limited(self, fen: str, depth: int, multipv: int) -> EngineResult:
+        try:
+            return self._analyze_sf(fen, depth, multipv)
+        except Exception as sf_exc:
+            logger.error(f"sf.catachess fallback failed: {sf_exc}")
+            if settings.ENGINE_FALLBACK_MODE != "off":
+                return analyze_legal_moves(fen, depth, multipv)
+            raise ChessEngineError("Rate limit exceeded")
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        return session
+
+    @staticmethod
+    def _parse_retry_after(value: str | None) -> int:
+        """Retry-After in seconds; HTTP-date or missing values use the default."""
+        if value:
+            try:
+                return max(0, int(value))
+            except ValueError:
+                pass
+        return DEFAULT_RETRY_AFTER
+
     def _analyze_sf(self, fen: str, depth: int, multipv: int) -> EngineResult:
-        logger.info(f"Analyzing (sf.catachess): fen={fen[:50]}..., multipv={multipv}")
+        logger.debug("Analyzing (sf.catachess): fen=%.50s multipv=%d", fen, multipv)
         payload = {"fen": fen, "depth": depth, "multipv": multipv}
         headers = {
             "User-Agent": "catachess-engine/1.0",
@@ -111,10 +156,10 @@ class EngineClient:
         # Retry transient upstream errors to avoid brief CF/origin blips.
         for attempt in range(3):
             try:
-                resp = requests.post(
+                resp = self.session.post(
                     self.sf_url,
                     json=payload,
-                    timeout=self.timeout,
+                    timeout=(CONNECT_TIMEOUT, self.timeout),
                     headers=headers,
                 )
                 if resp.status_code in (502, 503, 504) and attempt < 2:
@@ -172,30 +217,26 @@ class EngineClient:
           ]
         }
         """
-        if "pvs" not in data:
+        pvs = data.get("pvs")
+        if pvs is None:
             raise ChessEngineError("Invalid Cloud Eval response format")
-            
-        lines = []
-        for i, pv in enumerate(data["pvs"]):
+
+        lines = [None] * len(pvs)
+        for i, pv in enumerate(pvs):
             # Lichess provides space-separated UCI moves string
-            moves_str = pv.get("moves", "")
-            uci_moves = moves_str.split()
-            
-            score_cp = pv.get("cp")
+            moves_str = pv.get("moves")
+            uci_moves = moves_str.split() if moves_str else []
+
             score_mate = pv.get("mate")
-            
-            score_val = 0
             if score_mate is not None:
                 score_val = f"mate{score_mate}"
-            elif score_cp is not None:
-                score_val = score_cp
-            
-            lines.append(EngineLine(
-                multipv=i + 1,
-                score=score_val,
-                pv=uci_moves
-            ))
-            
+            else:
+                score_val = pv.get("cp")
+                if score_val is None:
+                    score_val = 0
+
+            lines[i] = EngineLine(multipv=i + 1, score=score_val, pv=uci_moves)
+
         return EngineResult(lines=lines, source="CloudEval")
 
     def _parse_sf_response(self, data: dict, turn: str) -> EngineResult:
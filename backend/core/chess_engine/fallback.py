@@ -13,6 +13,19 @@ def analyze_legal_moves(fen: str, depth: int, multipv: int) -> EngineResult:
 
     This keeps the UI functional when the remote engine is unreachable.
     """
+    result = build_legal_moves_result(fen, multipv)
+    if result.lines:
+        log_fallback_used(depth, multipv)
+    return result
+
+
+def build_legal_moves_result(fen: str, multipv: int) -> EngineResult:
+    """
+    Compute the fallback result without logging.
+
+    Safe to run speculatively; callers log via log_fallback_used() only
+    when the result is actually served.
+    """
     try:
         state = parse_fen(fen)
         legal_moves = generate_legal_moves(state)
@@ -33,9 +46,12 @@ def analyze_legal_moves(fen: str, depth: int, multipv: int) -> EngineResult:
             )
         )
 
+    return EngineResult(lines=lines, source="Fallback")
+
+
+def log_fallback_used(depth: int, multipv: int) -> None:
     logger.warning(
         "Using fallback engine (legal moves only). depth=%s multipv=%s",
         depth,
         multipv,
     )
-    return EngineResult(lines=lines, source="Fallback")
@@ -0,0 +1,131 @@
+"""Compact binary position encoding (Lichess "binary FEN" layout).
+
+Layout:
+- 8 bytes: big-endian occupancy bitboard (bit n = square n, a1 = 0)
+- one nibble per occupied square in ascending square order, two per byte
+  (low nibble first), using the piece codes below
+- LEB128 halfmove clock and ply count, omitted when both are trivial
+
+Side to move, castling rights and the en-passant square are folded into the
+piece codes, so the encoding is roughly half the size of the FEN string.
+"""
+from __future__ import annotations
+
+import hashlib
+
+# Piece nibble codes
+_PIECE_CODES = {
+    "P": 0, "p": 1,
+    "N": 2, "n": 3,
+    "B": 4, "b": 5,
+    "R": 6, "r": 7,
+    "Q": 8, "q": 9,
+    "K": 10, "k": 11,
+}
+EP_PAWN = 12             # pawn that can be captured en passant
+WHITE_CASTLING_ROOK = 13
+BLACK_CASTLING_ROOK = 14
+BLACK_KING_TO_MOVE = 15
+
+# Castling flag -> (rook square, rook piece, code)
+_CASTLING_ROOKS = {
+    "K": (7, "R", WHITE_CASTLING_ROOK),
+    "Q": (0, "R", WHITE_CASTLING_ROOK),
+    "k": (63, "r", BLACK_CASTLING_ROOK),
+    "q": (56, "r", BLACK_CASTLING_ROOK),
+}
+
+_FILES = "abcdefgh"
+
+
+def _write_leb128(out: bytearray, value: int) -> None:
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def encode_fen(fen: str) -> bytes:
+    """
+    Encode a FEN string to the compact binary layout.
+
+    Raises:
+        ValueError: If the FEN is malformed
+    """
+    parts = fen.split()
+    if not parts:
+        raise ValueError("Empty FEN")
+    placement = parts[0]
+    turn = parts[1] if len(parts) > 1 else "w"
+    castling = parts[2] if len(parts) > 2 else "-"
+    ep = parts[3] if len(parts) > 3 else "-"
+    try:
+        halfmove = int(parts[4]) if len(parts) > 4 else 0
+        fullmove = int(parts[5]) if len(parts) > 5 else 1
+    except ValueError as exc:
+        raise ValueError(f"Invalid FEN counters: {fen}") from exc
+
+    ranks = placement.split("/")
+    if len(ranks) != 8:
+        raise ValueError(f"Invalid FEN placement: {fen}")
+
+    pieces: dict[int, int] = {}
+    for rank_idx, rank in enumerate(ranks):
+        square = (7 - rank_idx) * 8
+        end = square + 8
+        for ch in rank:
+            if ch.isdigit():
+                square += int(ch)
+            else:
+                code = _PIECE_CODES.get(ch)
+                if code is None or square >= end:
+                    raise ValueError(f"Invalid FEN placement: {fen}")
+                pieces[square] = code
+                square += 1
+        if square != end:
+            raise ValueError(f"Invalid FEN placement: {fen}")
+
+    if castling != "-":
+        for flag in castling:
+            rook = _CASTLING_ROOKS.get(flag)
+            if rook and pieces.get(rook[0]) == _PIECE_CODES[rook[1]]:
+                pieces[rook[0]] = rook[2]
+
+    if ep != "-" and len(ep) == 2 and ep[0] in _FILES and ep[1] in "36":
+        ep_square = _FILES.index(ep[0]) + (int(ep[1]) - 1) * 8
+        pawn_square = ep_square + 8 if ep[1] == "3" else ep_square - 8
+        if pieces.get(pawn_square) in (_PIECE_CODES["P"], _PIECE_CODES["p"]):
+            pieces[pawn_square] = EP_PAWN
+
+    if turn == "b":
+        for square, code in pieces.items():
+            if code == _PIECE_CODES["k"]:
+                pieces[square] = BLACK_KING_TO_MOVE
+                break
+
+    occupied = 0
+    for square in pieces:
+        occupied |= 1 << square
+
+    out = bytearray(occupied.to_bytes(8, "big"))
+    codes = [pieces[sq] for sq in sorted(pieces)]
+    for i in range(0, len(codes) - 1, 2):
+        out.append(codes[i] | (codes[i + 1] << 4))
+    if len(codes) % 2:
+        out.append(codes[-1])
+
+    plies = (fullmove - 1) * 2 + (1 if turn == "b" else 0)
+    if halfmove > 0 or plies > 1:
+        _write_leb128(out, halfmove)
+        _write_leb128(out, plies)
+
+    return bytes(out)
+
+
+def fen_cache_key(fen: str) -> str:
+    """Short, fixed-size hash key for a FEN built from its binary encoding."""
+    return hashlib.blake2b(encode_fen(fen), digest_size=12).hexdigest()
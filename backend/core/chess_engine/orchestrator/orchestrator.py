@@ -1,14 +1,23 @@
 """Engine orchestrator - routes requests and handles failover."""
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import List
 from core.chess_engine.schemas import EngineResult
-from core.chess_engine.fallback import analyze_legal_moves
-from core.chess_engine.spot.models import SpotConfig
+from core.chess_engine.fallback import (
+    analyze_legal_moves,
+    build_legal_moves_result,
+    log_fallback_used,
+)
+from core.chess_engine.spot.models import SpotConfig, SpotStatus
 from core.chess_engine.orchestrator.pool import EngineSpotPool
 from core.log.log_chess_engine import logger
 from core.errors import ChessEngineError, ChessEngineTimeoutError
 from core.config import settings
 
 
+# Shared workers for speculative legal-move fallbacks
+_FALLBACK_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="engine-fallback")
+
+
 class EngineOrchestrator:
     """
     Orchestrates requests across multiple engine spots.
@@ -18,6 +27,7 @@ class EngineOrchestrator:
     # Optimized defaults for batch processing (100+ nodes in < 5s target)
     DEFAULT_TIMEOUT = 10  # Reduced from 30s for faster fail-over
     DEFAULT_MAX_RETRIES = 1  # Reduced from 2 for faster throughput
+    FALLBACK_DEADLINE_S = 2.0  # Max wait for a speculative fallback before computing it inline
 
     def __init__(self, spot_configs: List[SpotConfig] = None, timeout: int = None, max_retries: int = None):
         """
@@ -63,20 +73,35 @@ class EngineOrchestrator:
             logger.error("No usable spots available")
             raise ChessEngineError("No engine spots available")
 
+        # The fallback is only computed speculatively once a failure looks
+        # likely (no HEALTHY spot, or a spot already failed), so successful
+        # requests don't pay for move generation.
+        fallback_enabled = settings.ENGINE_FALLBACK_MODE != "off"
+        fallback_future = None
+        if fallback_enabled and not any(
+            spot.metrics.status == SpotStatus.HEALTHY for spot in usable_spots
+        ):
+            fallback_future = _FALLBACK_EXECUTOR.submit(build_legal_moves_result, fen, multipv)
+
         # Try spots in order until one succeeds
         attempts = 0
         max_attempts = min(len(usable_spots), self.max_retries + 1)
         errors = []
 
         for spot in usable_spots[:max_attempts]:
+            if errors and fallback_enabled and fallback_future is None:
+                fallback_future = _FALLBACK_EXECUTOR.submit(build_legal_moves_result, fen, multipv)
             attempts += 1
             try:
-                logger.info(
-                    f"[Attempt {attempts}/{max_attempts}] Routing to spot: {spot.config.id}"
+                logger.debug(
+                    "[Attempt %d/%d] Routing to spot: %s",
+                    attempts, max_attempts, spot.config.id,
                 )
                 result = spot.analyze(fen, depth=depth, multipv=multipv)
                 self.last_spot_id = spot.config.id
-                logger.info(f"Request succeeded: {spot.config.id}")
+                logger.debug("Request succeeded: %s", spot.config.id)
+                if fallback_future is not None:
+                    fallback_future.cancel()
                 return result
 
             except ChessEngineTimeoutError as e:
@@ -106,8 +131,22 @@ class EngineOrchestrator:
         # All spots failed
         error_summary = "; ".join(errors)
         logger.error(f"All spots failed after {attempts} attempts: {error_summary}")
-        if settings.ENGINE_FALLBACK_MODE != "off":
+        if fallback_enabled:
             self.last_spot_id = "fallback"
+            if fallback_future is not None:
+                try:
+                    fallback = fallback_future.result(timeout=self.FALLBACK_DEADLINE_S)
+                except FutureTimeoutError:
+                    # Fallback queue is backed up: never turn an outage into errors
+                    fallback_future.cancel()
+                    logger.warning(
+                        "Speculative fallback exceeded %.1fs, computing inline",
+                        self.FALLBACK_DEADLINE_S,
+                    )
+                else:
+                    if fallback.lines:
+                        log_fallback_used(depth, multipv)
+                    return fallback
             return analyze_legal_moves(fen, depth, multipv)
         raise ChessEngineError(
             f"All engine spots failed ({attempts} attempts): {error_summary}"
@@ -1,4 +1,5 @@
 """Engine spot pool management."""
+import threading
 from typing import Dict, List, Tuple, Optional
 from core.chess_engine.spot.spot import EngineSpot
 from core.chess_engine.spot.models import SpotConfig, SpotMetrics
@@ -20,6 +21,11 @@ class EngineSpotPool:
         self.spots: Dict[str, EngineSpot] = {}
         self.selector = SpotSelector()
         self.health_monitor = None  # Will be set when health monitor is added
+        # Sorted usable spots, reused until membership/config/status tiers change
+        self._usable_cache: Optional[List[EngineSpot]] = None
+        self._usable_signature: Optional[tuple] = None
+        self._cache_version: int = 0
+        self._cache_lock = threading.RLock()
         logger.info(f"EngineSpotPool initialized with timeout={timeout}s")
 
     def register_spot(self, config: SpotConfig) -> EngineSpot:
@@ -37,6 +43,7 @@ class EngineSpotPool:
 
         spot = EngineSpot(config, timeout=self.timeout)
         self.spots[config.id] = spot
+        self._invalidate_usable_cache()
         logger.info(f"Registered spot: {config.id} ({config.url})")
         return spot
 
@@ -93,9 +100,39 @@ class EngineSpotPool:
         Returns:
             List of EngineSpots in priority order for failover
         """
-        all_spots = self.get_all_spots()
-        usable_configs = self.selector.select_all_usable(all_spots)
-        return [self.spots[config.id] for config in usable_configs]
+        signature = self._usable_cache_signature()
+        with self._cache_lock:
+            if self._usable_cache is not None and self._usable_signature == signature:
+                return list(self._usable_cache)
+
+            all_spots = self.get_all_spots()
+            usable_configs = self.selector.select_all_usable(all_spots)
+            self._usable_cache = [self.spots[config.id] for config in usable_configs]
+            self._usable_signature = signature
+            return list(self._usable_cache)
+
+    def _usable_cache_signature(self) -> tuple:
+        """
+        Cheap fingerprint of everything that changes spot eligibility or tier.
+
+        Covers direct mutation of ``config.enabled``/``priority`` and
+        ``metrics.status`` as well as explicit invalidations. Latency and
+        success-rate ordering within a tier is refreshed only when the
+        signature changes.
+        """
+        return (
+            self._cache_version,
+            tuple(
+                (spot_id, spot.config.enabled, spot.config.priority, spot.metrics.status)
+                for spot_id, spot in self.spots.items()
+            ),
+        )
+
+    def _invalidate_usable_cache(self):
+        """Force the next get_usable_spots() call to re-sort."""
+        with self._cache_lock:
+            self._cache_version += 1
+            self._usable_cache = None
 
     def enable_spot(self, spot_id: str) -> bool:
         """
@@ -110,6 +147,7 @@ class EngineSpotPool:
         spot = self.get_spot(spot_id)
         if spot:
             spot.config.enabled = True
+            self._invalidate_usable_cache()
             logger.info(f"Enabled spot: {spot_id}")
             return True
         logger.warning(f"Cannot enable spot: {spot_id} not found")
@@ -128,6 +166,7 @@ class EngineSpotPool:
         spot = self.get_spot(spot_id)
         if spot:
             spot.config.enabled = False
+            self._invalidate_usable_cache()
             logger.info(f"Disabled spot: {spot_id}")
             return True
         logger.warning(f"Cannot disable spot: {spot_id} not found")
@@ -1,6 +1,8 @@
 """Data models for multi-spot engine architecture."""
+import time
+from dataclasses import dataclass, asdict
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timezone
 from pydantic import BaseModel, Field
 
 
@@ -21,12 +23,18 @@ class SpotConfig(BaseModel):
     enabled: bool = Field(default=True, description="Manual enable/disable")
 
 
-class SpotMetrics(BaseModel):
-    """Runtime metrics for a spot."""
+@dataclass(slots=True)
+class SpotMetrics:
+    """
+    Runtime metrics for a spot.
+
+    Mutated on every request, so this is a slotted dataclass rather than a
+    pydantic model; use to_dict() at serialization boundaries.
+    """
     status: SpotStatus = SpotStatus.UNKNOWN
     avg_latency_ms: float = 0.0
     success_rate: float = 1.0  # 0.0 to 1.0
-    last_healthy_at: datetime | None = None
+    last_healthy_at: float | None = None  # Unix seconds
     failure_count: int = 0
     total_requests: int = 0
 
@@ -42,9 +50,22 @@ class SpotMetrics(BaseModel):
                 / self.total_requests
             )
         self.success_rate = (self.total_requests - self.failure_count) / self.total_requests
-        self.last_healthy_at = datetime.utcnow()
+        self.last_healthy_at = time.time()
         self.status = SpotStatus.HEALTHY
 
+    @property
+    def last_healthy_datetime(self) -> datetime | None:
+        """Timestamp of the last success as an aware UTC datetime."""
+        if self.last_healthy_at is None:
+            return None
+        return datetime.fromtimestamp(self.last_healthy_at, tz=timezone.utc)
+
+    def to_dict(self) -> dict:
+        """JSON-friendly snapshot of the metrics."""
+        data = asdict(self)
+        data["status"] = self.status.value
+        return data
+
     def update_failure(self):
         """Record failed request."""
         self.total_requests += 1
@@ -7,6 +7,10 @@ from core.chess_engine.spot.models import SpotConfig, SpotMetrics, SpotStatus
 from core.log.log_chess_engine import logger
 from core.errors import ChessEngineError, ChessEngineTimeoutError
 
+SSE_DATA_PREFIX = b"data: "
+SSE_DATA_PREFIX_LEN = len(SSE_DATA_PREFIX)
+UCI_INFO_PREFIX = b"info "
+
 
 class EngineSpot:
     """Client for a single engine spot."""
@@ -26,8 +30,9 @@ class EngineSpot:
         Records metrics on success/failure.
         """
         start_time = time.time()
-        logger.info(
-            f"[{self.config.id}] Analyzing: fen={fen[:50]}..., depth={depth}, multipv={multipv}"
+        logger.debug(
+            "[%s] Analyzing fen=%.50s depth=%d multipv=%d",
+            self.config.id, fen, depth, multipv,
         )
 
         try:
@@ -55,21 +60,18 @@ class EngineSpot:
                 # Collect streaming response (SSE format)
                 multipv_data = {}  # {multipv_num: {score, pv}}
 
-                for line in resp.iter_lines():
-                    if not line:
-                        continue
-
-                    decoded_line = line.decode('utf-8') if isinstance(line, bytes) else line
-
+                # Prefix checks run on raw bytes; only UCI info payloads are decoded
+                for line in resp.iter_lines(decode_unicode=False):
                     # SSE format: lines start with "data: "
-                    if decoded_line.startswith('data: '):
-                        content = decoded_line[6:]  # Remove "data: " prefix
+                    if not line.startswith(SSE_DATA_PREFIX):
+                        continue
+                    if not line.startswith(UCI_INFO_PREFIX, SSE_DATA_PREFIX_LEN):
+                        continue
 
-                        # Parse UCI info lines
-                        if content.startswith('info '):
-                            parsed = self._parse_uci_info(content, turn)
-                            if parsed:
-                                multipv_data[parsed["multipv"]] = parsed
+                    content = line[SSE_DATA_PREFIX_LEN:].decode('utf-8')
+                    parsed = self._parse_uci_info(content, turn)
+                    if parsed:
+                        multipv_data[parsed["multipv"]] = parsed
 
             # Build result from collected multipv data
             if multipv_data:
@@ -82,8 +84,9 @@ class EngineSpot:
                 # On success: update metrics
                 latency_ms = (time.time() - start_time) * 1000
                 self.metrics.update_success(latency_ms)
-                logger.info(
-                    f"[{self.config.id}] Analysis succeeded ({latency_ms:.1f}ms, {len(lines)} lines)"
+                logger.debug(
+                    "[%s] Analysis succeeded (%.1fms, %d lines)",
+                    self.config.id, latency_ms, len(lines),
                 )
                 return result
             else:
@@ -28,6 +28,9 @@ class Settings(BaseSettings):
     
     # Lichess Cloud Eval
     LICHESS_CLOUD_EVAL_URL: str = "https://lichess.org/api/cloud-eval"
+    # Optional shared cloud-eval cache (RedisJSON), e.g. redis://localhost:6379/0
+    ENGINE_CACHE_URL: str = ""
+    ENGINE_CACHE_TTL: int = 86400
 
     # ===== multi-spot engine =====
     ENABLE_MULTI_SPOT: bool = False
@@ -46,6 +49,8 @@ class Settings(BaseSettings):
     DATABASE_URL: str = ""
     # Tagger-specific database (separate from workspace DB)
     TAGGER_DATABASE_URL: str = ""
+    # Optional SQLite file caching fen-index tags across chapters and restarts
+    TAGGER_TAG_CACHE_PATH: str = ""
 
     # ===== security =====
     # SECURITY FIX: JWT_SECRET_KEY must be set via environment variable
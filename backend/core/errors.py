@@ -19,7 +19,19 @@ class AppError(Exception):
     """
     Base exception for all application errors.
     All custom exceptions should inherit from this.
+
+    Subclasses declare ``__slots__ = ()`` so instances don't allocate a
+    per-instance ``__dict__`` for ``message``/``details``.
     """
+    __slots__ = ("message", "details")
+
+    # Class name used in API error responses, set per subclass
+    _class_name = "AppError"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._class_name = cls.__name__
+
     def __init__(self, message: str, details: dict | None = None):
         self.message = message
         self.details = details or {}
@@ -28,32 +40,32 @@ class AppError(Exception):
 
 class NotFoundError(AppError):
     """Resource not found (maps to 404)"""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(AppError):
     """Invalid input data (maps to 400)"""
-    pass
+    __slots__ = ()
 
 
 class ConflictError(AppError):
     """Resource conflict, e.g., duplicate entry (maps to 409)"""
-    pass
+    __slots__ = ()
 
 
 class UnauthorizedError(AppError):
     """Authentication failed (maps to 401)"""
-    pass
+    __slots__ = ()
 
 
 class ForbiddenError(AppError):
     """Permission denied (maps to 403)"""
-    pass
+    __slots__ = ()
 
 
 class ExternalServiceError(AppError):
     """External service unavailable (maps to 503)"""
-    pass
+    __slots__ = ()
 
 
 # ============================================================================
@@ -62,6 +74,8 @@ class ExternalServiceError(AppError):
 
 class UserNotFoundError(NotFoundError):
     """User does not exist"""
+    __slots__ = ()
+
     def __init__(self, identifier: str):
         super().__init__(
             message=f"User not found: {identifier}",
@@ -71,6 +85,8 @@ class UserNotFoundError(NotFoundError):
 
 class UserAlreadyExistsError(ConflictError):
     """User with identifier already exists"""
+    __slots__ = ()
+
     def __init__(self, identifier: str):
         super().__init__(
             message=f"User already exists: {identifier}",
@@ -80,12 +96,16 @@ class UserAlreadyExistsError(ConflictError):
 
 class InvalidCredentialsError(UnauthorizedError):
     """Invalid username/password"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(message="Invalid credentials")
 
 
 class UserInactiveError(ForbiddenError):
     """User account is disabled"""
+    __slots__ = ()
+
     def __init__(self, identifier: str):
         super().__init__(
             message=f"User account is inactive: {identifier}",
@@ -95,12 +115,16 @@ class UserInactiveError(ForbiddenError):
 
 class InvalidTokenError(UnauthorizedError):
     """JWT token is invalid or expired"""
+    __slots__ = ()
+
     def __init__(self, reason: str = "Invalid or expired token"):
         super().__init__(message=reason)
 
 
 class TokenExpiredError(UnauthorizedError):
     """JWT token has expired"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(message="Token has expired")
 
@@ -111,6 +135,8 @@ class TokenExpiredError(UnauthorizedError):
 
 class InsufficientPermissionsError(ForbiddenError):
     """User lacks required permissions"""
+    __slots__ = ()
+
     def __init__(self, required_role: str, user_role: str):
         super().__init__(
             message=f"Insufficient permissions: requires {required_role}, user has {user_role}",
@@ -120,12 +146,16 @@ class InsufficientPermissionsError(ForbiddenError):
 
 class TeacherAccessRequiredError(ForbiddenError):
     """Endpoint requires teacher role"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(message="Teacher access required")
 
 
 class StudentAccessRequiredError(ForbiddenError):
     """Endpoint requires student role"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(message="Student access required")
 
@@ -136,6 +166,8 @@ class StudentAccessRequiredError(ForbiddenError):
 
 class ChessEngineError(ExternalServiceError):
     """Chess engine service error"""
+    __slots__ = ()
+
     def __init__(self, message: str, details: dict | None = None):
         super().__init__(
             message=f"Chess engine error: {message}",
@@ -145,6 +177,8 @@ class ChessEngineError(ExternalServiceError):
 
 class ChessEngineTimeoutError(ChessEngineError):
     """Chess engine request timeout"""
+    __slots__ = ()
+
     def __init__(self, timeout: int):
         super().__init__(
             message=f"Chess engine timeout after {timeout}s",
@@ -154,6 +188,8 @@ class ChessEngineTimeoutError(ChessEngineError):
 
 class InvalidFENError(ValidationError):
     """Invalid FEN string"""
+    __slots__ = ()
+
     def __init__(self, fen: str):
         super().__init__(
             message=f"Invalid FEN notation: {fen}",
@@ -167,11 +203,13 @@ class InvalidFENError(ValidationError):
 
 class DatabaseError(AppError):
     """Database operation error"""
-    pass
+    __slots__ = ()
 
 
 class DatabaseConnectionError(DatabaseError):
     """Cannot connect to database"""
+    __slots__ = ()
+
     def __init__(self, reason: str):
         super().__init__(
             message=f"Database connection failed: {reason}",
@@ -181,6 +219,8 @@ class DatabaseConnectionError(DatabaseError):
 
 class DatabaseIntegrityError(ConflictError):
     """Database constraint violation"""
+    __slots__ = ()
+
     def __init__(self, constraint: str):
         super().__init__(
             message=f"Database integrity error: {constraint}",
@@ -194,6 +234,8 @@ class DatabaseIntegrityError(ConflictError):
 
 class InvalidEmailError(ValidationError):
     """Invalid email format"""
+    __slots__ = ()
+
     def __init__(self, email: str):
         super().__init__(
             message=f"Invalid email format: {email}",
@@ -203,6 +245,8 @@ class InvalidEmailError(ValidationError):
 
 class InvalidPhoneError(ValidationError):
     """Invalid phone number format"""
+    __slots__ = ()
+
     def __init__(self, phone: str):
         super().__init__(
             message=f"Invalid phone number: {phone}",
@@ -212,6 +256,8 @@ class InvalidPhoneError(ValidationError):
 
 class WeakPasswordError(ValidationError):
     """Password does not meet requirements"""
+    __slots__ = ()
+
     def __init__(self, requirements: list[str]):
         super().__init__(
             message="Password does not meet security requirements",
@@ -221,6 +267,8 @@ class WeakPasswordError(ValidationError):
 
 class InvalidRoleError(ValidationError):
     """Invalid user role"""
+    __slots__ = ()
+
     def __init__(self, role: str, valid_roles: list[str]):
         super().__init__(
             message=f"Invalid role: {role}",
@@ -234,6 +282,8 @@ class InvalidRoleError(ValidationError):
 
 class AssignmentNotFoundError(NotFoundError):
     """Assignment does not exist"""
+    __slots__ = ()
+
     def __init__(self, assignment_id: str):
         super().__init__(
             message=f"Assignment not found: {assignment_id}",
@@ -243,6 +293,8 @@ class AssignmentNotFoundError(NotFoundError):
 
 class CourseNotFoundError(NotFoundError):
     """Course does not exist"""
+    __slots__ = ()
+
     def __init__(self, course_id: str):
         super().__init__(
             message=f"Course not found: {course_id}",
@@ -252,6 +304,8 @@ class CourseNotFoundError(NotFoundError):
 
 class NotCourseOwnerError(ForbiddenError):
     """User is not the course owner"""
+    __slots__ = ()
+
     def __init__(self, course_id: str):
         super().__init__(
             message=f"Not authorized to modify course: {course_id}",
@@ -261,6 +315,8 @@ class NotCourseOwnerError(ForbiddenError):
 
 class NotEnrolledError(ForbiddenError):
     """Student not enrolled in course"""
+    __slots__ = ()
+
     def __init__(self, course_id: str):
         super().__init__(
             message=f"Not enrolled in course: {course_id}",
@@ -280,12 +336,26 @@ def get_error_response(error: AppError) -> dict:
         dict with 'error', 'message', and optional 'details'
     """
     return {
-        "error": error.__class__.__name__,
+        "error": error._class_name,
         "message": error.message,
-        "details": error.details if error.details else None
+        "details": error.details or None
     }
 
 
+# Base error class -> HTTP status code
+_STATUS_BY_BASE: dict[type, int] = {
+    NotFoundError: 404,
+    ValidationError: 400,
+    ConflictError: 409,
+    UnauthorizedError: 401,
+    ForbiddenError: 403,
+    ExternalServiceError: 503,
+}
+
+# Resolved status per concrete error class, filled lazily
+_STATUS_CACHE: dict[type, int] = {}
+
+
 def get_http_status_code(error: AppError) -> int:
     """
     Map AppError to HTTP status code.
@@ -293,17 +363,13 @@ def get_http_status_code(error: AppError) -> int:
     Returns:
         HTTP status code (400, 401, 403, 404, 409, 503)
     """
-    if isinstance(error, NotFoundError):
-        return 404
-    elif isinstance(error, ValidationError):
-        return 400
-    elif isinstance(error, ConflictError):
-        return 409
-    elif isinstance(error, UnauthorizedError):
-        return 401
-    elif isinstance(error, ForbiddenError):
-        return 403
-    elif isinstance(error, ExternalServiceError):
-        return 503
-    else:
-        return 500  # Internal server error for unknown errors
+    cls = type(error)
+    code = _STATUS_CACHE.get(cls)
+    if code is None:
+        code = 500  # Internal server error for unknown errors
+        for base in cls.__mro__:
+            if base in _STATUS_BY_BASE:
+                code = _STATUS_BY_BASE[base]
+                break
+        _STATUS_CACHE[cls] = code
+    return code
@@ -2,21 +2,89 @@
 Logging Module - Centralized logging configuration
 
 This module provides a unified logging setup with separate loggers for each module.
-Logs are written to both console and rotating log files.
+Logs are written to both console and rotating log files. Emitting threads only
+enqueue records; a single background QueueListener does the formatting and I/O.
 
 Usage:
     from core.log.log_chess_engine import logger
     logger.info("Chess engine started")
 """
+import atexit
 import logging
+import os
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
-# Create logs directory
-LOGS_DIR = Path(__file__).parent.parent.parent.parent / "logs"
-LOGS_DIR.mkdir(exist_ok=True)
+# Our format only uses asctime/name/levelname/message, so skip the LogRecord
+# fields nobody reads. _srcfile = None disables the findCaller() stack walk
+# (pathname/filename/lineno/funcName), the most expensive part of a record.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
+
+# Logs directory (plain string; created on first setup_logger call)
+LOGS_DIR = str((Path(__file__).parent.parent.parent.parent / "logs").resolve())
+_logs_dir_ready = False
+
+# Shared by every handler; all loggers use the same format
+_DEFAULT_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s | %(name)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+
+class _RoutedQueueHandler(QueueHandler):
+    """QueueHandler that tags records with the logger that enqueued them."""
+
+    def __init__(self, log_queue, route: str):
+        super().__init__(log_queue)
+        self.route = route
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.log_route = self.route
+        return record
+
+
+class _RouterHandler(logging.Handler):
+    """Runs on the listener thread; forwards records to their logger's handlers."""
+
+    def __init__(self):
+        super().__init__()
+        self.routes: dict[str, list[logging.Handler]] = {}
+
+    def handle(self, record):
+        for handler in self.routes.get(getattr(record, "log_route", record.name), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record):
+        self.handle(record)
+
+
+_LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_ROUTER = _RouterHandler()
+_LISTENER: QueueListener | None = None
+
+
+def _ensure_logs_dir() -> None:
+    global _logs_dir_ready
+    if not _logs_dir_ready:
+        os.makedirs(LOGS_DIR, exist_ok=True)
+        _logs_dir_ready = True
+
+
+def _ensure_listener() -> None:
+    global _LISTENER
+    if _LISTENER is None:
+        _LISTENER = QueueListener(_LOG_QUEUE, _ROUTER)
+        _LISTENER.start()
+        atexit.register(_LISTENER.stop)
 
 
 def setup_logger(
@@ -29,6 +97,10 @@ def setup_logger(
     """
     Create a configured logger with file and console handlers.
 
+    The handlers run on the shared listener thread; the logger itself only
+    gets a QueueHandler. Size-based rollover therefore also happens on the
+    listener thread and never blocks the emitting thread.
+
     Args:
         name: Logger name (e.g., "chess_engine")
         log_file: Log file name (e.g., "chess_engine.log")
@@ -46,14 +118,9 @@ def setup_logger(
     if logger.handlers:
         return logger
 
-    # Formatter
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(name)s | %(levelname)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-
     # File handler with rotation
-    log_path = LOGS_DIR / log_file
+    _ensure_logs_dir()
+    log_path = os.path.join(LOGS_DIR, log_file)
     file_handler = RotatingFileHandler(
         log_path,
         maxBytes=max_bytes,
@@ -61,15 +128,18 @@ def setup_logger(
         encoding="utf-8"
     )
     file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(_DEFAULT_FORMATTER)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_DEFAULT_FORMATTER)
 
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Route through the background listener
+    _ROUTER.routes[name] = [file_handler, console_handler]
+    queue_handler = _RoutedQueueHandler(_LOG_QUEUE, route=name)
+    queue_handler.setLevel(level)
+    logger.addHandler(queue_handler)
+    _ensure_listener()
 
     return logger
@@ -1,9 +1,11 @@
 """
 Public API for PGN detection.
 """
+from collections.abc import Iterator
+
 from .types import PGNGame
 from .normalize import normalize_pgn
-from .detector import split_games
+from .detector import iter_split_games
 
 
 def detect_games(pgn_text: str) -> list[PGNGame]:
@@ -20,5 +22,22 @@ def detect_games(pgn_text: str) -> list[PGNGame]:
         List of PGNGame objects, one per detected game.
         Returns empty list if no valid games (with headers) are found.
     """
+    return list(iter_games(pgn_text))
+
+
+def iter_games(pgn_text: str) -> Iterator[PGNGame]:
+    """
+    Lazily detect individual PGN games in a multi-game PGN string.
+
+    Same as detect_games, but yields games one at a time so callers that
+    process games sequentially (counting, streaming inserts) never hold
+    every PGNGame of a large archive in memory at once.
+
+    Args:
+        pgn_text: Raw PGN string (may contain multiple games).
+
+    Yields:
+        PGNGame objects in source order.
+    """
     normalized = normalize_pgn(pgn_text)
-    return split_games(normalized)
+    yield from iter_split_games(normalized)
@@ -2,26 +2,34 @@
 PGN detector: splits multi-game PGN into individual games.
 """
 import re
+import sys
+from collections.abc import Iterator
 from .types import PGNGame, PGNHeader
 
-HEADER_PATTERN = re.compile(r'^\s*\[(\w+)\s+"([^"]*)"\]\s*$')
+# Tag pair, matched with fullmatch() against the already-stripped line
+HEADER_PATTERN = re.compile(r'\[(\w+)\s+"([^"]*)"\]')
 
 
 def _is_comment(s: str) -> bool:
     return s.startswith(';') or s.startswith('%')
 
 
-def parse_headers(lines: list[str]) -> tuple[PGNHeader, int]:
-    """Parse header lines, skipping blanks and comments. Returns (headers, end_idx)."""
+def parse_headers(lines: list[tuple[str, re.Match | None]]) -> tuple[PGNHeader, int]:
+    """
+    Parse header lines, skipping blanks and comments. Returns (headers, end_idx).
+
+    Each entry is (line, HEADER_PATTERN match or None), as classified by split_games.
+    """
     headers: PGNHeader = {}
     idx = 0
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if not stripped or _is_comment(stripped):
-            continue
-        match = HEADER_PATTERN.match(line)
+    for i, (line, match) in enumerate(lines):
+        if match is None:
+            stripped = line.strip()
+            if not stripped or _is_comment(stripped):
+                continue
         if match:
-            headers[match.group(1)] = match.group(2)
+            # Tag names repeat in every game; intern so header dicts share keys
+            headers[sys.intern(match.group(1))] = match.group(2)
             idx = i + 1
         else:
             break
@@ -30,52 +38,80 @@ def parse_headers(lines: list[str]) -> tuple[PGNHeader, int]:
 
 def split_games(pgn_text: str) -> list[PGNGame]:
     """Split multi-game PGN into PGNGame objects. Empty list if no headers."""
+    return list(iter_split_games(pgn_text))
+
+
+def iter_split_games(pgn_text: str) -> Iterator[PGNGame]:
+    """Yield PGNGame objects one at a time; nothing if no headers."""
     lines = pgn_text.split('\n')
-    games: list[PGNGame] = []
-    current_lines: list[str] = []
+    current_lines: list[tuple[str, re.Match | None]] = []
+    current_start = 0  # offset of current_lines[0] in pgn_text
+    offset = 0
     in_headers = False
     seen_movetext = False
     game_index = 0
 
     for line in lines:
+        line_start = offset
+        offset += len(line) + 1
         stripped = line.strip()
-        is_header = bool(HEADER_PATTERN.match(line))
-        is_skip = not stripped or _is_comment(stripped)
-
-        # New game: header after movetext
-        if is_header and seen_movetext:
-            if current_lines:
-                game = _build_game(current_lines, game_index)
-                if game:
-                    games.append(game)
-            current_lines = []
-            in_headers, seen_movetext = True, False
-            game_index += 1
-
-        # First header starts first game
-        if is_header and not in_headers and not seen_movetext:
-            in_headers = True
-            game_index += 1
-
-        # Transition from headers to movetext
-        if in_headers and not is_header and not is_skip:
+        # Only lines wrapped in '[...]' can be tag pairs; skip the regex otherwise
+        if stripped[:1] == '[' and stripped[-1] == ']':
+            match = HEADER_PATTERN.fullmatch(stripped)
+        else:
+            match = None
+
+        if match is not None:
+            if seen_movetext:
+                # New game: header after movetext
+                if current_lines:
+                    game = _build_game(
+                        current_lines, game_index, pgn_text, current_start, line_start - 1
+                    )
+                    if game:
+                        yield game
+                current_lines = []
+                current_start = line_start
+                in_headers, seen_movetext = True, False
+                game_index += 1
+            elif not in_headers:
+                # First header starts first game
+                in_headers = True
+                game_index += 1
+        elif in_headers and stripped and not _is_comment(stripped):
+            # Transition from headers to movetext
             in_headers, seen_movetext = False, True
 
-        current_lines.append(line)
+        current_lines.append((line, match))
 
     # Finalize last game
     if current_lines:
-        game = _build_game(current_lines, game_index)
+        game = _build_game(current_lines, game_index, pgn_text, current_start, len(pgn_text))
         if game:
-            games.append(game)
-    return games
+            yield game
+
 
+def _build_game(
+    lines: list[tuple[str, re.Match | None]],
+    index: int,
+    source: str,
+    start: int,
+    end: int,
+) -> PGNGame | None:
+    """
+    Build a PGNGame from accumulated (line, match) pairs.
 
-def _build_game(lines: list[str], index: int) -> PGNGame | None:
-    """Build a PGNGame from accumulated lines."""
-    raw = '\n'.join(lines)
+    ``source[start:end]`` is the text of ``lines``; the game keeps offsets
+    into ``source`` instead of copies of its raw block and movetext.
+    """
     headers, movetext_start = parse_headers(lines)
     if not headers:
         return None
-    movetext = '\n'.join(lines[movetext_start:]).strip()
-    return PGNGame(headers=headers, movetext=movetext, raw=raw.strip(), index=index)
+    movetext_offset = start + sum(len(line) + 1 for line, _ in lines[:movetext_start])
+    return PGNGame(
+        header_items=tuple(item for pair in headers.items() for item in pair),
+        index=index,
+        source=source,
+        span=(start, end),
+        movetext_start=movetext_offset,
+    )
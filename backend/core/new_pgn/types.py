@@ -1,25 +1,61 @@
 """
 PGN data types for the new pipeline.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 # Type alias for PGN headers (tag pairs)
 PGNHeader = dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PGNGame:
     """
     Represents a single PGN game extracted from a multi-game PGN string.
 
     Attributes:
-        headers: Dictionary of PGN tag pairs (e.g., {"Event": "...", "White": "..."})
-        movetext: The SAN move sequence including variations and comments.
-        raw: The original raw text for this game block.
+        header_items: Tag pairs flattened as (name0, value0, name1, value1, ...).
         index: 1-based index of this game in the source PGN.
+        source: The (normalized) PGN text this game was detected in, shared
+            by every game from the same input.
+        span: (start, end) offsets of this game's block within ``source``.
+        movetext_start: Offset within ``source`` where the movetext begins.
+
+    ``raw`` and ``movetext`` are sliced out of ``source`` on access, so the
+    detected games of an archive share one copy of the text instead of each
+    holding their own. Bind them to a local if you need them repeatedly.
+
+    Tag pairs are kept as a flat tuple (roughly half the size of a dict for
+    the usual 7-10 tags); ``headers`` builds a dict view on access and
+    ``get_header`` looks up a single tag without building one.
     """
-    headers: PGNHeader
-    movetext: str
-    raw: str
+    header_items: tuple[str, ...]
     index: int
+    source: str = field(default="", repr=False)
+    span: tuple[int, int] = (0, 0)
+    movetext_start: int = 0
+
+    @property
+    def headers(self) -> PGNHeader:
+        """Dictionary of PGN tag pairs (e.g., {"Event": "...", "White": "..."})."""
+        items = self.header_items
+        return dict(zip(items[::2], items[1::2]))
+
+    def get_header(self, key: str, default: str | None = None) -> str | None:
+        """Return a single tag value, or ``default`` if the tag is absent."""
+        items = self.header_items
+        for i in range(0, len(items), 2):
+            if items[i] == key:
+                return items[i + 1]
+        return default
+
+    @property
+    def raw(self) -> str:
+        """The original raw text for this game block."""
+        start, end = self.span
+        return self.source[start:end].strip()
+
+    @property
+    def movetext(self) -> str:
+        """The SAN move sequence including variations and comments."""
+        return self.source[self.movetext_start:self.span[1]].strip()
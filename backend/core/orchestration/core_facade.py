@@ -78,9 +78,10 @@ class CoreFacade:
         Raises:
             ValueError: If session not found
         """
-        if session_id not in self._active_sessions:
+        session = self._active_sessions.get(session_id)
+        if session is None:
             raise ValueError(f"Session {session_id} not found")
-        return self._active_sessions[session_id]
+        return session
 
     def close_session(self, session_id: str) -> None:
         """
@@ -90,8 +91,7 @@ class CoreFacade:
         Args:
             session_id: Session identifier
         """
-        if session_id in self._active_sessions:
-            del self._active_sessions[session_id]
+        self._active_sessions.pop(session_id, None)
 
     def submit_move_uci(self, session_id: str, uci: str) -> bool:
         """
@@ -7,7 +7,7 @@ Single game/study session controller.
 
 from typing import Optional
 from ..chess_basic.types import BoardState, Move
-from ..chess_basic.constants import GameResult, TerminationReason
+from ..chess_basic.constants import GameResult, PieceType, STARTING_FEN, TerminationReason
 from ..chess_basic.rule.api import (
     is_legal_move,
     apply_move,
@@ -26,6 +26,25 @@ from ..chess_basic.errors import IllegalMoveError
 from .policies import GamePolicy, StandardGamePolicy
 
 
+# 棋盘状态对象池（悔棋/重置时回收）BoardState freelist, refilled on takeback/reset
+_BOARDSTATE_POOL: list[BoardState] = []
+_BOARDSTATE_POOL_MAX = 256
+
+
+def _acquire_state() -> BoardState:
+    """从对象池取出棋盘状态 Take a BoardState from the pool (or allocate one)"""
+    try:
+        return _BOARDSTATE_POOL.pop()
+    except IndexError:
+        return BoardState()
+
+
+def _release_state(state: BoardState) -> None:
+    """归还棋盘状态到对象池 Return a BoardState to the pool"""
+    if len(_BOARDSTATE_POOL) < _BOARDSTATE_POOL_MAX:
+        _BOARDSTATE_POOL.append(state)
+
+
 class CoreSession:
     """
     核心会话控制器
@@ -55,16 +74,18 @@ class CoreSession:
         self.policy = policy or StandardGamePolicy()
 
         # 初始化棋盘状态 Initialize board state
+        # 直接保存调用方给出的 FEN，避免再序列化一次
+        # Keep the caller's FEN as-is instead of re-serializing the parsed board
         if starting_fen:
             self.state = parse_fen(starting_fen)
+            self._starting_fen = starting_fen
         else:
             self.state = get_starting_position()
-
-        self._starting_fen = board_to_fen(self.state)
+            self._starting_fen = STARTING_FEN
 
         # 初始化 PGN 写入器 Initialize PGN writer
-        if self.policy.records_pgn():
-            if self.policy.allows_variations():
+        if self.policy.records_pgn:
+            if self.policy.allows_variations:
                 self._pgn_writer: Optional[PGNWriterBase] = PGNWriterVari()
             else:
                 self._pgn_writer: Optional[PGNWriterBase] = PGNWriterNoVari()
@@ -77,7 +98,13 @@ class CoreSession:
         self._termination_reason: Optional[TerminationReason] = None
 
         # 走法历史（用于悔棋）Move history (for takebacks)
-        self._move_history: list[tuple[Move, BoardState]] = []
+        # Parallel lists: _history_states[i] is the position before _history_moves[i]
+        self._history_moves: list[Move] = []
+        self._history_states: list[BoardState] = []
+
+        # 当前局面合法走法缓存 Legal moves of the current position (list, set)
+        # Invalidated whenever self.state is replaced.
+        self._legal_cache: Optional[tuple[list[Move], frozenset[Move]]] = None
 
     def submit_move(self, move: Move) -> bool:
         """
@@ -98,33 +125,47 @@ class CoreSession:
         Raises:
             IllegalMoveError: If move is illegal
         """
-        if self._is_game_over and self.policy.auto_ends_on_checkmate():
+        if self._is_game_over and self.policy.auto_ends_on_checkmate:
             raise IllegalMoveError("Game is over")
 
         # 步骤 1：规则验证 Step 1: Rule validation
-        if not is_legal_move(self.state, move):
+        legal_cache = self._legal_cache
+        if legal_cache is not None:
+            is_legal = move in legal_cache[1]
+        else:
+            is_legal = is_legal_move(self.state, move)
+        if not is_legal:
             raise IllegalMoveError(f"Move {move.to_uci()} is not legal in current position")
 
         # 保存当前状态（用于悔棋和 PGN）Save current state (for takeback and PGN)
-        state_before = self.state.copy()
+        state_before = self.state.copy_into(_acquire_state())
 
         # 步骤 2：规则应用 Step 2: Rule application
         self.state = apply_move(self.state, move)
+        self._legal_cache = None
 
         # 步骤 3：PGN 记录 Step 3: PGN recording
         if self._pgn_writer:
-            san = self._compute_san(move, state_before)
+            san = self._compute_san(
+                move, state_before, legal_cache[0] if legal_cache is not None else None
+            )
             self._pgn_writer.add_move(move, state_before, san)
 
         # 保存到历史 Save to history
-        self._move_history.append((move, state_before))
+        self._history_moves.append(move)
+        self._history_states.append(state_before)
 
         # 检查对局是否结束 Check if game is over
         self._check_game_over()
 
         return True
 
-    def _compute_san(self, move: Move, state_before: BoardState) -> str:
+    def _compute_san(
+        self,
+        move: Move,
+        state_before: BoardState,
+        legal_moves: Optional[list[Move]] = None,
+    ) -> str:
         """
         计算走法的 SAN 表示
         Compute SAN notation for move
@@ -132,6 +173,7 @@ class CoreSession:
         Args:
             move: Move object
             state_before: Board state before the move
+            legal_moves: Legal moves in state_before, if already known
 
         Returns:
             SAN string
@@ -144,10 +186,17 @@ class CoreSession:
         is_capture = state_before.get_piece(move.to_square) is not None
 
         # 计算消歧义 Compute disambiguation
-        legal_moves = generate_legal_moves(state_before)
+        # Only pay for move generation when another same-type, same-color
+        # piece exists; pawns never need piece disambiguation.
         piece = state_before.get_piece(move.from_square)
         disambiguation = None
-        if piece:
+        if (
+            piece
+            and piece.piece_type != PieceType.PAWN
+            and state_before.board.count(piece) > 1
+        ):
+            if legal_moves is None:
+                legal_moves = generate_legal_moves(state_before)
             disambiguation = needs_disambiguation(
                 piece, move.from_square, move.to_square, state_before, legal_moves
             )
@@ -187,7 +236,10 @@ class CoreSession:
 
     def get_legal_moves(self) -> list[Move]:
         """获取当前所有合法走法 Get all legal moves"""
-        return generate_legal_moves(self.state)
+        if self._legal_cache is None:
+            moves = generate_legal_moves(self.state)
+            self._legal_cache = (moves, frozenset(moves))
+        return list(self._legal_cache[0])
 
     def get_pgn(self) -> Optional[str]:
         """
@@ -213,15 +265,17 @@ class CoreSession:
         Returns:
             True if takeback successful, False if no moves to take back
         """
-        if not self.policy.allows_takebacks():
+        if not self.policy.allows_takebacks:
             return False
 
-        if not self._move_history:
+        if not self._history_moves:
             return False
 
         # 恢复到上一个状态 Restore to previous state
-        _, previous_state = self._move_history.pop()
-        self.state = previous_state
+        self._history_moves.pop()
+        _release_state(self.state)
+        self.state = self._history_states.pop()
+        self._legal_cache = None
 
         # 重置对局结束标志 Reset game over flag
         self._is_game_over = False
@@ -256,10 +310,14 @@ class CoreSession:
         else:
             self.state = parse_fen(self._starting_fen)
 
+        self._legal_cache = None
         self._is_game_over = False
         self._game_result = None
         self._termination_reason = None
-        self._move_history.clear()
+        self._history_moves.clear()
+        for state in self._history_states:
+            _release_state(state)
+        self._history_states.clear()
 
         if self._pgn_writer:
             self._pgn_writer.reset()
@@ -5,9 +5,8 @@ orchestration.policies
 Game mode policies (standard game, analysis, etc.).
 """
 
+from dataclasses import dataclass
 from enum import Enum
-from abc import ABC, abstractmethod
-from typing import Optional
 
 
 class SessionMode(Enum):
@@ -23,80 +22,35 @@ class SessionMode(Enum):
     STUDY = "study"                  # 研究 Study
 
 
-class GamePolicy(ABC):
+@dataclass(frozen=True, slots=True)
+class GamePolicy:
     """
-    对局策略基类
-    Base class for game policies
-
-    Defines rules and constraints for different game modes.
+    对局策略
+    Game policy
+
+    Defines rules and constraints for different game modes. Policies are
+    immutable value objects: checks are plain attribute reads rather than
+    method calls. Build custom policies directly, e.g.
+    ``GamePolicy(True, True, False, False, True, "Custom")``, or derive one
+    with ``dataclasses.replace``.
+
+    Attributes:
+        allows_variations: 是否允许分支 Whether variations are allowed
+        allows_takebacks: 是否允许悔棋 Whether takebacks are allowed
+        enforces_time_control: 是否强制时间控制 Whether time control is enforced
+        auto_ends_on_checkmate: 是否将死后自动结束 Whether game auto-ends on checkmate
+        records_pgn: 是否记录 PGN Whether to record PGN
+        description: 策略描述 Human-readable description
     """
-
-    @abstractmethod
-    def allows_variations(self) -> bool:
-        """
-        是否允许分支
-        Whether variations are allowed
-
-        Returns:
-            True if variations allowed, False otherwise
-        """
-        pass
-
-    @abstractmethod
-    def allows_takebacks(self) -> bool:
-        """
-        是否允许悔棋
-        Whether takebacks are allowed
-
-        Returns:
-            True if takebacks allowed, False otherwise
-        """
-        pass
-
-    @abstractmethod
-    def enforces_time_control(self) -> bool:
-        """
-        是否强制时间控制
-        Whether time control is enforced
-
-        Returns:
-            True if time control enforced, False otherwise
-        """
-        pass
-
-    @abstractmethod
-    def auto_ends_on_checkmate(self) -> bool:
-        """
-        是否将死后自动结束
-        Whether game auto-ends on checkmate
-
-        Returns:
-            True if auto-ends, False otherwise
-        """
-        pass
-
-    @abstractmethod
-    def records_pgn(self) -> bool:
-        """
-        是否记录 PGN
-        Whether to record PGN
-
-        Returns:
-            True if PGN should be recorded, False otherwise
-        """
-        pass
-
-    def get_description(self) -> str:
-        """
-        获取策略描述
-        Get policy description
-
-        Returns:
-            Description string
-        """
-        return self.__class__.__name__
+    allows_variations: bool
+    allows_takebacks: bool
+    enforces_time_control: bool
+    auto_ends_on_checkmate: bool
+    records_pgn: bool
+    description: str = ""
 
 
+@dataclass(frozen=True, slots=True)
 class StandardGamePolicy(GamePolicy):
     """
     标准对局策略
@@ -108,26 +62,15 @@ class StandardGamePolicy(GamePolicy):
     - Auto-ends on checkmate
     - Records PGN
     """
-
-    def allows_variations(self) -> bool:
-        return False
-
-    def allows_takebacks(self) -> bool:
-        return False
-
-    def enforces_time_control(self) -> bool:
-        return True
-
-    def auto_ends_on_checkmate(self) -> bool:
-        return True
-
-    def records_pgn(self) -> bool:
-        return True
-
-    def get_description(self) -> str:
-        return "Standard game with no takebacks"
+    allows_variations: bool = False
+    allows_takebacks: bool = False
+    enforces_time_control: bool = True
+    auto_ends_on_checkmate: bool = True
+    records_pgn: bool = True
+    description: str = "Standard game with no takebacks"
 
 
+@dataclass(frozen=True, slots=True)
 class AnalysisPolicy(GamePolicy):
     """
     分析策略
@@ -139,26 +82,15 @@ class AnalysisPolicy(GamePolicy):
     - Does not auto-end
     - Records PGN with variations
     """
-
-    def allows_variations(self) -> bool:
-        return True
-
-    def allows_takebacks(self) -> bool:
-        return True
-
-    def enforces_time_control(self) -> bool:
-        return False
-
-    def auto_ends_on_checkmate(self) -> bool:
-        return False
-
-    def records_pgn(self) -> bool:
-        return True
-
-    def get_description(self) -> str:
-        return "Analysis mode with variations and takebacks"
+    allows_variations: bool = True
+    allows_takebacks: bool = True
+    enforces_time_control: bool = False
+    auto_ends_on_checkmate: bool = False
+    records_pgn: bool = True
+    description: str = "Analysis mode with variations and takebacks"
 
 
+@dataclass(frozen=True, slots=True)
 class PuzzlePolicy(GamePolicy):
     """
     谜题策略
@@ -170,26 +102,15 @@ class PuzzlePolicy(GamePolicy):
     - Does not auto-end (waits for solution)
     - Does not record PGN
     """
-
-    def allows_variations(self) -> bool:
-        return False
-
-    def allows_takebacks(self) -> bool:
-        return True
-
-    def enforces_time_control(self) -> bool:
-        return False
-
-    def auto_ends_on_checkmate(self) -> bool:
-        return False
-
-    def records_pgn(self) -> bool:
-        return False
-
-    def get_description(self) -> str:
-        return "Puzzle mode with takebacks but no PGN recording"
+    allows_variations: bool = False
+    allows_takebacks: bool = True
+    enforces_time_control: bool = False
+    auto_ends_on_checkmate: bool = False
+    records_pgn: bool = False
+    description: str = "Puzzle mode with takebacks but no PGN recording"
 
 
+@dataclass(frozen=True, slots=True)
 class StudyPolicy(GamePolicy):
     """
     研究策略
@@ -201,24 +122,23 @@ class StudyPolicy(GamePolicy):
     - Does not auto-end
     - Records PGN with variations
     """
+    allows_variations: bool = True
+    allows_takebacks: bool = True
+    enforces_time_control: bool = False
+    auto_ends_on_checkmate: bool = False
+    records_pgn: bool = True
+    description: str = "Study mode with full variation support"
 
-    def allows_variations(self) -> bool:
-        return True
-
-    def allows_takebacks(self) -> bool:
-        return True
-
-    def enforces_time_control(self) -> bool:
-        return False
-
-    def auto_ends_on_checkmate(self) -> bool:
-        return False
-
-    def records_pgn(self) -> bool:
-        return True
 
-    def get_description(self) -> str:
-        return "Study mode with full variation support"
+# 各模式的策略单例（策略无状态，可共享）
+# Per-mode policy singletons; policies are stateless, so sessions share them
+_POLICY_SINGLETONS: dict[SessionMode, GamePolicy] = {
+    SessionMode.STANDARD_GAME: StandardGamePolicy(),
+    SessionMode.ANALYSIS: AnalysisPolicy(),
+    SessionMode.PUZZLE: PuzzlePolicy(),
+    SessionMode.STUDY: StudyPolicy(),
+}
+_DEFAULT_POLICY = _POLICY_SINGLETONS[SessionMode.STANDARD_GAME]
 
 
 def get_policy_for_mode(mode: SessionMode) -> GamePolicy:
@@ -230,12 +150,6 @@ def get_policy_for_mode(mode: SessionMode) -> GamePolicy:
         mode: Session mode
 
     Returns:
-        Appropriate GamePolicy instance
+        Shared GamePolicy instance for the mode (standard game if unknown)
     """
-    policies = {
-        SessionMode.STANDARD_GAME: StandardGamePolicy(),
-        SessionMode.ANALYSIS: AnalysisPolicy(),
-        SessionMode.PUZZLE: PuzzlePolicy(),
-        SessionMode.STUDY: StudyPolicy(),
-    }
-    return policies.get(mode, StandardGamePolicy())
+    return _POLICY_SINGLETONS.get(mode, _DEFAULT_POLICY)
@@ -1,9 +1,38 @@
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import chess
 from backend.core.real_pgn.models import NodeTree
 
 # From stage1c.md: PGN-Implementaion
 
+@lru_cache(maxsize=4096)
+def _make_board(fen: str) -> chess.Board:
+    """
+    Parse a FEN once and keep the board as a read-only template.
+
+    Callers must copy() the result before pushing moves. copy(stack=False)
+    only duplicates the bitboards, which is far cheaper than re-parsing a
+    FEN into a reused scratch board with set_fen(); build_fen_index does
+    not come through here at all and walks a single board with push/pop.
+    """
+    return chess.Board(fen)
+
+
+_FILES = "abcdefgh"
+_RANKS = "12345678"
+
+
+def _looks_like_uci(move_str: str) -> bool:
+    """Cheap shape check for UCI moves such as 'g1f3' or 'e7e8q'."""
+    return (
+        len(move_str) in (4, 5)
+        and move_str[0] in _FILES
+        and move_str[1] in _RANKS
+        and move_str[2] in _FILES
+        and move_str[3] in _RANKS
+    )
+
+
 def apply_move(parent_fen: str, move_str: str) -> Tuple[str, int, int]:
     """
     Applies a single move (SAN or UCI) to a FEN, validates it, and returns the new state.
@@ -11,14 +40,18 @@ def apply_move(parent_fen: str, move_str: str) -> Tuple[str, int, int]:
     Returns:
         A tuple containing (new_fen, new_ply, new_move_number).
     """
-    board = chess.Board(parent_fen)
+    board = _make_board(parent_fen).copy(stack=False)
+    # UCI-shaped input ("e2e4", "e7e8q") goes straight to parse_uci, which
+    # skips the legal-move generation parse_san needs; SAN is the fallback.
+    if _looks_like_uci(move_str):
+        parsers = (board.parse_uci, board.parse_san)
+    else:
+        parsers = (board.parse_san, board.parse_uci)
     try:
-        # Try parsing as SAN first, as it's more common in PGN context
-        move = board.parse_san(move_str)
+        move = parsers[0](move_str)
     except ValueError:
         try:
-            # Fall back to UCI
-            move = board.parse_uci(move_str)
+            move = parsers[1](move_str)
         except ValueError:
             raise ValueError(f"Invalid move '{move_str}' for FEN '{parent_fen}'")
 
@@ -46,31 +79,39 @@ def build_fen_index(tree: NodeTree) -> Dict[str, str]:
     
     fen_index[tree.root_id] = start_fen
     
-    _calculate_fen_recursive(tree, tree.root_id, start_fen, fen_index)
+    board = chess.Board(start_fen)
+    _calculate_fens(tree, tree.root_id, board, fen_index)
     
     return fen_index
 
-def _calculate_fen_recursive(tree: NodeTree, node_id: str, current_fen: str, fen_index: Dict[str, str]):
+def _calculate_fens(tree: NodeTree, node_id: str, board: chess.Board, fen_index: Dict[str, str]):
     """
-    Helper to recursively traverse the tree and calculate FENs.
+    Helper to traverse the tree and calculate FENs.
+
+    `board` must be at `node_id`'s position; it is pushed/popped in place
+    (no FEN re-parsing per node) and left at that position on return.
+    Uses an explicit stack in pre-order (main line before variations), so
+    deep trees never hit the recursion limit.
     """
-    node = tree.nodes[node_id]
-    
-    # Traverse main line
-    if node.main_child:
-        child_node = tree.nodes[node.main_child]
-        board = chess.Board(current_fen)
-        board.push_san(child_node.san)
-        child_fen = board.fen()
-        fen_index[child_node.node_id] = child_fen
-        _calculate_fen_recursive(tree, child_node.node_id, child_fen, fen_index)
-
-    # Traverse variations
-    for var_id in node.variations:
-        var_node = tree.nodes[var_id]
-        board = chess.Board(current_fen)
-        board.push_san(var_node.san)
-        var_fen = board.fen()
-        fen_index[var_node.node_id] = var_fen
-        _calculate_fen_recursive(tree, var_node.node_id, var_fen, fen_index)
+    nodes = tree.nodes
+    root = nodes[node_id]
+
+    # Stack entries are node ids to visit, or None to undo one push
+    stack: List[Optional[str]] = list(reversed(root.variations))
+    if root.main_child:
+        stack.append(root.main_child)
+
+    while stack:
+        child_id = stack.pop()
+        if child_id is None:
+            board.pop()
+            continue
+
+        child = nodes[child_id]
+        board.push_san(child.san)
+        fen_index[child.node_id] = board.fen()
 
+        stack.append(None)
+        stack.extend(reversed(child.variations))
+        if child.main_child:
+            stack.append(child.main_child)
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterator, List
 from backend.core.real_pgn.models import NodeTree, PgnNode
 
 # From stage1b.md: PGN-Implementaion
@@ -9,114 +9,120 @@ def build_show(tree: NodeTree) -> Dict[str, Any]:
     """
     
     headers = [{"k": key, "v": value} for key, value in tree.meta.headers.items()]
+
+    if not tree.root_id:
+        # Empty/unparsable tree: nothing to index or render
+        return {
+            "headers": headers,
+            "nodes": {},
+            "render": [],
+            "root_fen": None,
+            "result": tree.meta.result
+        }
+
+    # node.__dict__ is the instance's own attribute dict, not a copy: the DTO
+    # shares it with the tree, so no per-node dict is allocated here.
     nodes_dict = {nid: node.__dict__ for nid, node in tree.nodes.items()}
-    render_stream = []
-    
-    if tree.root_id:
-        _build_tokens_recursive(tree, tree.root_id, render_stream, is_variation_start=False)
-        
-    root_fen = tree.nodes[tree.root_id].fen if tree.root_id else None
+    # The API returns the DTO as JSON, so the stream is materialized here;
+    # streaming callers can iterate _yield_tokens directly.
+    render_stream = list(_yield_tokens(tree, tree.root_id))
 
     return {
         "headers": headers,
         "nodes": nodes_dict,
         "render": render_stream,
-        "root_fen": root_fen,
+        "root_fen": tree.nodes[tree.root_id].fen,
         "result": tree.meta.result
     }
 
-def _build_tokens_recursive(tree: NodeTree, node_id: str, tokens: List[Dict[str, Any]], is_variation_start: bool):
+class _LabelCache(dict):
+    """move_number -> formatted label, filled on first use."""
 
-    """
+    def __init__(self, fmt: str):
+        super().__init__()
+        self.fmt = fmt
 
-    Recursively builds the render token stream with the new DTO structure.
+    def __missing__(self, move_number: int) -> str:
+        label = self[move_number] = self.fmt.format(move_number)
+        return label
 
-    """
 
-    node = tree.nodes.get(node_id)
+# 走法编号标签缓存 Move-number label caches
+_LABEL_WHITE = _LabelCache("{}.")
+_LABEL_BLACK = _LabelCache("{}...")
+_LABEL_WHITE_VAR = _LabelCache("({}.")
+_LABEL_BLACK_VAR = _LabelCache("({}...")
 
-    if not node:
+def _yield_tokens(tree: NodeTree, root_id: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the render token stream with the new DTO structure.
 
+    Walks the tree with an explicit stack instead of recursion. Stack entries
+    are either (node_id, is_variation_start) pairs to render, or ready-made
+    token dicts (variation_start/variation_end) to emit as they are popped.
+    """
+    nodes = tree.nodes
+    root = nodes.get(root_id)
+    if not root:
         return
 
-
-
-    if node.san == "<root>":
-
+    stack: List[Any] = []
+    if root.san == "<root>":
+        if root.main_child:
+            stack.append((root.main_child, False))
+    else:
+        stack.append((root_id, False))
+
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            yield item
+            continue
+
+        node_id, is_variation_start = item
+        node = nodes.get(node_id)
+        if not node:
+            continue
+
+        if node.san == "<root>":
+            if node.main_child:
+                stack.append((node.main_child, False))
+            continue
+
+        # --- Label Generation ---
+        is_black_move = (node.ply & 1) == 0
+        move_number = node.move_number
+
+        if is_variation_start:  # Parenthesised, always numbered
+            table = _LABEL_BLACK_VAR if is_black_move else _LABEL_WHITE_VAR
+        elif not is_black_move:  # White's move
+            table = _LABEL_WHITE
+        elif node.parent_id and nodes.get(node.parent_id).san == "<root>":
+            table = _LABEL_BLACK  # Black move right after the root needs a number
+        else:
+            table = None
+
+        label = table[move_number] if table is not None else ""
+
+        # --- Token Generation ---
+        if node.comment_before:
+            yield {"t": "comment", "node": node.node_id, "text": node.comment_before}
+
+        yield {
+            "t": "move",
+            "node": node.node_id,
+            "label": label,
+            "san": node.san
+        }
+
+        if node.comment_after:
+            yield {"t": "comment", "node": node.node_id, "text": node.comment_after}
+
+        # Push in reverse so variations pop first (in order), then the main line
         if node.main_child:
-
-            _build_tokens_recursive(tree, node.main_child, tokens, is_variation_start=False)
-
-        return
-
-
-
-    # --- Label Generation ---
-
-    label = ""
-
-    is_black_move = node.ply % 2 == 0
-
-    parent_is_root = tree.nodes.get(node.parent_id).san == "<root>" if node.parent_id else False
-
-
-
-    if not is_black_move:  # White's move
-
-        label = f"{node.move_number}."
-
-    elif is_variation_start or parent_is_root:  # Black move needing a number
-
-        label = f"{node.move_number}..."
-
-    
-
-    # Add parenthesis prefix if this move starts a variation
-
-    if is_variation_start:
-
-        label = f"({label}"
-
-
-
-    # --- Token Generation ---
-
-    if node.comment_before:
-        tokens.append({"t": "comment", "node": node.node_id, "text": node.comment_before})
-
-    tokens.append({
-
-        "t": "move",
-
-        "node": node.node_id,
-
-        "label": label,
-
-        "san": node.san
-
-    })
-
-
-
-    if node.comment_after:
-
-        tokens.append({"t": "comment", "node": node.node_id, "text": node.comment_after})
-
-
-
-    for var_node_id in node.variations:
-
-        # Add 'from' field to variation_start token
-
-        tokens.append({"t": "variation_start", "from": node.node_id})
-
-        _build_tokens_recursive(tree, var_node_id, tokens, is_variation_start=True)
-
-        tokens.append({"t": "variation_end"})
-
-    
-
-    if node.main_child:
-
-        _build_tokens_recursive(tree, node.main_child, tokens, is_variation_start=False)
-
+            stack.append((node.main_child, False))
+        for var_node_id in reversed(node.variations):
+            stack.append({"t": "variation_end"})
+            stack.append((var_node_id, True))
+            # Add 'from' field to variation_start token
+            stack.append({"t": "variation_start", "from": node.node_id})
@@ -41,10 +41,13 @@ Key Principle:
     Authentication = Prove you are who you say you are
     This module stops at identity verification, nothing more.
 """
+import time
 import uuid
+from functools import lru_cache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from core.db.deps import get_db
 from core.security.jwt import decode_token
@@ -55,6 +58,60 @@ from models.user import User
 # OAuth2 scheme - extracts token from Authorization: Bearer <token>
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# Short-lived cache of active users: user UUID -> (expires_at, detached snapshot).
+# Snapshots are never handed out; each request merges its own copy into the
+# session, so a hit costs no SELECT. Profile writes call invalidate_cached_user().
+_USER_CACHE_TTL_SECONDS = 5.0
+_USER_CACHE_MAX_SIZE = 10_000
+_USER_CACHE: dict[uuid.UUID, tuple[float, User]] = {}
+
+
+@lru_cache(maxsize=4096)
+def _parse_uuid(user_id: str) -> uuid.UUID:
+    return uuid.UUID(user_id)
+
+
+def _load_user(db: Session, user_uuid: uuid.UUID) -> User | None:
+    """
+    Load a user by UUID, serving recently seen active users from the cache.
+
+    Args:
+        db: Database session
+        user_uuid: User ID
+
+    Returns:
+        User attached to ``db``, or None if not found
+    """
+    cached = _USER_CACHE.get(user_uuid)
+    if cached:
+        expires_at, snapshot = cached
+        if time.monotonic() < expires_at:
+            return db.merge(snapshot, load=False)
+        _USER_CACHE.pop(user_uuid, None)
+
+    user = db.get(User, user_uuid)
+    if user is not None and user.is_active:
+        snapshot = User(**{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs})
+        make_transient_to_detached(snapshot)
+        if len(_USER_CACHE) >= _USER_CACHE_MAX_SIZE:
+            _USER_CACHE.clear()
+        _USER_CACHE[user_uuid] = (time.monotonic() + _USER_CACHE_TTL_SECONDS, snapshot)
+    return user
+
+
+def invalidate_cached_user(user_id: uuid.UUID | str) -> None:
+    """
+    Drop a user from the authentication cache after their row changes.
+
+    Args:
+        user_id: User ID (UUID or string)
+    """
+    try:
+        user_uuid = user_id if isinstance(user_id, uuid.UUID) else _parse_uuid(user_id)
+    except ValueError:
+        return
+    _USER_CACHE.pop(user_uuid, None)
+
 
 def get_current_user(
     token: str = Depends(oauth2_scheme),
@@ -101,7 +158,7 @@ def get_current_user(
     # Load user from database
     logger.debug("Loading user from database")
     try:
-        user_uuid = uuid.UUID(user_id)
+        user_uuid = _parse_uuid(user_id)
     except ValueError:
         # SECURITY FIX: Don't log the invalid user_id to prevent log injection
         logger.warning("Invalid UUID format in token")
@@ -110,7 +167,7 @@ def get_current_user(
             detail="Invalid user ID format",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    user = db.get(User, user_uuid)
+    user = _load_user(db, user_uuid)
 
     if not user:
         # SECURITY FIX: Don't log user_id for missing users
@@ -123,7 +180,7 @@ def get_current_user(
 
     if not user.is_active:
         # SECURITY FIX: Reduced logging - only log role, not identifiers
-        logger.warning(f"Inactive user authentication attempt: role={user.role}")
+        logger.warning("Inactive user authentication attempt: role=%s", user.role)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Inactive user",
@@ -131,7 +188,7 @@ def get_current_user(
         )
 
     # SECURITY FIX: Reduced logging - only log role for successful auth
-    logger.info(f"User authenticated successfully: role={user.role}")
+    logger.info("User authenticated successfully: role=%s", user.role)
 
     return user
 
@@ -174,10 +231,10 @@ def get_current_user_sync(token: str, db: Session) -> User:
 
     if not user.is_active:
         # SECURITY FIX: Reduced logging
-        logger.warning(f"User inactive: role={user.role}")
+        logger.warning("User inactive: role=%s", user.role)
         raise UserInactiveError(user.identifier)
 
     # SECURITY FIX: Reduced logging
-    logger.info(f"User authenticated: role={user.role}")
+    logger.info("User authenticated: role=%s", user.role)
 
     return user
@@ -14,13 +14,13 @@ Why This File Exists:
         teacher = Depends(get_teacher_user)
 
 Core Dependencies:
-    1. get_teacher_user(user: User = Depends(get_current_user)) -> User
+    1. get_teacher_user(token, db) -> User
         - First authenticates user (get_current_user)
         - Then checks teacher permission (require_teacher)
         - Returns authenticated teacher User
         - Router doesn't need to know permission logic
 
-    2. get_student_user(user: User = Depends(get_current_user)) -> User
+    2. get_student_user(token, db) -> User
         - Authenticates user
         - Checks student permission
         - Returns authenticated student User
@@ -53,15 +53,23 @@ Example Usage in Router:
 Key Principle:
     This is GLUE CODE - it connects pieces but doesn't implement logic.
     All real logic lives in current_user.py and permissions.py.
+
+    The role dependencies call get_current_user() directly instead of
+    declaring it as a sub-dependency, so FastAPI resolves one node fewer per
+    request; they depend on the same oauth2_scheme/get_db inputs.
 """
 from fastapi import Depends
-from core.security.current_user import get_current_user
-from core.security.permissions import require_teacher, require_student
+from sqlalchemy.orm import Session
+
+from core.db.deps import get_db
+from core.security.current_user import get_current_user, oauth2_scheme
+from core.security.permissions import Role, require_role
 from models.user import User
 
 
 def get_teacher_user(
-    user: User = Depends(get_current_user),
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
 ) -> User:
     """
     FastAPI dependency that returns an authenticated teacher.
@@ -71,7 +79,8 @@ def get_teacher_user(
     2. require_teacher() - authorization
 
     Args:
-        user: Auto-injected authenticated user
+        token: JWT token from Authorization header (auto-extracted)
+        db: Database session (auto-injected)
 
     Returns:
         User object with teacher role
@@ -85,12 +94,14 @@ def get_teacher_user(
             # teacher is guaranteed to be authenticated and have teacher role
             return {"teacher": teacher.username}
     """
-    require_teacher(user)
+    user = get_current_user(token, db)
+    require_role(user, Role.TEACHER)
     return user
 
 
 def get_student_user(
-    user: User = Depends(get_current_user),
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
 ) -> User:
     """
     FastAPI dependency that returns an authenticated student.
@@ -100,7 +111,8 @@ def get_student_user(
     2. require_student() - authorization
 
     Args:
-        user: Auto-injected authenticated user
+        token: JWT token from Authorization header (auto-extracted)
+        db: Database session (auto-injected)
 
     Returns:
         User object with student role
@@ -114,5 +126,6 @@ def get_student_user(
             # student is guaranteed to be authenticated and have student role
             return {"student": student.username}
     """
-    require_student(user)
+    user = get_current_user(token, db)
+    require_role(user, Role.STUDENT)
     return user
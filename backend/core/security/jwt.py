@@ -32,8 +32,14 @@ Example Flow:
     Login success -> create_access_token(user_id) -> return to client
     Request -> extract token -> decode_token() -> get user_id
 """
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
 from datetime import datetime, timedelta, timezone
-from jose import jwt, JWTError
+import jwt
 
 from core.config import settings
 from core.log.log_auth import logger
@@ -62,11 +68,79 @@ def create_access_token(user_id: str) -> str:
 
     token = jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
-    logger.info(f"Access token created for user_id={user_id}, expires in {settings.ACCESS_TOKEN_EXPIRE_MINUTES}m")
+    logger.info(
+        "Access token created for user_id=%s, expires in %sm",
+        user_id,
+        settings.ACCESS_TOKEN_EXPIRE_MINUTES,
+    )
 
     return token
 
 
+# Verified tokens -> (exp timestamp, user_id). Clients resend the same token
+# on every request until it expires, so repeat lookups skip verification.
+# Cleared wholesale when full to keep memory bounded.
+_DECODE_CACHE_MAX_SIZE = 50_000
+_DECODE_CACHE: dict[str, tuple[float, str]] = {}
+
+# Header fields the HS256 fast path understands; anything else goes to PyJWT
+_FAST_PATH_HEADER_KEYS = frozenset({"alg", "typ"})
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _verify_and_decode(token: str) -> dict | None:
+    """
+    Verify and decode an HS256 token without going through PyJWT.
+
+    Only accepts tokens shaped like the ones create_access_token issues
+    (alg/typ header, string 'sub', integer 'exp' in the future). Returns
+    None for anything else, in which case the caller falls back to the
+    full PyJWT validation path, which also produces the error to log.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Payload dict if the token was verified here, None otherwise
+    """
+    if settings.JWT_ALGORITHM != "HS256" or token.count(".") != 2:
+        return None
+
+    try:
+        signing_input, _, signature_b64 = token.rpartition(".")
+        header_b64, _, payload_b64 = signing_input.partition(".")
+
+        expected = hmac.new(
+            settings.JWT_SECRET_KEY.encode("utf-8"),
+            signing_input.encode("ascii"),
+            hashlib.sha256,
+        ).digest()
+        if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+            return None
+
+        header = json.loads(_b64url_decode(header_b64))
+        payload = json.loads(_b64url_decode(payload_b64))
+    except (UnicodeError, binascii.Error, ValueError):
+        return None
+
+    if (
+        not isinstance(header, dict)
+        or header.get("alg") != "HS256"
+        or not header.keys() <= _FAST_PATH_HEADER_KEYS
+        or not isinstance(payload, dict)
+        or payload.keys() != {"sub", "exp"}
+        or not isinstance(payload["sub"], str)
+        or type(payload["exp"]) is not int
+        or payload["exp"] <= time.time()
+    ):
+        return None
+
+    return payload
+
+
 def decode_token(token: str) -> str | None:
     """
     Decode and verify a JWT token.
@@ -80,21 +154,36 @@ def decode_token(token: str) -> str | None:
     Example:
         user_id = decode_token("eyJ0eXAiOiJKV1QiLCJhbGc...")
     """
+    cached = _DECODE_CACHE.get(token)
+    if cached:
+        expires_at, user_id = cached
+        if time.time() < expires_at:
+            return user_id
+        _DECODE_CACHE.pop(token, None)
+
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = _verify_and_decode(token)
+        if payload is None:
+            payload = jwt.decode(
+                token,
+                settings.JWT_SECRET_KEY,
+                algorithms=[settings.JWT_ALGORITHM]
+            )
         user_id = payload.get("sub")
 
         if not user_id:
             logger.warning("Token decoded but 'sub' field is missing")
             return None
 
-        logger.debug(f"Token decoded successfully: user_id={user_id}")
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            if len(_DECODE_CACHE) >= _DECODE_CACHE_MAX_SIZE:
+                _DECODE_CACHE.clear()
+            _DECODE_CACHE[token] = (exp, user_id)
+
+        logger.debug("Token decoded successfully: user_id=%s", user_id)
         return user_id
 
-    except JWTError as e:
-        logger.warning(f"Token decode failed: {e}")
+    except jwt.InvalidTokenError as e:
+        logger.warning("Token decode failed: %s", e)
         return None
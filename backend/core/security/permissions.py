@@ -17,6 +17,9 @@ What This Module DOES:
         - Checks if user.role == "student"
         - Raises 403 Forbidden if not
 
+    ✓ require_role(user: User, role: Role) -> None
+        - Shared check behind require_teacher/require_student
+
 What This Module DOES NOT DO:
     ✗ Extract JWT token (that's current_user.py)
     ✗ Decode tokens (that's jwt.py)
@@ -31,12 +34,62 @@ Difference from Authentication:
     - Authentication (401): "I don't know who you are"
     - Authorization (403): "I know who you are, but you can't do this"
 """
+import logging
+from enum import Enum
+
 from fastapi import HTTPException, status
 from models.user import User
 from core.log.log_auth import logger
 from core.errors import TeacherAccessRequiredError, StudentAccessRequiredError
 
 
+class Role(str, Enum):
+    """
+    User roles as stored in ``User.role``.
+
+    A str-valued enum so members compare equal to the plain strings already
+    in the database column.
+    """
+    TEACHER = "teacher"
+    STUDENT = "student"
+
+
+_PERMISSION_DENIED_DETAIL = {
+    Role.TEACHER: "Teacher permission required",
+    Role.STUDENT: "Student permission required",
+}
+
+
+def require_role(user: User, role: Role) -> None:
+    """
+    Verify that user has the given role.
+
+    Args:
+        user: Authenticated user object
+        role: Required role
+
+    Raises:
+        HTTPException: 403 Forbidden if user does not have the role
+
+    Example:
+        require_role(user, Role.TEACHER)  # Raises 403 if not teacher
+    """
+    if user.role != role:
+        logger.warning(
+            "%s permission denied for user: %s (role=%s)",
+            role.value.capitalize(),
+            user.username,
+            user.role,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=_PERMISSION_DENIED_DETAIL[role],
+        )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s permission granted: %s", role.value.capitalize(), user.username)
+
+
 def require_teacher(user: User) -> None:
     """
     Verify that user has teacher role.
@@ -53,14 +106,7 @@ def require_teacher(user: User) -> None:
             require_teacher(user)  # Raises 403 if not teacher
             # ... rest of logic
     """
-    if user.role != "teacher":
-        logger.warning(f"Teacher permission denied for user: {user.username} (role={user.role})")
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Teacher permission required",
-        )
-
-    logger.debug(f"Teacher permission granted: {user.username}")
+    require_role(user, Role.TEACHER)
 
 
 def require_student(user: User) -> None:
@@ -79,11 +125,4 @@ def require_student(user: User) -> None:
             require_student(user)  # Raises 403 if not student
             # ... rest of logic
     """
-    if user.role != "student":
-        logger.warning(f"Student permission denied for user: {user.username} (role={user.role})")
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Student permission required",
-        )
-
-    logger.debug(f"Student permission granted: {user.username}")
+    require_role(user, Role.STUDENT)
@@ -5,22 +5,52 @@ Processes fen_index.json files and extracts node-level FEN data
 for tagging analysis.
 """
 
-import json
+import asyncio
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+import chess
+
+from .json_io import loads as _loads, read_json
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def position_key(fen: str) -> str:
+    """
+    Strip the halfmove clock from a FEN.
+
+    The fullmove number stays: opening, maneuver and prophylaxis detectors
+    gate on it, so only nodes reaching the same board at the same move
+    number share this key.
+    """
+    parts = fen.split(" ")
+    if len(parts) != 6:
+        return fen
+    del parts[4]
+    return " ".join(parts)
+
+
+# Node IDs that never carry a real move (the synthetic tree root)
+_SKIP_NODE_IDS = frozenset({"virtual_root"})
+
+
+@dataclass(slots=True, frozen=True)
 class NodeFenEntry:
     """A single node's FEN data for analysis."""
     node_id: str
     fen: str
     uci: Optional[str] = None
     san: Optional[str] = None
+    # Pre-parsed position before the move; shared by siblings, treat as read-only
+    board: Optional[chess.Board] = None
+    # position_key(fen), computed once here for dedup and cache lookups
+    key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "key", position_key(self.fen))
 
 
 class FenIndexProcessor:
@@ -50,16 +80,11 @@ class FenIndexProcessor:
         Returns:
             List of NodeFenEntry objects
         """
-        entries = []
-        for node_id, fen in fen_index.items():
-            # Skip virtual root
-            if node_id == "virtual_root":
-                continue
-
-            entries.append(NodeFenEntry(
-                node_id=node_id,
-                fen=fen,
-            ))
+        entries = [
+            NodeFenEntry(node_id=node_id, fen=fen)
+            for node_id, fen in fen_index.items()
+            if node_id not in _SKIP_NODE_IDS
+        ]
 
         logger.debug(f"Processed {len(entries)} FEN entries")
         return entries
@@ -74,8 +99,7 @@ class FenIndexProcessor:
         Returns:
             List of NodeFenEntry objects
         """
-        path = Path(file_path)
-        fen_index = json.loads(path.read_text(encoding="utf-8"))
+        fen_index = read_json(file_path)
         return self.process_fen_index(fen_index)
 
     def process_tree_with_moves(self, tree_dict: Dict[str, Any]) -> List[NodeFenEntry]:
@@ -92,20 +116,33 @@ class FenIndexProcessor:
         """
         entries = []
         nodes = tree_dict.get("nodes", {})
+        # Siblings start from the same parent position: parse each FEN once
+        boards: Dict[str, Optional[chess.Board]] = {}
 
         for node_id, node_data in nodes.items():
             # Skip virtual root
-            if node_id == "virtual_root" or node_data.get("san") == "<root>":
+            if node_id in _SKIP_NODE_IDS or node_data.get("san") == "<root>":
                 continue
             parent_id = node_data.get("parent_id")
             parent_fen = nodes.get(parent_id, {}).get("fen") if parent_id else None
             fen_before_move = parent_fen or node_data.get("fen", "")
+            uci = node_data.get("uci")
+
+            board = None
+            if uci and fen_before_move:
+                if fen_before_move not in boards:
+                    try:
+                        boards[fen_before_move] = chess.Board(fen_before_move)
+                    except ValueError:
+                        boards[fen_before_move] = None
+                board = boards[fen_before_move]
 
             entries.append(NodeFenEntry(
                 node_id=node_id,
                 fen=fen_before_move,
-                uci=node_data.get("uci"),
+                uci=uci,
                 san=node_data.get("san"),
+                board=board,
             ))
 
         logger.debug(f"Processed {len(entries)} tree nodes")
@@ -115,6 +152,9 @@ class FenIndexProcessor:
         """
         Load fen_index from R2 and process it.
 
+        The R2 client is synchronous, so the download and parse run in a
+        worker thread and do not block the event loop.
+
         Args:
             chapter_id: Chapter ID to load
 
@@ -127,13 +167,35 @@ class FenIndexProcessor:
         if not self.r2_client:
             raise ValueError("R2 client not configured")
 
+        return await asyncio.to_thread(self._load_and_process_sync, chapter_id)
+
+    async def load_and_process_many(
+        self, chapter_ids: Iterable[str]
+    ) -> Dict[str, List[NodeFenEntry]]:
+        """
+        Load and process several chapters concurrently.
+
+        Args:
+            chapter_ids: Chapter IDs to load (duplicates are loaded once)
+
+        Returns:
+            Dict mapping chapter_id to its NodeFenEntry list
+
+        Raises:
+            ValueError: If R2 client not configured
+        """
+        ids = list(dict.fromkeys(chapter_ids))
+        results = await asyncio.gather(*(self.load_and_process(cid) for cid in ids))
+        return dict(zip(ids, results))
+
+    def _load_and_process_sync(self, chapter_id: str) -> List[NodeFenEntry]:
         from modules.workspace.storage.keys import R2Keys
 
         # Try fen_index first, fall back to tree_json
         try:
             key = R2Keys.chapter_fen_index_json(chapter_id)
             json_str = self.r2_client.download_json(key)
-            fen_index = json.loads(json_str)
+            fen_index = _loads(json_str)
             return self.process_fen_index(fen_index)
         except Exception as e:
             logger.warning(f"Failed to load fen_index for {chapter_id}: {e}")
@@ -141,7 +203,7 @@ class FenIndexProcessor:
             # Fall back to tree_json
             key = R2Keys.chapter_tree_json(chapter_id)
             json_str = self.r2_client.download_json(key)
-            tree_dict = json.loads(json_str)
+            tree_dict = _loads(json_str)
             return self.process_tree_with_moves(tree_dict)
 
 
@@ -155,6 +217,6 @@ def process_fen_index_json(fen_index_json: str) -> List[NodeFenEntry]:
     Returns:
         List of NodeFenEntry objects
     """
-    fen_index = json.loads(fen_index_json)
+    fen_index = _loads(fen_index_json)
     processor = FenIndexProcessor()
     return processor.process_fen_index(fen_index)
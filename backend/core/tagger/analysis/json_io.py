@@ -0,0 +1,47 @@
+"""
+JSON helpers for the analysis pipeline.
+
+Uses orjson when it is installed (C-speed parse/emit, including indented
+output) and falls back to the standard library otherwise.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON with orjson when available (accepts str or bytes)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: str | Path) -> Any:
+    """Load a JSON file, reading raw bytes to skip text decoding."""
+    return loads(Path(path).read_bytes())
+
+
+def dumps(data: Any) -> bytes:
+    """Encode ``data`` as compact UTF-8 JSON."""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_pretty(data: Any) -> bytes:
+    """Encode ``data`` as 2-space indented UTF-8 JSON."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_json(path: str | Path, data: Any) -> None:
+    """Write ``data`` as 2-space indented JSON."""
+    Path(path).write_bytes(dumps_pretty(data))
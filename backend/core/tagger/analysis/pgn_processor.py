@@ -2,22 +2,165 @@
 PGN file processor for extracting positions and moves.
 """
 
+import io
+import logging
+import mmap
+import os
+import re
+import sys
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Iterator, List
+from types import MappingProxyType
+from itertools import repeat
+from typing import Dict, Iterator, List, Mapping, Tuple
 
 import chess
 import chess.pgn
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+_EMPTY_RUN = re.compile(r"1+")
+# Expanded rank ("r1bqkbnr" with one "1" per empty square) -> FEN rank.
+# Real games repeat a small set of ranks, so this stays small; the cap is
+# only a guard against pathological input.
+_RANK_CACHE: Dict[str, str] = {}
+_RANK_CACHE_MAX_SIZE = 65536
+
+
+def _compress_run(match: "re.Match[str]") -> str:
+    return str(len(match.group()))
+
+
+def _fast_fen(board: chess.Board) -> str:
+    """
+    Same string as ``board.fen()``, built from the piece bitboards.
+
+    board.fen() asks for the piece on each of the 64 squares in turn; here
+    each piece bitboard is scanned once and ranks are compressed through a
+    lookup table.
+    """
+    squares = ["1"] * 64
+    masks = (board.pawns, board.knights, board.bishops, board.rooks, board.queens, board.kings)
+    for symbols, occupied in (("PNBRQK", board.occupied_co[chess.WHITE]),
+                              ("pnbrqk", board.occupied_co[chess.BLACK])):
+        for symbol, mask in zip(symbols, masks):
+            for square in chess.scan_forward(mask & occupied):
+                squares[square] = symbol
+
+    ranks = []
+    for start in range(56, -8, -8):
+        rank = "".join(squares[start:start + 8])
+        compressed = _RANK_CACHE.get(rank)
+        if compressed is None:
+            compressed = _EMPTY_RUN.sub(_compress_run, rank)
+            if len(_RANK_CACHE) < _RANK_CACHE_MAX_SIZE:
+                _RANK_CACHE[rank] = compressed
+        ranks.append(compressed)
+
+    # Like board.fen(): only show the en passant square if the capture is legal
+    ep_square = board.ep_square
+    if ep_square is not None and board.has_legal_en_passant():
+        ep = chess.SQUARE_NAMES[ep_square]
+    else:
+        ep = "-"
+
+    return (
+        f"{'/'.join(ranks)} {'w' if board.turn else 'b'} {board.castling_xfen()} "
+        f"{ep} {board.halfmove_clock} {board.fullmove_number}"
+    )
+
+
+# chess.pgn only parses text streams. Decoding is not the bottleneck (read_game's
+# SAN parsing is), so pin UTF-8 instead of the locale default; utf-8-sig drops a
+# leading BOM and "replace" keeps stray Latin-1 bytes from aborting a whole file.
+_PGN_OPEN_KWARGS = {"encoding": "utf-8-sig", "errors": "replace"}
+
+
+class _MainlinePositionVisitor(chess.pgn.BaseVisitor):
+    """
+    Collect (ply, FEN, UCI) for the mainline straight from the parser.
+
+    read_game already keeps a board in sync to resolve SAN; reading the
+    position off it in visit_move avoids building a GameNode tree and
+    replaying every move on a second board. Side variations are skipped,
+    so their SAN is never parsed.
+    """
+
+    def __init__(self, skip_opening_moves: int = 0):
+        self.skip_opening_moves = skip_opening_moves
+
+    def begin_game(self) -> None:
+        # Same defaults (Seven Tag Roster) a GameBuilder game starts with
+        self.headers = chess.pgn.Headers()
+        self.plies: List[Tuple[int, str, str]] = []
+        self.ply = 0
+
+    def visit_header(self, tagname: str, tagvalue: str) -> None:
+        self.headers[tagname] = tagvalue
+
+    def begin_variation(self):
+        return chess.pgn.SKIP
+
+    def visit_result(self, result: str) -> None:
+        if self.headers.get("Result", "*") == "*":
+            self.headers["Result"] = result
+
+    def visit_move(self, board: chess.Board, move: chess.Move) -> None:
+        self.ply += 1
+        if self.ply > self.skip_opening_moves:
+            self.plies.append((self.ply, _fast_fen(board), move.uci()))
+
+    def handle_error(self, error: Exception) -> None:
+        # Like GameBuilder: log and keep the moves parsed so far
+        logger.exception("error during pgn parsing")
+
+    def result(self) -> "_MainlinePositionVisitor":
+        return self
+
+
+# A game's tag section starts after a blank line; splitting only here keeps
+# every byte range a sequence of whole games
+_GAME_BOUNDARY = re.compile(rb"\n\r?\n(?=\[Event )")
+# Below this size a process pool costs more than it saves
+_PARALLEL_MIN_BYTES = 1 << 20
+
+
+def _read_games(pgn_file, skip_opening_moves: int) -> Iterator[_MainlinePositionVisitor]:
+    visitor = partial(_MainlinePositionVisitor, skip_opening_moves)
+    while (game := chess.pgn.read_game(pgn_file, Visitor=visitor)) is not None:
+        yield game
+
+
+def _freeze_headers(headers: Mapping[str, str]) -> Mapping[str, str]:
+    # Interned so Event/Site/player strings repeated across games are stored once
+    return MappingProxyType({
+        sys.intern(key): sys.intern(value) for key, value in headers.items()
+    })
+
+
+def _extract_range(
+    pgn_path: Path, start: int, end: int, skip_opening_moves: int
+) -> List[Tuple[Dict[str, str], List[Tuple[int, str, str]]]]:
+    """Worker: parse the games in bytes [start, end) into (headers, plies)."""
+    with open(pgn_path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode(**_PGN_OPEN_KWARGS)
+    pgn_file = io.StringIO(text, newline=None)
+    return [(dict(game.headers), game.plies) for game in _read_games(pgn_file, skip_opening_moves)]
+
+
+@dataclass(slots=True, frozen=True)
 class Position:
     """Represents a position from a PGN game."""
     game_index: int
     move_number: int
     fen: str
     played_move_uci: str
-    game_headers: dict
+    # Read-only and shared by every position of the same game
+    game_headers: Mapping[str, str]
 
 
 class PGNProcessor:
@@ -31,6 +174,9 @@ class PGNProcessor:
             pgn_path: Path to PGN file to process
         """
         self.pgn_path = pgn_path
+        # Games read by the last extraction, including games that yielded no
+        # positions (e.g. shorter than skip_opening_moves)
+        self.games_read = 0
 
     def extract_positions(self, skip_opening_moves: int = 0) -> Iterator[Position]:
         """
@@ -42,56 +188,93 @@ class PGNProcessor:
         Yields:
             Position objects containing FEN, played move, and metadata
         """
-        with open(self.pgn_path) as pgn_file:
-            game_index = 0
-
-            while True:
-                game = chess.pgn.read_game(pgn_file)
-                if game is None:
-                    break
-
-                headers = dict(game.headers)
-                board = game.board()
-                node = game
-                move_number = 0
-
-                # Traverse the game
-                while node.variations:
-                    node = node.variation(0)
-                    move_number += 1
-
-                    # Skip opening moves if requested
-                    if move_number <= skip_opening_moves:
-                        board.push(node.move)
-                        continue
-
-                    # Get FEN before the move
-                    fen_before = board.fen()
-                    played_move = node.move
-
+        self.games_read = 0
+        with open(self.pgn_path, **_PGN_OPEN_KWARGS) as pgn_file:
+            for game_index, game in enumerate(_read_games(pgn_file, skip_opening_moves)):
+                self.games_read = game_index + 1
+                headers = _freeze_headers(game.headers)
+                for move_number, fen_before, played_move_uci in game.plies:
                     yield Position(
                         game_index=game_index,
                         move_number=move_number,
                         fen=fen_before,
-                        played_move_uci=played_move.uci(),
+                        played_move_uci=played_move_uci,
                         game_headers=headers
                     )
 
-                    # Apply the move for next iteration
-                    board.push(played_move)
+    def extract_positions_parallel(
+        self,
+        n_workers: int | None = None,
+        skip_opening_moves: int = 0,
+    ) -> Iterator[Position]:
+        """
+        Extract positions using a process pool over byte ranges of the file.
+
+        The file is memory-mapped and scanned once for game boundaries
+        (a blank line before "[Event "); each worker parses whole games in
+        its range. Positions come back in file order with the same
+        game_index numbering as extract_positions. Small files, or
+        n_workers=1, use extract_positions directly.
+
+        Args:
+            n_workers: Worker processes (default: CPU count)
+            skip_opening_moves: Number of opening moves to skip (default: 0)
+
+        Yields:
+            Position objects containing FEN, played move, and metadata
+        """
+        size = os.path.getsize(self.pgn_path)
+        n_workers = n_workers or os.cpu_count() or 1
+        if n_workers <= 1 or size < _PARALLEL_MIN_BYTES:
+            yield from self.extract_positions(skip_opening_moves)
+            return
 
-                game_index += 1
+        with open(self.pgn_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            boundaries = [match.end() for match in _GAME_BOUNDARY.finditer(mm)]
+
+        # A few ranges per worker so one slow range doesn't idle the rest
+        n_ranges = n_workers * 4
+        starts = {0}
+        for i in range(1, n_ranges):
+            idx = bisect_left(boundaries, size * i // n_ranges)
+            if idx < len(boundaries):
+                starts.add(boundaries[idx])
+        starts = sorted(starts)
+        ends = starts[1:] + [size]
+
+        game_index = 0
+        self.games_read = 0
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            chunks = executor.map(
+                _extract_range, repeat(self.pgn_path), starts, ends, repeat(skip_opening_moves)
+            )
+            for games in chunks:
+                for raw_headers, plies in games:
+                    self.games_read = game_index + 1
+                    headers = _freeze_headers(raw_headers)
+                    for move_number, fen_before, played_move_uci in plies:
+                        yield Position(
+                            game_index=game_index,
+                            move_number=move_number,
+                            fen=fen_before,
+                            played_move_uci=played_move_uci,
+                            game_headers=headers
+                        )
+                    game_index += 1
 
     def count_games(self) -> int:
         """
         Count total number of games in PGN file.
 
+        Uses chess.pgn.skip_game, which finds game boundaries without
+        parsing any moves.
+
         Returns:
             Number of games
         """
-        with open(self.pgn_path) as pgn_file:
+        with open(self.pgn_path, **_PGN_OPEN_KWARGS) as pgn_file:
             count = 0
-            while chess.pgn.read_game(pgn_file) is not None:
+            while chess.pgn.skip_game(pgn_file):
                 count += 1
         return count
 
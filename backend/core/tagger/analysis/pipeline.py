@@ -12,22 +12,36 @@ Performance targets:
 """
 
 import asyncio
-import json
 import logging
 import os
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime
-from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Literal
 
+import chess
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 from modules.workspace.pgn_v2.repo import PgnV2Repo
 from ..config.engine import DEFAULT_DEPTH, DEFAULT_MULTIPV, DEFAULT_STOCKFISH_PATH
+from ..engine.http_client import BATCH_SIZE, HTTPStockfishClient
+from ..engine.terminal import terminal_score_cp
 from ..facade import tag_position
 from ..tagging import get_primary_tags
-from .pgn_processor import PGNProcessor
+from .pgn_processor import PGNProcessor, Position
 from .tag_statistics import TagStatistics
 from .fen_processor import FenIndexProcessor, NodeFenEntry
+from .json_io import dumps, read_json, write_json
+from .tag_cache import TagCache, open_shared_tag_cache
 from ..pipeline.predictor.node_predictor import NodePredictor, NodeTagResult
 
 logger = logging.getLogger(__name__)
@@ -58,6 +72,9 @@ class AnalysisPipeline:
         multipv: int = DEFAULT_MULTIPV,
         skip_opening_moves: int = 0,
         pgn_v2_repo: Optional[PgnV2Repo] = None,
+        max_concurrency: Optional[int] = None,
+        tag_cache_path: Optional[str | Path] = None,
+        adaptive_depth: bool = False,
     ):
         """
         Initialize analysis pipeline.
@@ -72,6 +89,12 @@ class AnalysisPipeline:
             multipv: Number of principal variations (default: 6)
             skip_opening_moves: Number of opening moves to skip (default: 0)
             pgn_v2_repo: Optional PgnV2Repo instance for saving v2 PGN data
+            max_concurrency: Positions tagged at once (default: HTTP_MAX_CONCURRENCY
+                for the I/O-bound http mode, CPU count for local Stockfish)
+            tag_cache_path: Optional SQLite file persisting fen-index tags across runs;
+                pipelines given the same path share one open cache
+            adaptive_depth: Analyze quiet fen-index moves (no check, capture or
+                promotion) at reduced depth/MultiPV (default: False)
         """
         self.pgn_path = Path(pgn_path)
         self.output_dir = Path(output_dir)
@@ -81,7 +104,24 @@ class AnalysisPipeline:
         self.depth = depth
         self.multipv = multipv
         self.skip_opening_moves = skip_opening_moves
+        self.adaptive_depth = adaptive_depth
         self.pgn_v2_repo = pgn_v2_repo
+        if max_concurrency is None:
+            max_concurrency = (
+                self.HTTP_MAX_CONCURRENCY if engine_mode == "http" else (os.cpu_count() or 1)
+            )
+        self.max_concurrency = max(1, max_concurrency)
+        # (position_key, uci, depth, multipv) -> primary tags, kept across runs.
+        # position_key keeps the fullmove number, which some detectors read.
+        self._tag_cache: Dict[tuple[str, str, int, int], List[str]] = {}
+        self._disk_cache: Optional[TagCache] = None
+        if tag_cache_path is not None:
+            try:
+                self._disk_cache = open_shared_tag_cache(tag_cache_path)
+            except sqlite3.Error as e:
+                logger.warning("Tag cache disabled, cannot open %s: %s", tag_cache_path, e)
+        # R2 uploads of finished tag files run here so callers don't wait on them
+        self._upload_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="r2-upload")
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -110,52 +150,90 @@ class AnalysisPipeline:
         stats = TagStatistics()
 
         if verbose:
-            num_games = processor.count_games()
-            print(f"Total games in PGN: {num_games}")
+            # Games are counted during extraction; an up-front count_games()
+            # would read the whole file a second time.
             print("Processing positions...")
             print()
 
         position_count = 0
         error_count = 0
+        # Progress line every 10 positions; 0 never matches, so quiet runs
+        # pay a single comparison per position
+        progress_every = 10 if verbose else 0
+        next_progress = progress_every
+        # (1-based position number, position) waiting to be tagged
+        batch: List[tuple[int, Position]] = []
+
+        # Engine calls are latency-bound, so up to max_concurrency positions
+        # are tagged in parallel; results are recorded in PGN order.
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for position in processor.extract_positions(skip_opening_moves=self.skip_opening_moves):
+                if max_positions and position_count >= max_positions:
+                    if verbose:
+                        print(f"\nReached max_positions limit ({max_positions})")
+                    break
+
+                position_count += 1
+
+                if position_count == next_progress:
+                    print(f"Processed {position_count} positions...", end="\r")
+                    next_progress += progress_every
+
+                batch.append((position_count, position))
+                if len(batch) >= self.max_concurrency:
+                    error_count += self._tag_batch(executor, batch, stats, verbose)
+                    batch = []
+
+            if batch:
+                error_count += self._tag_batch(executor, batch, stats, verbose)
 
-        for position in processor.extract_positions(skip_opening_moves=self.skip_opening_moves):
-            if max_positions and position_count >= max_positions:
-                if verbose:
-                    print(f"\nReached max_positions limit ({max_positions})")
-                break
+        if verbose:
+            print(f"\nCompleted: {position_count} positions processed from {processor.games_read} games")
+            if error_count > 0:
+                print(f"Errors encountered: {error_count}")
+            print()
 
-            position_count += 1
+        return stats
 
-            if verbose and position_count % 10 == 0:
-                print(f"Processed {position_count} positions...", end="\r")
+    def _tag_batch(
+        self,
+        executor: ThreadPoolExecutor,
+        batch: List[tuple[int, Position]],
+        stats: TagStatistics,
+        verbose: bool,
+    ) -> int:
+        """
+        Tag a batch of positions concurrently and record results in order.
 
-            try:
-                result = tag_position(
-                    engine_path=self.engine_path,
-                    fen=position.fen,
-                    played_move_uci=position.played_move_uci,
-                    depth=self.depth,
-                    multipv=self.multipv,
-                    engine_mode=self.engine_mode,
-                    engine_url=self.engine_url,
-                )
-                stats.add_result(result)
+        Returns:
+            Number of positions that failed
+        """
+        futures = [
+            executor.submit(
+                tag_position,
+                engine_path=self.engine_path,
+                fen=position.fen,
+                played_move_uci=position.played_move_uci,
+                depth=self.depth,
+                multipv=self.multipv,
+                engine_mode=self.engine_mode,
+                engine_url=self.engine_url,
+            )
+            for _, position in batch
+        ]
 
+        error_count = 0
+        for (position_number, position), future in zip(batch, futures):
+            try:
+                stats.add_result(future.result())
             except Exception as e:
                 error_count += 1
                 if verbose:
                     print(
-                        f"\nError at position {position_count} "
+                        f"\nError at position {position_number} "
                         f"(Game {position.game_index}, Move {position.move_number}): {e}"
                     )
-
-        if verbose:
-            print(f"\nCompleted: {position_count} positions processed")
-            if error_count > 0:
-                print(f"Errors encountered: {error_count}")
-            print()
-
-        return stats
+        return error_count
 
     def run_and_save(
         self,
@@ -202,8 +280,7 @@ class AnalysisPipeline:
                 "tag_counts": dict(stats.tag_counts),
                 "tag_percentages": stats.get_percentages(),
             }
-            with open(json_path, "w") as f:
-                json.dump(json_data, f, indent=2)
+            write_json(json_path, json_data)
             if verbose:
                 print(f"JSON data saved to: {json_path}")
 
@@ -213,57 +290,182 @@ class AnalysisPipeline:
     BATCH_TIMEOUT_SECONDS = 30.0
     PER_NODE_TIMEOUT_MS = 50.0
     MAX_CONSECUTIVE_ERRORS = 5
-    MAX_CONCURRENCY = 5
+    # Default in-flight engine calls for http mode (local mode uses CPU count)
+    HTTP_MAX_CONCURRENCY = 32
+    TAG_CACHE_MAX = 10_000
+    # How long an http node waits for its group's batched engine request
+    # before falling back to its own
+    PREFETCH_WAIT_SECONDS = 2.0
+    # adaptive_depth settings for quiet fen-index moves
+    QUIET_DEPTH_REDUCTION = 4
+    QUIET_MIN_DEPTH = 8
+    QUIET_MULTIPV = 2
+
+    def _prefetch_engine_batch(self, entries: List[NodeFenEntry]) -> int:
+        """
+        Fetch engine lines for a group of nodes in one HTTP request.
 
-    async def _analyze_entry(self, entry: NodeFenEntry) -> tuple[NodeTagResult, float | None]:
+        Covers both engine calls tag_position makes per node (candidates
+        before the move, eval after it). Nodes whose tags are already cached
+        are left out. Best effort: on any failure the nodes fall back to
+        their own requests.
+        """
+        positions: list[tuple[str, int, int]] = []
+        for entry in entries:
+            if not entry.uci:
+                continue
+            depth, multipv = self._engine_settings(entry)
+            if self._lookup_cached_tags(entry, depth, multipv, disk=True) is not None:
+                continue
+            try:
+                board = entry.board.copy(stack=False) if entry.board else chess.Board(entry.fen)
+                positions.append((board.fen(), depth, multipv))
+                board.push_uci(entry.uci)
+                # Finished games are scored without the engine
+                if terminal_score_cp(board) is None:
+                    positions.append((board.fen(), depth, 1))
+            except ValueError:
+                continue
+        if not positions:
+            return 0
+        try:
+            client = HTTPStockfishClient(base_url=self.engine_url or DEFAULT_ENGINE_URL)
+            return client.prefetch(positions)
+        except Exception as e:
+            logger.debug("Batch prefetch failed, using per-node requests: %s", e)
+            return 0
+
+    def _engine_settings(self, entry: NodeFenEntry) -> tuple[int, int]:
+        """
+        Depth and MultiPV to analyze a fen-index node with.
+
+        With ``adaptive_depth``, quiet moves (side to move not in check, and
+        the move is no capture, promotion or check) drop to
+        QUIET_DEPTH_REDUCTION plies less (not below QUIET_MIN_DEPTH) and at
+        most QUIET_MULTIPV lines. Unparseable nodes keep the full settings.
+        """
+        if not self.adaptive_depth or not entry.uci:
+            return self.depth, self.multipv
+        try:
+            # gives_check pushes/pops, and entry.board is shared across threads
+            board = entry.board.copy(stack=False) if entry.board else chess.Board(entry.fen)
+            move = chess.Move.from_uci(entry.uci)
+            tactical = (
+                board.is_check()
+                or move.promotion is not None
+                or board.is_capture(move)
+                or board.gives_check(move)
+            )
+        except ValueError:
+            return self.depth, self.multipv
+        if tactical:
+            return self.depth, self.multipv
+        depth = max(self.QUIET_MIN_DEPTH, self.depth - self.QUIET_DEPTH_REDUCTION)
+        return min(self.depth, depth), min(self.multipv, self.QUIET_MULTIPV)
+
+    def _tag_entry(self, entry: NodeFenEntry, depth: int, multipv: int) -> List[str]:
+        """
+        Primary tags for one node, from the on-disk cache or tag_position.
+
+        Runs in a worker thread, once per unique (position, move), so the
+        SQLite lookup and store stay off the event loop. Duplicate nodes and
+        cache hits share the returned list, so treat NodeTagResult.tags as
+        read-only.
+        """
+        disk_key = None
+        if self._disk_cache is not None:
+            disk_key = TagCache.make_key(entry.key, entry.uci, depth, multipv)
+            tags = self._disk_cache.get(disk_key)
+            if tags is not None:
+                return tags
+        result = tag_position(
+            engine_path=self.engine_path,
+            fen=entry.fen,
+            played_move_uci=entry.uci,
+            depth=depth,
+            multipv=multipv,
+            engine_mode=self.engine_mode,
+            engine_url=self.engine_url,
+            board=entry.board,
+        )
+        tags = get_primary_tags(result)
+        if disk_key is not None:
+            self._disk_cache.put(disk_key, tags)
+        return tags
+
+    def _lookup_cached_tags(
+        self, entry: NodeFenEntry, depth: int, multipv: int, disk: bool = False
+    ) -> Optional[List[str]]:
+        """
+        Tags from the in-memory cache and, with ``disk``, the on-disk one.
+
+        Only worker threads pass ``disk=True``: SQLite reads block.
+        """
+        tags = self._tag_cache.get((entry.key, entry.uci, depth, multipv))
+        if tags is None and disk and self._disk_cache is not None:
+            tags = self._disk_cache.get(TagCache.make_key(entry.key, entry.uci, depth, multipv))
+        return tags
+
+    def _store_memory_tags(self, cache_key: tuple[str, str, int, int], tags: List[str]) -> None:
+        if len(self._tag_cache) >= self.TAG_CACHE_MAX:
+            self._tag_cache.clear()
+        self._tag_cache[cache_key] = tags
+
+    async def _analyze_entry(
+        self,
+        entry: NodeFenEntry,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> NodeTagResult:
+        """
+        Tag one node; ``elapsed_ms`` is the worker-thread time, 0.0 for a
+        cache hit and None for a node without a move.
+
+        Only the in-memory cache is checked here, on the event loop; the
+        on-disk TagCache is read and written by _tag_entry in the executor.
+        Finished tags land in both so later runs skip the engine.
+        """
         if not entry.uci:
-            return (
-                NodeTagResult(
-                    node_id=entry.node_id,
-                    fen=entry.fen,
-                    move_uci=None,
-                    tags=[],
-                    features={},
-                ),
-                None,
+            return NodeTagResult(
+                node_id=entry.node_id,
+                fen=entry.fen,
+                move_uci=None,
+                tags=[],
+                features={},
+            )
+
+        depth, multipv = self._engine_settings(entry)
+        cached_tags = self._lookup_cached_tags(entry, depth, multipv)
+        if cached_tags is not None:
+            return NodeTagResult(
+                node_id=entry.node_id,
+                fen=entry.fen,
+                move_uci=entry.uci,
+                tags=cached_tags,
+                features={},
+                elapsed_ms=0.0,
             )
 
         loop = asyncio.get_running_loop()
-        start = time.time()
+        start = time.perf_counter_ns()
         try:
-            result = await loop.run_in_executor(
-                None,
-                partial(
-                    tag_position,
-                    engine_path=self.engine_path,
-                    fen=entry.fen,
-                    played_move_uci=entry.uci,
-                    depth=self.depth,
-                    multipv=self.multipv,
-                    engine_mode=self.engine_mode,
-                    engine_url=self.engine_url,
-                ),
-            )
-            node_result = NodeTagResult(
+            tags = await loop.run_in_executor(executor, self._tag_entry, entry, depth, multipv)
+            self._store_memory_tags((entry.key, entry.uci, depth, multipv), tags)
+            return NodeTagResult(
                 node_id=entry.node_id,
                 fen=entry.fen,
                 move_uci=entry.uci,
-                tags=get_primary_tags(result),
+                tags=tags,
                 features={},
+                elapsed_ms=(time.perf_counter_ns() - start) / 1e6,
             )
-            elapsed_ms = (time.time() - start) * 1000
-            return node_result, elapsed_ms
         except Exception as e:
-            elapsed_ms = (time.time() - start) * 1000
             logger.warning(f"Error analyzing node {entry.node_id}: {e}")
-            return (
-                NodeTagResult(
-                    node_id=entry.node_id,
-                    fen=entry.fen,
-                    move_uci=entry.uci,
-                    error=str(e),
-                ),
-                elapsed_ms,
+            return NodeTagResult(
+                node_id=entry.node_id,
+                fen=entry.fen,
+                move_uci=entry.uci,
+                error=str(e),
+                elapsed_ms=(time.perf_counter_ns() - start) / 1e6,
             )
 
     async def run_fen_index(
@@ -280,7 +482,8 @@ class AnalysisPipeline:
         Uses tag_position for full tag logic and returns NodeTagResult.
         """
         batch_timeout = batch_timeout or self.BATCH_TIMEOUT_SECONDS
-        start_time = time.time()
+        # Monotonic: a wall-clock adjustment must not trip the batch timeout
+        start_time = time.perf_counter()
 
         if verbose:
             logger.info(f"Starting FEN index analysis (timeout={batch_timeout}s)")
@@ -305,90 +508,149 @@ class AnalysisPipeline:
             if verbose:
                 logger.info(f"Limited to {max_positions} positions")
 
-        results: List[NodeTagResult] = []
+        results: List[Optional[NodeTagResult]] = [None] * len(entries)
         error_count = 0
         timeout_count = 0
         consecutive_errors = 0
+        completed = 0
         degraded_mode = False
         slow_nodes: list[tuple[str, float]] = []
-
-        for i in range(0, len(entries), self.MAX_CONCURRENCY):
-            elapsed = time.time() - start_time
-            if elapsed > batch_timeout:
-                if verbose:
-                    logger.warning(
-                        f"Batch timeout reached ({elapsed:.1f}s > {batch_timeout}s). "
-                        f"Processed {i}/{len(entries)} nodes, skipping remaining."
+        # Progress goes to DEBUG; skip the clock read and formatting when it's off
+        log_progress = verbose and logger.isEnabledFor(logging.DEBUG)
+        # Transpositions and repeated lines: the same move from the same
+        # position at the same move number (halfmove clock ignored) is
+        # analyzed once, then fanned out
+        leaders: Dict[tuple[str, str], int] = {}
+        unique: List[int] = []
+        followers: List[tuple[int, int]] = []
+        for i, entry in enumerate(entries):
+            if entry.uci:
+                leader = leaders.setdefault((entry.key, entry.uci), i)
+                if leader != i:
+                    followers.append((i, leader))
+                    continue
+            unique.append(i)
+        if self.engine_mode == "http" and any(
+            entries[i].uci
+            and self._lookup_cached_tags(entries[i], *self._engine_settings(entries[i])) is None
+            for i in unique
+        ):
+            # Connect while the disk cache is checked; the first engine calls
+            # reuse the socket. A daemon thread, so loop shutdown never waits on it.
+            threading.Thread(
+                target=HTTPStockfishClient(base_url=self.engine_url).warm_up,
+                name="engine-warm-up",
+                daemon=True,
+            ).start()
+        # Pipelined rather than chunked: a slow node only holds its own slot
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Own pool: the loop's default executor has min(32, cpu + 4) threads,
+        # which would silently cap max_concurrency. One extra slot for prefetches.
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency + 1, thread_name_prefix="fen-index"
+        )
+        # HTTP mode: unique nodes i*BATCH_SIZE.. share one batched engine request
+        loop = asyncio.get_running_loop()
+        prefetches: Dict[int, asyncio.Future] = {}
+
+        def prefetch_group(group: int) -> asyncio.Future:
+            future = prefetches.get(group)
+            if future is None:
+                first = group * BATCH_SIZE
+                future = loop.run_in_executor(
+                    executor,
+                    self._prefetch_engine_batch,
+                    [entries[i] for i in unique[first:first + BATCH_SIZE]],
+                )
+                prefetches[group] = future
+            return future
+
+        async def analyze(slot: int, index: int, entry: NodeFenEntry) -> None:
+            nonlocal error_count, consecutive_errors, completed, degraded_mode
+            async with semaphore:
+                if degraded_mode:
+                    results[index] = NodeTagResult(
+                        node_id=entry.node_id,
+                        fen=entry.fen,
+                        move_uci=entry.uci,
+                        error="degraded_mode",
                     )
-                for remaining_entry in entries[i:]:
-                    timeout_count += 1
-                    results.append(
-                        NodeTagResult(
-                            node_id=remaining_entry.node_id,
-                            fen=remaining_entry.fen,
-                            move_uci=remaining_entry.uci,
-                            error="batch_timeout",
-                        )
+                    return
+                if self.engine_mode == "http" and entry.uci:
+                    # Bounded, and never cancels the batch: lines parked after
+                    # the deadline still serve the nodes that come later
+                    await asyncio.wait(
+                        (prefetch_group(slot // BATCH_SIZE),),
+                        timeout=self.PREFETCH_WAIT_SECONDS,
                     )
-                break
+                node_result = await self._analyze_entry(entry, executor)
 
-            chunk = entries[i : i + self.MAX_CONCURRENCY]
-            if degraded_mode:
-                for entry in chunk:
-                    results.append(
-                        NodeTagResult(
-                            node_id=entry.node_id,
-                            fen=entry.fen,
-                            move_uci=entry.uci,
-                            error="degraded_mode",
-                        )
-                    )
-                continue
+            results[index] = node_result
+            completed += 1
+            if node_result.error:
+                error_count += 1
+                consecutive_errors += 1
+            else:
+                consecutive_errors = 0
 
-            tasks = [self._analyze_entry(entry) for entry in chunk]
-            remaining_timeout = max(0.1, batch_timeout - (time.time() - start_time))
-            try:
-                chunk_results = await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=False),
-                    timeout=remaining_timeout,
+            elapsed_ms = node_result.elapsed_ms
+            if elapsed_ms is not None and elapsed_ms > self.PER_NODE_TIMEOUT_MS * 2:
+                slow_nodes.append((node_result.node_id, elapsed_ms))
+
+            if consecutive_errors >= self.MAX_CONSECUTIVE_ERRORS and not degraded_mode:
+                degraded_mode = True
+                logger.warning(
+                    f"Switching to degraded mode after {consecutive_errors} consecutive errors"
                 )
-            except asyncio.TimeoutError:
-                for entry in chunk:
-                    timeout_count += 1
-                    results.append(
-                        NodeTagResult(
-                            node_id=entry.node_id,
-                            fen=entry.fen,
-                            move_uci=entry.uci,
-                            error="batch_timeout",
-                        )
-                    )
-                break
-
-            for (node_result, elapsed_ms) in chunk_results:
-                results.append(node_result)
-                if node_result.error:
-                    error_count += 1
-                    consecutive_errors += 1
-                else:
-                    consecutive_errors = 0
-
-                if elapsed_ms is not None and elapsed_ms > self.PER_NODE_TIMEOUT_MS * 2:
-                    slow_nodes.append((node_result.node_id, elapsed_ms))
-
-                if consecutive_errors >= self.MAX_CONSECUTIVE_ERRORS and not degraded_mode:
-                    degraded_mode = True
-                    logger.warning(
-                        f"Switching to degraded mode after {consecutive_errors} consecutive errors"
-                    )
 
-            if verbose and (i + len(chunk)) % 10 == 0:
-                rate = (i + len(chunk)) / max(0.001, time.time() - start_time)
+            if log_progress and completed % 10 == 0:
+                rate = completed / max(0.001, time.perf_counter() - start_time)
                 logger.debug(
-                    f"Processed {i + len(chunk)}/{len(entries)} positions ({rate:.1f}/s)..."
+                    f"Processed {completed}/{len(unique)} unique positions ({rate:.1f}/s)..."
+                )
+
+        tasks = [
+            asyncio.create_task(analyze(slot, i, entries[i])) for slot, i in enumerate(unique)
+        ]
+        try:
+            if tasks:
+                remaining_timeout = max(0.1, batch_timeout - (time.perf_counter() - start_time))
+                _, pending = await asyncio.wait(tasks, timeout=remaining_timeout)
+                if pending:
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    if verbose:
+                        logger.warning(
+                            f"Batch timeout reached ({time.perf_counter() - start_time:.1f}s > {batch_timeout}s). "
+                            f"Processed {completed}/{len(unique)} unique nodes, skipping remaining."
+                        )
+        finally:
+            # Engine calls already running after a timeout finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+            if self._disk_cache is not None:
+                await asyncio.to_thread(self._disk_cache.flush)
+
+        for i, leader in followers:
+            shared = results[leader]
+            if shared is None:
+                continue
+            entry = entries[i]
+            results[i] = replace(shared, node_id=entry.node_id, fen=entry.fen)
+            if shared.error:
+                error_count += 1
+
+        for i, entry in enumerate(entries):
+            if results[i] is None:
+                timeout_count += 1
+                results[i] = NodeTagResult(
+                    node_id=entry.node_id,
+                    fen=entry.fen,
+                    move_uci=entry.uci,
+                    error="batch_timeout",
                 )
 
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         if verbose:
             success_count = len(entries) - error_count - timeout_count
             rate = len(entries) / total_time if total_time > 0 else 0
@@ -412,19 +674,22 @@ class AnalysisPipeline:
         max_positions: Optional[int] = None,
     ) -> List[NodeTagResult]:
         processor = FenIndexProcessor()
-        fen_index = json.loads(Path(fen_index_path).read_text(encoding="utf-8"))
+        fen_index = read_json(fen_index_path)
 
         if verbose:
             logger.info(f"Starting FEN index analysis from file: {fen_index_path}")
 
-        return asyncio.run(
-            self.run_fen_index(
-                fen_index=fen_index,
-                tree_data=None,
-                verbose=verbose,
-                max_positions=max_positions,
+        # libuv loop (when installed) is cheaper per task for the wide http fan-out
+        loop_factory = uvloop.new_event_loop if HAS_UVLOOP else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(
+                self.run_fen_index(
+                    fen_index=fen_index,
+                    tree_data=None,
+                    verbose=verbose,
+                    max_positions=max_positions,
+                )
             )
-        )
 
     async def run_fen_index_and_save(
         self,
@@ -433,9 +698,15 @@ class AnalysisPipeline:
         tree_data: Optional[Dict[str, Any]] = None,
         verbose: bool = True,
         max_positions: Optional[int] = None,
-    ) -> Dict[str, Any]:
+    ) -> Path:
         """
         Run FEN index analysis and save results to output directory.
+
+        The R2 copy (when a PgnV2Repo is configured) is uploaded in the
+        background; call close() to wait for pending uploads.
+
+        Returns:
+            Path of the written ``{chapter_id}.tags.json``
         """
         results = await self.run_fen_index(
             fen_index=fen_index,
@@ -444,46 +715,78 @@ class AnalysisPipeline:
             max_positions=max_positions,
         )
 
-        tags_output: Dict[str, Any] = {
-            "metadata": {
-                "chapter_id": chapter_id,
-                "timestamp": datetime.now().isoformat(),
-                "total_nodes": len(results),
-                "depth": self.depth,
-                "multipv": self.multipv,
-            },
-            "nodes": {},
+        metadata = {
+            "chapter_id": chapter_id,
+            "timestamp": datetime.now().isoformat(),
+            "total_nodes": len(results),
+            "depth": self.depth,
+            "multipv": self.multipv,
         }
-
-        for result in results:
-            tags_output["nodes"][result.node_id] = {
-                "tags": result.tags,
-                "features": result.features,
-                "error": result.error,
-            }
-
         output_path = self.output_dir / f"{chapter_id}.tags.json"
-        with open(output_path, "w") as f:
-            json.dump(tags_output, f, indent=2)
+        self._write_tags_json(output_path, metadata, results)
 
         if verbose:
             logger.info(f"Tags saved to: {output_path}")
 
         if self.pgn_v2_repo:
-            try:
-                self.pgn_v2_repo.save_tags_json(
-                    chapter_id=chapter_id,
-                    tags_data=tags_output,
-                    metadata={"chapter_id": chapter_id},
-                )
-                if verbose:
-                    logger.info(f"Tags also saved to R2 for chapter {chapter_id}")
-            except Exception as e:
-                logger.error(f"Failed to save tags to R2 for chapter {chapter_id}: {e}")
+            # Upload the file as written instead of re-encoding the document.
+            # Read now: a later run for the same chapter rewrites the file.
+            self._upload_pool.submit(
+                self._save_tags_to_r2, chapter_id, output_path.read_bytes(), verbose
+            )
         else:
             logger.warning("PgnV2Repo not configured, skipping R2 tags save.")
 
-        return tags_output
+        return output_path
+
+    def _save_tags_to_r2(self, chapter_id: str, tags_json: bytes, verbose: bool) -> None:
+        try:
+            self.pgn_v2_repo.save_tags_json(
+                chapter_id=chapter_id,
+                metadata={"chapter_id": chapter_id},
+                tags_json=tags_json,
+            )
+            if verbose:
+                logger.info(f"Tags also saved to R2 for chapter {chapter_id}")
+        except Exception as e:
+            logger.error(f"Failed to save tags to R2 for chapter {chapter_id}: {e}")
+
+    def close(self) -> None:
+        """
+        Wait for pending R2 uploads and flush the on-disk tag cache.
+
+        The cache itself is shared and stays open until
+        close_shared_tag_caches().
+        """
+        self._upload_pool.shutdown(wait=True)
+        if self._disk_cache is not None:
+            self._disk_cache.flush()
+            self._disk_cache = None
+
+    @staticmethod
+    def _write_tags_json(
+        output_path: Path, metadata: Dict[str, Any], results: List[NodeTagResult]
+    ) -> None:
+        """
+        Write ``{"metadata": ..., "nodes": {node_id: ...}}`` one node per line.
+
+        Nodes are encoded and written as they are visited, so the whole
+        ``nodes`` mapping never exists as Python dicts or as one JSON string.
+        """
+        with open(output_path, "wb") as f:
+            f.write(b'{"metadata":' + dumps(metadata) + b',"nodes":{')
+            separator = b"\n"
+            for result in results:
+                f.write(separator)
+                f.write(dumps(result.node_id))
+                f.write(b":")
+                f.write(dumps({
+                    "tags": result.tags,
+                    "features": result.features,
+                    "error": result.error,
+                }))
+                separator = b",\n"
+            f.write(b"\n}}\n")
 
 
 __all__ = ["AnalysisPipeline"]
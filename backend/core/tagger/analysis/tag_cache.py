@@ -0,0 +1,144 @@
+"""
+Persistent cache of primary tags per position and move.
+
+Chapters are re-tagged whenever their tree is edited, but the tags for a
+given position, move, engine depth/MultiPV and tagger version never
+change. Entries live in a single SQLite table so repeat runs (and other
+processes sharing the file) skip the engine. Any SQLite error is treated
+as a miss so tagging never depends on the cache file.
+
+Pipelines are usually built per request, so they open the file through
+open_shared_tag_cache() and the application calls close_shared_tag_caches()
+on shutdown.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..versioning import CURRENT_VERSION
+from .json_io import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+
+class TagCache:
+    """SQLite-backed (key -> primary tags) store with batched writes."""
+
+    # Pending writes are committed together to amortize the fsync
+    FLUSH_EVERY = 32
+
+    def __init__(self, path: str | Path):
+        """
+        Open (or create) the cache file.
+
+        Args:
+            path: SQLite database file
+
+        Raises:
+            sqlite3.Error: If the file cannot be opened
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._pending: Dict[bytes, bytes] = {}
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tag_cache (key BLOB PRIMARY KEY, value BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(position: str, uci: str, depth: int, multipv: int) -> bytes:
+        """
+        Hash position, move, engine settings and tagger version.
+
+        ``position`` is a position_key() (NodeFenEntry.key): the FEN without
+        its halfmove clock. The fullmove number stays in, since some
+        detectors read it.
+        """
+        raw = f"{position}|{uci}|{depth}|{multipv}|{CURRENT_VERSION}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[List[str]]:
+        """Return cached tags, or None on a miss."""
+        with self._lock:
+            value = self._pending.get(key)
+            if value is None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT value FROM tag_cache WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    logger.warning("Tag cache read failed: %s", e)
+                    return None
+                if row is None:
+                    return None
+                value = row[0]
+        return loads(value)
+
+    def put(self, key: bytes, tags: List[str]) -> None:
+        """Queue tags for writing; flushed every FLUSH_EVERY entries."""
+        with self._lock:
+            self._pending[key] = dumps(tags)
+            if len(self._pending) >= self.FLUSH_EVERY:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Write queued entries."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush and close the database."""
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        try:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tag_cache (key, value) VALUES (?, ?)",
+                self._pending.items(),
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Tag cache write failed, dropping %d entries: %s", len(self._pending), e)
+        self._pending.clear()
+
+
+_shared: Dict[Path, TagCache] = {}
+_shared_lock = threading.Lock()
+
+
+def open_shared_tag_cache(path: str | Path) -> TagCache:
+    """
+    Return the process-wide TagCache for ``path``, opening it on first use.
+
+    Raises:
+        sqlite3.Error: If the file cannot be opened
+    """
+    key = Path(path).resolve()
+    with _shared_lock:
+        cache = _shared.get(key)
+        if cache is None:
+            cache = _shared[key] = TagCache(key)
+        return cache
+
+
+def close_shared_tag_caches() -> None:
+    """Flush and close every cache opened by open_shared_tag_cache()."""
+    with _shared_lock:
+        caches = list(_shared.values())
+        _shared.clear()
+    for cache in caches:
+        cache.close()
+
+
+__all__ = ["TagCache", "open_shared_tag_cache", "close_shared_tag_caches"]
@@ -3,11 +3,18 @@ Tag statistics collection and calculation.
 """
 
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from operator import itemgetter
 from typing import Dict, List
 
 from ..tag_result import TagResult
 
+# Boolean tag flags on TagResult (annotations are strings under
+# `from __future__ import annotations`), resolved once at import
+_TAG_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in fields(TagResult) if f.type in (bool, "bool")
+)
+
 
 @dataclass
 class TagStatistics:
@@ -25,26 +32,10 @@ class TagStatistics:
         """
         self.total_positions += 1
 
-        # Iterate through all boolean tag fields
-        for field_name in dir(result):
-            # Skip private/magic attributes and non-tag fields
-            if field_name.startswith('_'):
-                continue
-            if field_name in ['played_move', 'played_kind', 'best_move', 'best_kind',
-                            'eval_before', 'eval_played', 'eval_best', 'delta_eval',
-                            'metrics_before', 'metrics_played', 'metrics_best',
-                            'component_deltas', 'opp_metrics_before', 'opp_metrics_played',
-                            'opp_metrics_best', 'opp_component_deltas', 'coverage_delta',
-                            'tactical_weight', 'mode', 'analysis_context', 'notes',
-                            'control_over_dynamics_subtype', 'prophylaxis_score',
-                            'maneuver_precision_score', 'maneuver_timing_score',
-                            'prepare_quality_score', 'prepare_consensus_score',
-                            'control_schema_version']:
-                continue
-
-            value = getattr(result, field_name, None)
-            if isinstance(value, bool) and value:
-                self.tag_counts[field_name] += 1
+        tag_counts = self.tag_counts
+        for name in _TAG_FIELDS:
+            if getattr(result, name):
+                tag_counts[name] += 1
 
     def get_percentages(self) -> Dict[str, float]:
         """
@@ -56,11 +47,8 @@ class TagStatistics:
         if self.total_positions == 0:
             return {}
 
-        percentages = {}
-        for tag, count in self.tag_counts.items():
-            percentages[tag] = (count / self.total_positions) * 100
-
-        return percentages
+        scale = 100 / self.total_positions
+        return {tag: count * scale for tag, count in self.tag_counts.items()}
 
     def get_sorted_percentages(self) -> List[tuple[str, float, int]]:
         """
@@ -69,12 +57,15 @@ class TagStatistics:
         Returns:
             List of tuples (tag_name, percentage, count)
         """
-        percentages = self.get_percentages()
-        return sorted(
-            [(tag, pct, self.tag_counts[tag]) for tag, pct in percentages.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )
+        if self.total_positions == 0:
+            return []
+
+        # Percentage is proportional to count: sort once on the int counts
+        scale = 100 / self.total_positions
+        return [
+            (tag, count * scale, count)
+            for tag, count in sorted(self.tag_counts.items(), key=itemgetter(1), reverse=True)
+        ]
 
     def format_report(self) -> str:
         """
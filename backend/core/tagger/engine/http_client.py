@@ -2,12 +2,55 @@
 HTTP-based Stockfish client for remote engine calls.
 Implements the same interface as StockfishClient for compatibility.
 """
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Any, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import chess
 from ..models import Candidate
+from .terminal import terminal_score_cp
 from core.config import settings
 
+# One pooled keep-alive session shared by every client instance: tag_position
+# builds a fresh client per call, and a per-call requests.post() would pay a
+# new TCP/TLS handshake for every engine request.
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# Positions sent per /analyze/batch request
+BATCH_SIZE = 16
+# Status codes meaning the engine service has no batch endpoint
+_BATCH_UNSUPPORTED_STATUS = (404, 405, 501)
+_BATCH_UNSUPPORTED: set[str] = set()
+# (base_url, fen, depth, multipv) -> parsed multipv data, read by _post_analyze.
+# Entries are kept rather than consumed: sibling nodes share the parent's
+# position and each of them reads it. _PREFETCHED_MAX bounds memory.
+_PREFETCHED: Dict[Tuple[str, str, int, int], Dict[int, Dict[str, Any]]] = {}
+_PREFETCHED_MAX = 10_000
+
+
+def _shared_session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                # Retry only failures to connect (refused/unreachable), for any
+                # method. Read timeouts are not resent: a slow engine would
+                # otherwise see each analysis up to three times, and read=False
+                # surfaces the original ReadTimeout instead of a ConnectionError.
+                retries = Retry(
+                    total=2, connect=2, read=False, backoff_factor=0.1, allowed_methods=None
+                )
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retries)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["Connection"] = "keep-alive"
+                _SESSION = session
+    return _SESSION
+
 
 class HTTPStockfishClient:
     """Client for remote Stockfish engine via HTTP."""
@@ -58,7 +101,7 @@ class HTTPStockfishClient:
         if "/engine" in self.base_url:
             multipv_data = self._post_analyze(fen=fen, depth=depth, multipv=multipv)
         else:
-            resp = requests.get(
+            resp = _shared_session().get(
                 f"{self.base_url}/analyze/stream",
                 params={"fen": fen, "depth": depth, "multipv": multipv},
                 timeout=self.timeout,
@@ -125,6 +168,9 @@ class HTTPStockfishClient:
         """
         board_copy = board.copy()
         board_copy.push(move)
+        terminal = terminal_score_cp(board_copy)
+        if terminal is not None:
+            return terminal
         fen = board_copy.fen()
 
         if "/engine" in self.base_url:
@@ -132,41 +178,126 @@ class HTTPStockfishClient:
             if 1 in multipv_data:
                 return multipv_data[1]["score_cp"]
         else:
-            resp = requests.get(
+            # Closing the response hands the connection back to the pool
+            # even when we return before the stream is exhausted
+            with _shared_session().get(
                 f"{self.base_url}/analyze/stream",
                 params={"fen": fen, "depth": depth, "multipv": 1},
                 timeout=self.timeout,
                 stream=True,
+            ) as resp:
+                resp.raise_for_status()
+
+                # Parse best line score
+                for line in resp.iter_lines():
+                    if not line:
+                        continue
+                    decoded = line.decode("utf-8") if isinstance(line, bytes) else line
+                    if decoded.startswith("data: "):
+                        content = decoded[6:]
+                        if content.startswith("info "):
+                            parsed = self._parse_uci_info(content)
+                            if parsed and parsed["multipv"] == 1:
+                                return parsed["score_cp"]
+
+        return 0
+
+    def prefetch(self, positions: List[Tuple[str, int, int]]) -> int:
+        """
+        Analyze many positions with one /analyze/batch request per BATCH_SIZE.
+
+        Results are parked for the matching _post_analyze call, so tag_position
+        picks them up without another round trip. The requests are sent
+        concurrently. Services without a batch
+        endpoint (404/405/501) are remembered and left to the per-position path.
+
+        Args:
+            positions: (fen, depth, multipv) tuples, fen as produced by board.fen()
+
+        Returns:
+            Number of positions prefetched
+        """
+        if "/engine" not in self.base_url or self.base_url in _BATCH_UNSUPPORTED:
+            return 0
+
+        pending = list(dict.fromkeys(
+            p for p in positions if (self.base_url, *p) not in _PREFETCHED
+        ))
+        if len(_PREFETCHED) + len(pending) > _PREFETCHED_MAX:
+            _PREFETCHED.clear()
+
+        chunks = [pending[i:i + BATCH_SIZE] for i in range(0, len(pending), BATCH_SIZE)]
+        if len(chunks) <= 1:
+            return sum(self._post_batch(chunk) for chunk in chunks)
+        # One slow batch must not hold back the others
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            return sum(pool.map(self._post_batch, chunks))
+
+    def _post_batch(self, chunk: List[Tuple[str, int, int]]) -> int:
+        resp = _shared_session().post(
+            f"{self.base_url}/analyze/batch",
+            json={"batch": [
+                {"fen": fen, "depth": depth, "multipv": multipv}
+                for fen, depth, multipv in chunk
+            ]},
+            timeout=self.timeout,
+            headers=self._auth_headers(),
+        )
+        if resp.status_code in _BATCH_UNSUPPORTED_STATUS:
+            _BATCH_UNSUPPORTED.add(self.base_url)
+            return 0
+        resp.raise_for_status()
+        results = resp.json().get("results", [])
+        if len(results) != len(chunk):
+            return 0
+        for (fen, depth, multipv), result in zip(chunk, results):
+            _PREFETCHED[(self.base_url, fen, depth, multipv)] = self._parse_info_lines(
+                result.get("info", [])
             )
-            resp.raise_for_status()
+        return len(chunk)
 
-            # Parse best line score
-            for line in resp.iter_lines():
-                if not line:
-                    continue
-                decoded = line.decode("utf-8") if isinstance(line, bytes) else line
-                if decoded.startswith("data: "):
-                    content = decoded[6:]
-                    if content.startswith("info "):
-                        parsed = self._parse_uci_info(content)
-                        if parsed and parsed["multipv"] == 1:
-                            return parsed["score_cp"]
+    def warm_up(self, timeout: float = 2.0) -> bool:
+        """
+        Open a pooled connection to the engine service ahead of real work.
 
-        return 0
+        Sends GET {base_url}/health so DNS lookup and the TCP/TLS handshake
+        are done before the first analysis request. Best effort.
 
-    def _post_analyze(self, fen: str, depth: int, multipv: int) -> Dict[int, Dict[str, Any]]:
-        headers = {}
+        Returns:
+            True if the service answered
+        """
+        try:
+            with _shared_session().get(
+                f"{self.base_url}/health",
+                timeout=timeout,
+                headers=self._auth_headers(),
+            ):
+                return True
+        except requests.RequestException:
+            return False
+
+    @staticmethod
+    def _auth_headers() -> Dict[str, str]:
         if settings.WORKER_API_TOKEN:
-            headers["Authorization"] = f"Bearer {settings.WORKER_API_TOKEN}"
-        resp = requests.post(
+            return {"Authorization": f"Bearer {settings.WORKER_API_TOKEN}"}
+        return {}
+
+    def _post_analyze(self, fen: str, depth: int, multipv: int) -> Dict[int, Dict[str, Any]]:
+        prefetched = _PREFETCHED.get((self.base_url, fen, depth, multipv), None)
+        if prefetched is not None:
+            return prefetched
+
+        resp = _shared_session().post(
             f"{self.base_url}/analyze",
             json={"fen": fen, "depth": depth, "multipv": multipv},
             timeout=self.timeout,
-            headers=headers,
+            headers=self._auth_headers(),
         )
         resp.raise_for_status()
         payload = resp.json()
-        info_lines = payload.get("info", [])
+        return self._parse_info_lines(payload.get("info", []))
+
+    def _parse_info_lines(self, info_lines: List[Any]) -> Dict[int, Dict[str, Any]]:
         multipv_data: Dict[int, Dict[str, Any]] = {}
         for line in info_lines:
             if not isinstance(line, str):
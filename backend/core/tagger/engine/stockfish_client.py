@@ -6,6 +6,7 @@ from typing import Dict, List, Tuple, Any, Optional
 import chess
 import chess.engine
 from ..models import Candidate
+from .terminal import terminal_score_cp
 from ..config.engine import DEFAULT_STOCKFISH_PATH
 
 
@@ -117,6 +118,13 @@ class StockfishClient:
         board_copy = board.copy()
         board_copy.push(move)
 
+        terminal = terminal_score_cp(board_copy)
+        if terminal is not None:
+            # Same conversion as the engine's "score mate 0" / "score cp 0"
+            score = chess.engine.Mate(0) if terminal else chess.engine.Cp(0)
+            pov = chess.engine.PovScore(score, board_copy.turn)
+            return self._score_to_cp(pov, board_copy.turn)
+
         # Analyze the resulting position
         info = self._engine.analyse(
             board_copy,
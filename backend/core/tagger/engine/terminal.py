@@ -0,0 +1,32 @@
+"""
+Engine-free scores for finished positions.
+
+Checkmate, stalemate and dead-draw material have a fixed evaluation, so
+the clients answer them locally instead of asking Stockfish.
+"""
+from typing import Optional
+import chess
+
+# "score mate 0": the side to move is checkmated
+MATED_SCORE_CP = -10000
+
+
+def terminal_score_cp(board: chess.Board) -> Optional[int]:
+    """
+    Score a finished position from the side to move's point of view.
+
+    Args:
+        board: Position to check
+
+    Returns:
+        MATED_SCORE_CP for checkmate, 0 for stalemate or insufficient
+        material, None if the game goes on
+    """
+    if board.is_checkmate():
+        return MATED_SCORE_CP
+    if board.is_stalemate() or board.is_insufficient_material():
+        return 0
+    return None
+
+
+__all__ = ["MATED_SCORE_CP", "terminal_score_cp"]
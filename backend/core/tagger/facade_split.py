@@ -116,6 +116,7 @@ def tag_position(
     multipv: int = DEFAULT_MULTIPV,
     engine_mode: Literal["local", "http"] = "http",
     engine_url: Optional[str] = None,
+    board: Optional[chess.Board] = None,
 ) -> TagResult:
     """
     Tag a chess position and move.
@@ -130,6 +131,7 @@ def tag_position(
         multipv: Number of principal variations to analyze
         engine_mode: "local" for local Stockfish, "http" for remote service
         engine_url: Remote engine URL (for http mode, defaults to ENGINE_URL env var)
+        board: Optional pre-parsed position matching ``fen``; copied, never mutated
 
     Returns:
         TagResult with all detected tags and analysis
@@ -142,8 +144,12 @@ def tag_position(
         path = engine_path or DEFAULT_STOCKFISH_PATH
         engine_client = StockfishClient(engine_path=path)
 
-    # Parse position and move
-    board = chess.Board(fen)
+    # Parse position and move (a cheap copy when the caller already parsed it)
+    if board is not None:
+        board = board.copy(stack=False)
+        fen = fen or board.fen()
+    else:
+        board = chess.Board(fen)
     played_move = chess.Move.from_uci(played_move_uci)
 
     # Validate move is legal
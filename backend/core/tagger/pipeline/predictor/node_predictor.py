@@ -14,7 +14,7 @@ from ..runner import TaggingPipeline
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeTagResult:
     """Result of tagging a single node."""
     node_id: str
@@ -23,6 +23,8 @@ class NodeTagResult:
     tags: List[str] = field(default_factory=list)
     features: Dict[str, Any] = field(default_factory=dict)
     error: Optional[str] = None
+    # Wall time spent tagging this node, when it went through the engine
+    elapsed_ms: Optional[float] = None
 
 
 class NodePredictor:
@@ -26,6 +26,7 @@ from modules.workspace.api.router import api_router as workspace_router
 from core.log.log_api import logger
 from core.config import settings
 from modules.workspace.db.session import init_db as init_workspace_db
+from backend.core.tagger.analysis.tag_cache import close_shared_tag_caches
 
 
 async def _init_workspace_db() -> None:
@@ -118,6 +119,7 @@ async def lifespan(app: FastAPI):
                 await task
             except asyncio.CancelledError:
                 pass
+        close_shared_tag_caches()
 
 
 # Create FastAPI application
@@ -29,6 +29,7 @@ from modules.workspace.storage.integrity import calculate_sha256, calculate_size
 from modules.workspace.storage.keys import R2Keys
 from modules.workspace.storage.r2_client import R2Client
 from modules.workspace.db.session import get_db_config
+from backend.core.config import settings
 
 # New v2 imports
 from backend.core.real_pgn.parser import parse_pgn
@@ -96,6 +97,7 @@ class ChapterImportService:
             pgn_path="", # Dummy path, not used for fen_index analysis
             output_dir="/tmp", # Dummy output dir, not used for R2 save
             pgn_v2_repo=self.pgn_v2_repo,
+            tag_cache_path=settings.TAGGER_TAG_CACHE_PATH or None,
         )
 
     async def import_pgn(
@@ -619,4 +621,4 @@ class ChapterImportService:
 
     def _header_value(self, game: PGNGame, key: str, default: str) -> str:
         """Resolve a PGN header value with a fallback."""
-        return game.headers.get(key, default)
+        return game.get_header(key, default)
@@ -28,6 +28,7 @@ from modules.workspace.domain.services.pgn_sync_service import PgnSyncService
 from backend.core.tagger.analysis.pipeline import AnalysisPipeline # New Import
 from modules.workspace.pgn_v2.repo import PgnV2Repo # New Import
 from modules.workspace.storage.r2_client import create_r2_client_from_env # New Import
+from backend.core.config import settings
 
 
 class InvalidMoveError(Exception):
@@ -113,6 +114,7 @@ class StudyService:
                 pgn_path="",  # Dummy path
                 output_dir="/tmp",  # Dummy output dir
                 pgn_v2_repo=pgn_v2_repo,
+                tag_cache_path=settings.TAGGER_TAG_CACHE_PATH or None,
             )
 
     async def _sync_pgn(self, chapter_id: str) -> None:
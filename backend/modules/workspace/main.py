@@ -20,6 +20,7 @@ from core.config import settings
 from modules.workspace.api.router import api_router
 from modules.workspace.db.session import init_db as init_workspace_db
 from modules.workspace.db.session import engine, Base
+from backend.core.tagger.analysis.tag_cache import close_shared_tag_caches
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -92,6 +93,7 @@ async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("Shutting down workspace API...")
     await engine.dispose()
+    close_shared_tag_caches()
 
 
 @app.get("/health")
@@ -7,7 +7,7 @@ if splitting into multiple studies is needed.
 
 from dataclasses import dataclass
 
-from core.new_pgn import PGNGame, detect_games
+from core.new_pgn import PGNGame, iter_games
 
 
 # Maximum chapters per study (Lichess limit)
@@ -50,9 +50,9 @@ def detect_chapters(pgn_content: str, fast: bool = True) -> ChapterDetectionResu
     """
     # Count total chapters
     if fast:
-        total = len(detect_games(pgn_content))
+        total = sum(1 for _ in iter_games(pgn_content))
     else:
-        total = len(detect_games(pgn_content))
+        total = sum(1 for _ in iter_games(pgn_content))
 
     # Determine if split needed
     requires_split = total > MAX_CHAPTERS_PER_STUDY
@@ -204,16 +204,19 @@ class PgnV2Repo:
     def save_tags_json(
         self,
         chapter_id: str,
-        tags_data: Dict[str, Any],
+        tags_data: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, str]] = None,
+        tags_json: Optional[str | bytes] = None,
     ) -> UploadResult:
         """
         Save tags JSON to R2 (tagger output).
 
         Args:
             chapter_id: Chapter identifier
-            tags_data: Tags data dict (node_id -> tags mapping)
+            tags_data: Tags data dict (node_id -> tags mapping), encoded here
             metadata: Optional metadata dict
+            tags_json: Already-encoded tags document, uploaded as-is
+                (takes precedence over tags_data)
 
         Returns:
             UploadResult with upload details
@@ -221,7 +224,8 @@ class PgnV2Repo:
         key = R2Keys.chapter_tags_json(chapter_id)
         logger.debug(f"Saving tags JSON to {key}")
 
-        tags_json = json.dumps(tags_data, ensure_ascii=False, indent=2)
+        if tags_json is None:
+            tags_json = json.dumps(tags_data, ensure_ascii=False, indent=2)
 
         result = self.r2_client.upload_json(
             key=key,
@@ -12,6 +12,7 @@ from sqlalchemy import and_
 
 from core.config import settings
 from core.security.password import hash_password, verify_password
+from core.security.current_user import invalidate_cached_user
 from models.verification_code import VerificationCode
 from models.user import User
 
@@ -222,6 +223,7 @@ class SignupVerificationService:
         # SECURITY FIX: Now properly persists verification status
         user.is_verified = True
         db.commit()
+        invalidate_cached_user(user.id)
 
         logger.info(f"User marked as verified", extra={"user_id": str(user_id)})
         return True
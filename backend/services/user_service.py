@@ -16,6 +16,7 @@ Does NOT handle:
 from sqlalchemy.orm import Session
 from models.user import User
 from core.security.password import hash_password, verify_password
+from core.security.current_user import invalidate_cached_user
 from core.log.log_service import logger
 from core.errors import UserAlreadyExistsError, InvalidCredentialsError, UserInactiveError
 import uuid
@@ -188,6 +189,7 @@ def update_user_profile(db: Session, user_id: uuid.UUID | str, update_data: dict
 
     db.commit()
     db.refresh(user)
+    invalidate_cached_user(user_id)
 
     logger.info(f"User profile updated successfully: {user.username} (id={user.id})")
     return user
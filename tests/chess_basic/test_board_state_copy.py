@@ -0,0 +1,54 @@
+"""
+test_board_state_copy.py
+棋盘状态复制与复用测试
+
+BoardState copy/reuse tests.
+"""
+
+from backend.core.chess_basic.types import BoardState, Move, Square
+from backend.core.chess_basic.utils.fen import board_to_fen, get_starting_position, parse_fen
+from backend.core.orchestration.core_session import CoreSession
+from backend.core.orchestration.policies import AnalysisPolicy
+
+
+class TestCopyInto:
+    """copy_into 测试 copy_into tests"""
+
+    def test_copy_into_matches_source(self):
+        """复制后 FEN 相同 Copy has the same FEN"""
+        source = parse_fen("r3k2r/8/8/3pP3/8/8/8/R3K2R w Kq d6 3 17")
+        target = BoardState()
+        assert source.copy_into(target) is target
+        assert board_to_fen(target) == board_to_fen(source)
+
+    def test_copy_into_is_independent(self):
+        """修改副本不影响原状态 Mutating the copy leaves the source untouched"""
+        source = get_starting_position()
+        target = source.copy_into(BoardState())
+        target.set_piece(Square.from_algebraic("e2"), None)
+        target.castling_rights.white_kingside = False
+
+        assert source.get_piece(Square.from_algebraic("e2")) is not None
+        assert source.castling_rights.white_kingside is True
+
+
+class TestSessionStateReuse:
+    """会话悔棋复用状态测试 Session takeback with recycled states"""
+
+    def test_takeback_and_replay_restore_positions(self):
+        """悔棋后重走得到相同局面 Takeback then replay gives the same positions"""
+        session = CoreSession(policy=AnalysisPolicy())
+        moves = [Move.from_uci(uci) for uci in ("e2e4", "e7e5", "g1f3", "b8c6")]
+        fens = [session.get_fen()]
+        for move in moves:
+            session.submit_move(move)
+            fens.append(session.get_fen())
+
+        for expected in reversed(fens[:-1]):
+            assert session.takeback()
+            assert session.get_fen() == expected
+
+        # Replaying reuses the recycled states
+        for move, expected in zip(moves, fens[1:]):
+            session.submit_move(move)
+            assert session.get_fen() == expected
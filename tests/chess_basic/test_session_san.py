@@ -0,0 +1,78 @@
+"""
+test_session_san.py
+会话走法提交与 SAN 记录测试
+
+CoreSession move submission and SAN recording tests.
+"""
+
+import pytest
+
+from backend.core.chess_basic.errors import IllegalMoveError
+from backend.core.chess_basic.types import Move
+from backend.core.orchestration.core_session import CoreSession
+from backend.core.orchestration.policies import AnalysisPolicy
+
+
+def _play(fen: str, *ucis: str) -> str:
+    session = CoreSession(starting_fen=fen)
+    for uci in ucis:
+        session.submit_move(Move.from_uci(uci))
+    return session.get_pgn()
+
+
+class TestSessionSan:
+    """SAN 消歧义测试 SAN disambiguation tests"""
+
+    def test_pawn_and_single_piece_moves(self):
+        """兵和唯一棋子不需要消歧义 Pawns and unique pieces are not disambiguated"""
+        pgn = _play("4k3/8/8/8/8/8/4P3/4K1N1 w - - 0 1", "e2e4", "e8d7", "g1f3")
+        assert "1. e4 Kd7 2. Nf3" in pgn
+
+    def test_knights_disambiguated_by_file(self):
+        """两个马可到同一格时按列消歧义 Two knights reaching one square use the file"""
+        pgn = _play("4k3/8/8/8/8/8/8/1N2KN2 w - - 0 1", "b1d2")
+        assert "1. Nbd2" in pgn
+
+    def test_second_knight_not_attacking_square(self):
+        """另一个马到不了目标格时不消歧义 No disambiguation when the other knight can't reach"""
+        pgn = _play("4k3/8/8/8/8/8/8/1N2K2N w - - 0 1", "b1c3")
+        assert "1. Nc3" in pgn
+
+
+class TestLegalMoveCache:
+    """合法走法缓存测试 Legal move cache tests"""
+
+    def test_cached_moves_validate_submissions(self):
+        """缓存命中时仍拒绝非法走法 Illegal moves are rejected with a warm cache"""
+        session = CoreSession()
+        assert len(session.get_legal_moves()) == 20
+        with pytest.raises(IllegalMoveError):
+            session.submit_move(Move.from_uci("e2e5"))
+        session.submit_move(Move.from_uci("e2e4"))
+        assert Move.from_uci("e7e5") in session.get_legal_moves()
+
+    def test_cache_refreshed_after_takeback(self):
+        """悔棋后缓存失效 Takeback invalidates the cache"""
+        session = CoreSession(policy=AnalysisPolicy())
+        session.submit_move(Move.from_uci("e2e4"))
+        black_moves = session.get_legal_moves()
+        assert session.takeback()
+        assert session.get_legal_moves() != black_moves
+
+    def test_returned_list_is_a_copy(self):
+        """返回的列表可安全修改 Returned list can be mutated safely"""
+        session = CoreSession()
+        session.get_legal_moves().clear()
+        assert len(session.get_legal_moves()) == 20
+
+
+class TestSessionReset:
+    """会话重置测试 Session reset tests"""
+
+    def test_reset_returns_to_custom_start(self):
+        """重置回到自定义起始局面 Reset returns to the custom starting FEN"""
+        fen = "4k3/8/8/8/8/8/4P3/4K3 w - - 0 1"
+        session = CoreSession(starting_fen=fen)
+        session.submit_move(Move.from_uci("e2e4"))
+        session.reset()
+        assert session.get_fen() == fen
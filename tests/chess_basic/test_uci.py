@@ -0,0 +1,31 @@
+"""
+test_uci.py
+UCI 解析测试
+
+UCI move parsing tests.
+"""
+
+import pytest
+from backend.core.chess_basic.errors import UCIParseError
+from backend.core.chess_basic.utils.uci import parse_uci_move
+from backend.core.chess_basic.constants import PieceType
+
+
+class TestParseUciMove:
+    """UCI 解析测试 UCI parsing tests"""
+
+    def test_parse_promotion(self):
+        """解析升变走法 Parse promotion move"""
+        move = parse_uci_move("e7e8q")
+        assert move.to_uci() == "e7e8q"
+        assert move.promotion == PieceType.QUEEN
+
+    def test_repeated_parse_returns_shared_move(self):
+        """重复解析复用同一 Move 对象 Repeated parses share one Move object"""
+        assert parse_uci_move("g1f3") is parse_uci_move("".join(["g1", "f3"]))
+
+    def test_invalid_move_raises_every_time(self):
+        """非法输入每次都报错 Invalid input raises on every call"""
+        for _ in range(2):
+            with pytest.raises(UCIParseError):
+                parse_uci_move("e9e4")
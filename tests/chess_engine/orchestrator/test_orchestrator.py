@@ -124,6 +124,57 @@ class TestEngineOrchestrator:
             # Should try all 3 spots (max_retries=2 means 3 total attempts)
             assert mock_analyze.call_count == 3
 
+    @patch('core.chess_engine.spot.spot.EngineSpot.analyze')
+    def test_analyze_all_spots_fail_serves_fallback(self, mock_analyze):
+        """Test that the speculative legal-move fallback is served on total failure."""
+        mock_analyze.side_effect = ChessEngineTimeoutError(30)
+
+        fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+        with patch('core.chess_engine.orchestrator.orchestrator.settings') as mock_settings:
+            mock_settings.ENGINE_FALLBACK_MODE = "legal"
+            result = self.orchestrator.analyze(fen, multipv=2)
+
+        assert result.source == "Fallback"
+        assert len(result.lines) == 2
+        assert self.orchestrator.last_spot_id == "fallback"
+
+    @patch('core.chess_engine.spot.spot.EngineSpot.analyze')
+    def test_analyze_healthy_success_skips_fallback(self, mock_analyze):
+        """Test that no speculative fallback is built while spots are healthy."""
+        mock_analyze.return_value = EngineResult(lines=[EngineLine(multipv=1, score=25, pv=["e2e4"])])
+        for spot_id in ["spot1", "spot2", "spot3"]:
+            self.orchestrator.pool.get_spot(spot_id).metrics.status = SpotStatus.HEALTHY
+
+        fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+        with patch('core.chess_engine.orchestrator.orchestrator.settings') as mock_settings, \
+                patch('core.chess_engine.orchestrator.orchestrator._FALLBACK_EXECUTOR') as executor:
+            mock_settings.ENGINE_FALLBACK_MODE = "legal"
+            self.orchestrator.analyze(fen)
+
+        assert executor.submit.call_count == 0
+
+    @patch('core.chess_engine.spot.spot.EngineSpot.analyze')
+    def test_analyze_fallback_deadline_computes_inline(self, mock_analyze):
+        """Test that a stuck speculative fallback is replaced, not turned into an error."""
+        from concurrent.futures import Future
+
+        mock_analyze.side_effect = ChessEngineTimeoutError(30)
+        stuck = Future()
+
+        fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+        with patch('core.chess_engine.orchestrator.orchestrator.settings') as mock_settings, \
+                patch('core.chess_engine.orchestrator.orchestrator._FALLBACK_EXECUTOR') as executor, \
+                patch.object(EngineOrchestrator, "FALLBACK_DEADLINE_S", 0.01):
+            mock_settings.ENGINE_FALLBACK_MODE = "legal"
+            executor.submit.return_value = stuck
+            result = self.orchestrator.analyze(fen, multipv=2)
+
+        assert executor.submit.call_count == 1
+        assert stuck.cancelled()
+        assert result.source == "Fallback"
+        assert len(result.lines) == 2
+        assert self.orchestrator.last_spot_id == "fallback"
+
     def test_analyze_no_spots_available(self):
         """Test error when no spots are available."""
         # Create orchestrator with no spots
@@ -170,6 +170,38 @@ class TestEngineSpotPool:
         assert "degraded" in spot_ids
         assert "down" not in spot_ids
 
+    def test_get_usable_spots_reuses_sorted_list(self):
+        """Test that steady-state lookups skip re-sorting."""
+        self.pool.register_spots([
+            SpotConfig(id="spot1", url="http://localhost:8001", priority=50),
+            SpotConfig(id="spot2", url="http://localhost:8002", priority=150),
+        ])
+        first = self.pool.get_usable_spots()
+
+        calls = []
+        original = self.pool.selector.select_all_usable
+        self.pool.selector.select_all_usable = lambda spots: calls.append(1) or original(spots)
+
+        assert self.pool.get_usable_spots() == first
+        assert calls == []
+
+    def test_get_usable_spots_invalidates_on_change(self):
+        """Test that status, enable/disable and registration refresh the list."""
+        self.pool.register_spots([
+            SpotConfig(id="spot1", url="http://localhost:8001", priority=50),
+            SpotConfig(id="spot2", url="http://localhost:8002", priority=150),
+        ])
+        assert [s.config.id for s in self.pool.get_usable_spots()] == ["spot2", "spot1"]
+
+        self.pool.get_spot("spot1").metrics.status = SpotStatus.HEALTHY
+        assert [s.config.id for s in self.pool.get_usable_spots()] == ["spot1"]
+
+        self.pool.disable_spot("spot1")
+        assert [s.config.id for s in self.pool.get_usable_spots()] == ["spot2"]
+
+        self.pool.register_spot(SpotConfig(id="spot3", url="http://localhost:8003", priority=200))
+        assert [s.config.id for s in self.pool.get_usable_spots()] == ["spot3", "spot2"]
+
     def test_enable_spot(self):
         """Test enabling a spot."""
         config = SpotConfig(id="spot1", url="http://localhost:8001", enabled=False)
@@ -93,7 +93,9 @@ class TestSpotMetrics:
         assert metrics.failure_count == 0
         assert metrics.status == SpotStatus.HEALTHY
         assert metrics.last_healthy_at is not None
-        assert isinstance(metrics.last_healthy_at, datetime)
+        assert isinstance(metrics.last_healthy_at, float)
+        assert isinstance(metrics.last_healthy_datetime, datetime)
+        assert metrics.last_healthy_datetime.tzinfo is not None
 
     def test_update_success_multiple_requests(self):
         """Test update_success with multiple requests."""
@@ -174,6 +176,21 @@ class TestSpotMetrics:
         # Status should remain unchanged (health monitor manages it)
         assert metrics.status == SpotStatus.HEALTHY
 
+    def test_metrics_use_slots(self):
+        """Test that metrics reject unknown attributes (slotted dataclass)."""
+        metrics = SpotMetrics()
+        with pytest.raises(AttributeError):
+            metrics.unknown_field = 1
+
+    def test_to_dict(self):
+        """Test JSON-friendly serialization."""
+        metrics = SpotMetrics()
+        metrics.update_success(100.0)
+        data = metrics.to_dict()
+        assert data["status"] == "healthy"
+        assert data["avg_latency_ms"] == 100.0
+        assert data["total_requests"] == 1
+
     def test_last_healthy_timestamp_updates(self):
         """Test that last_healthy_at updates on success."""
         metrics = SpotMetrics()
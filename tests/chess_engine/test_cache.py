@@ -0,0 +1,102 @@
+"""Tests for the cloud-eval Redis cache."""
+import sys
+from pathlib import Path
+
+# Add backend directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from core.chess_engine.cache import CloudEvalCache
+
+
+class FakeJSONPipeline:
+    """Records JSON.SET/EXPIRE calls and applies them on execute()."""
+
+    def __init__(self, store):
+        self.store = store
+        self.ops = []
+
+    def set(self, key, path, obj):
+        assert path == "$", "documents are written at the JSON root"
+        self.ops.append(("set", key, obj))
+
+    def expire(self, key, ttl):
+        self.ops.append(("expire", key, ttl))
+
+    def execute(self):
+        for op, key, value in self.ops:
+            if op == "set":
+                self.store[key] = value
+            else:
+                self.store[f"ttl:{key}"] = value
+
+
+class FakeJSON:
+    """Tiny subset of redis-py JSON commands used by CloudEvalCache."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def get(self, key, *paths):
+        doc = self.store.get(key)
+        if doc is None:
+            return None
+        result = {}
+        for path in paths:
+            if path == "$.multipv":
+                result[path] = [doc["multipv"]]
+            else:
+                n = int(path[len("$.pvs[:"):-1])
+                result[path] = doc["pvs"][:n]
+        return result
+
+    def pipeline(self, transaction=True):
+        return FakeJSONPipeline(self.store)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def json(self, encoder=None, decoder=None):
+        return FakeJSON(self.store)
+
+
+FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+PVS = [
+    {"moves": "e2e4 e7e5", "cp": 20},
+    {"moves": "d2d4 d7d5", "cp": 15},
+    {"moves": "c2c4", "cp": 10},
+]
+
+
+class TestCloudEvalCache:
+    def test_miss_returns_none(self):
+        cache = CloudEvalCache(FakeRedis())
+        assert cache.get_pvs(FEN, 3) is None
+
+    def test_set_then_get_prefix(self):
+        client = FakeRedis()
+        cache = CloudEvalCache(client, ttl=60)
+        cache.set_eval(FEN, 3, {"fen": FEN, "pvs": PVS})
+
+        assert client.store[cache.make_key(FEN)] == {"multipv": 3, "pvs": PVS}
+        assert client.store[f"ttl:{cache.make_key(FEN)}"] == 60
+        assert cache.get_pvs(FEN, 3) == PVS
+        assert cache.get_pvs(FEN, 1) == PVS[:1]
+
+    def test_smaller_cached_multipv_is_miss(self):
+        cache = CloudEvalCache(FakeRedis())
+        cache.set_eval(FEN, 1, {"pvs": PVS[:1]})
+        assert cache.get_pvs(FEN, 3) is None
+
+    def test_read_error_is_miss(self):
+        class BrokenJSON:
+            def get(self, *args):
+                raise ConnectionError("down")
+
+        class BrokenRedis:
+            def json(self, encoder=None, decoder=None):
+                return BrokenJSON()
+
+        cache = CloudEvalCache(BrokenRedis())
+        assert cache.get_pvs(FEN, 3) is None
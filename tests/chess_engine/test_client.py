@@ -0,0 +1,79 @@
+"""Tests for the single-spot EngineClient (no network)."""
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+# Add backend directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from core.chess_engine.client import EngineClient, CONNECT_TIMEOUT, DEFAULT_RETRY_AFTER
+from core.chess_engine.schemas import EngineResult
+from core.errors import ChessEngineError
+
+FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+
+class TestParseCloudEval:
+    """Test Lichess cloud-eval payload parsing."""
+
+    def setup_method(self):
+        self.client = EngineClient(timeout=5)
+
+    def test_parse_cp_and_mate(self):
+        result = self.client._parse_cloud_eval({
+            "pvs": [
+                {"moves": "e2e4 e7e5", "cp": 20},
+                {"moves": "d2d4", "mate": -3, "cp": None},
+            ]
+        })
+        assert result.source == "CloudEval"
+        assert [line.multipv for line in result.lines] == [1, 2]
+        assert result.lines[0].score == 20
+        assert result.lines[0].pv == ["e2e4", "e7e5"]
+        assert result.lines[1].score == "mate-3"
+
+    def test_parse_missing_fields(self):
+        result = self.client._parse_cloud_eval({"pvs": [{}]})
+        assert result.lines[0].score == 0
+        assert result.lines[0].pv == []
+
+    def test_parse_invalid_payload(self):
+        with pytest.raises(ChessEngineError):
+            self.client._parse_cloud_eval({"fen": "x"})
+
+
+class TestRateLimit:
+    """Test Retry-After handling for Lichess 429 responses."""
+
+    def setup_method(self):
+        self.client = EngineClient(timeout=5)
+        self.sf_result = EngineResult(lines=[], source="SFCata")
+
+    def test_uses_pooled_session_with_split_timeout(self):
+        response = Mock(status_code=200)
+        response.json.return_value = {"pvs": [{"moves": "e2e4", "cp": 20}]}
+        self.client.session.get = Mock(return_value=response)
+
+        self.client.analyze(FEN)
+
+        _, kwargs = self.client.session.get.call_args
+        assert kwargs["timeout"] == (CONNECT_TIMEOUT, 5)
+
+    def test_429_backs_off_cloud_eval(self):
+        response = Mock(status_code=429, headers={"Retry-After": "30"})
+        self.client.session.get = Mock(return_value=response)
+
+        with patch.object(EngineClient, "_analyze_sf", return_value=self.sf_result) as mock_sf:
+            assert self.client.analyze(FEN) is self.sf_result
+            # Second call skips Lichess entirely during the back-off window
+            assert self.client.analyze(FEN) is self.sf_result
+
+        assert self.client.session.get.call_count == 1
+        assert mock_sf.call_count == 2
+
+    def test_parse_retry_after(self):
+        assert EngineClient._parse_retry_after("12") == 12
+        assert EngineClient._parse_retry_after(None) == DEFAULT_RETRY_AFTER
+        assert EngineClient._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == DEFAULT_RETRY_AFTER
@@ -0,0 +1,56 @@
+"""Tests for the compact binary FEN codec."""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from core.chess_engine.fen_codec import encode_fen, fen_cache_key
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+
+class TestEncodeFen:
+    def test_start_position_layout(self):
+        encoded = encode_fen(START_FEN)
+        # Occupancy bitboard: ranks 1, 2, 7, 8
+        assert encoded[:8] == bytes.fromhex("ffff00000000ffff")
+        # a1 castling rook (13) + b1 knight (2), low nibble first
+        assert encoded[8] == 0x2D
+        # 32 pieces -> 16 bytes, no counters for the initial position
+        assert len(encoded) == 8 + 16
+        assert len(encoded) < len(START_FEN)
+
+    def test_side_to_move_changes_encoding(self):
+        white = "4k3/8/8/8/8/8/8/4K3 w - - 0 1"
+        black = "4k3/8/8/8/8/8/8/4K3 b - - 0 1"
+        assert encode_fen(white) != encode_fen(black)
+
+    def test_castling_rights_change_encoding(self):
+        with_rights = "r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1"
+        without = "r3k2r/8/8/8/8/8/8/R3K2R w - - 0 1"
+        assert encode_fen(with_rights) != encode_fen(without)
+
+    def test_en_passant_changes_encoding(self):
+        with_ep = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"
+        without = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+        assert encode_fen(with_ep) != encode_fen(without)
+
+    def test_counters_are_encoded(self):
+        early = "4k3/8/8/8/8/8/8/4K3 w - - 0 1"
+        late = "4k3/8/8/8/8/8/8/4K3 w - - 12 40"
+        assert encode_fen(early) != encode_fen(late)
+
+    @pytest.mark.parametrize("fen", ["", "8/8/8 w - - 0 1", "9/8/8/8/8/8/8/8 w - - 0 1", "4x3/8/8/8/8/8/8/4K3 w - - 0 1"])
+    def test_invalid_fen_raises(self, fen):
+        with pytest.raises(ValueError):
+            encode_fen(fen)
+
+
+def test_cache_key_is_fixed_size_hex():
+    key = fen_cache_key(START_FEN)
+    assert len(key) == 24
+    int(key, 16)
+    assert key == fen_cache_key(START_FEN)
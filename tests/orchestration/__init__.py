@@ -0,0 +1,6 @@
+"""
+orchestration tests
+测试模块入口
+
+Test module for orchestration.
+"""
@@ -0,0 +1,36 @@
+"""
+test_policies.py
+会话策略测试
+
+Session policy lookup and immutability tests.
+"""
+
+import dataclasses
+
+import pytest
+
+from backend.core.orchestration.policies import (
+    AnalysisPolicy,
+    SessionMode,
+    StandardGamePolicy,
+    get_policy_for_mode,
+)
+
+
+class TestPolicyLookup:
+    """策略查找测试 Policy lookup tests"""
+
+    def test_modes_share_policy_instances(self):
+        """同一模式返回同一策略实例 Same mode returns the same policy instance"""
+        assert get_policy_for_mode(SessionMode.ANALYSIS) is get_policy_for_mode(SessionMode.ANALYSIS)
+        assert isinstance(get_policy_for_mode(SessionMode.ANALYSIS), AnalysisPolicy)
+        assert isinstance(get_policy_for_mode("unknown"), StandardGamePolicy)
+
+    def test_policies_are_frozen_records(self):
+        """策略为不可变记录 Policies are immutable records"""
+        policy = get_policy_for_mode(SessionMode.PUZZLE)
+        assert policy.allows_takebacks is True
+        assert policy.records_pgn is False
+        assert StandardGamePolicy() == get_policy_for_mode(SessionMode.STANDARD_GAME)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            policy.allows_takebacks = False
@@ -2,14 +2,21 @@
 Integration tests for the analysis pipeline.
 """
 
+import asyncio
 import json
 import os
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 from backend.core.tagger.analysis.pipeline import AnalysisPipeline
+from backend.core.tagger.analysis.tag_cache import close_shared_tag_caches
+from backend.core.tagger.engine.http_client import HTTPStockfishClient
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
 
 
 class TestAnalysisPipeline:
@@ -34,6 +41,30 @@ class TestAnalysisPipeline:
         yield temp_path
         temp_path.unlink()
 
+    @pytest.fixture(autouse=True)
+    def warm_up(self):
+        """Keep the engine warm-up request off the network."""
+        with patch.object(HTTPStockfishClient, "warm_up", return_value=True) as mock_warm_up:
+            yield mock_warm_up
+
+    @pytest.fixture
+    def single_move_tree(self):
+        """Tree with the start position and one move (1. e4)."""
+        return {
+            "nodes": {
+                "root": {"san": "e4", "fen": START_FEN},
+                "a": {"parent_id": "root", "san": "e4", "uci": "e2e4"},
+            }
+        }
+
+    @pytest.fixture
+    def stub_engine(self):
+        """Replace tagging and the batched engine request with mocks."""
+        with patch("backend.core.tagger.analysis.pipeline.tag_position") as mock_tag, \
+                patch("backend.core.tagger.analysis.pipeline.get_primary_tags", return_value=["x"]) as mock_primary, \
+                patch.object(HTTPStockfishClient, "prefetch", return_value=0) as mock_prefetch:
+            yield SimpleNamespace(tag=mock_tag, primary=mock_primary, prefetch=mock_prefetch)
+
     @pytest.fixture
     def output_dir(self):
         """Create temporary output directory."""
@@ -140,3 +171,499 @@ class TestAnalysisPipeline:
 
         assert pipeline.depth == 10
         assert pipeline.multipv == 3
+
+    def test_fen_index_reuses_transposed_positions(self, sample_pgn, output_dir, stub_engine):
+        """Test that same position + move + move number is tagged once."""
+        pipeline = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir)
+        board = "rnbqkb1r/pppppppp/5n2/8/8/5N2/PPPPPPPP/RNBQKB1R w KQkq -"
+        tree_data = {
+            "nodes": {
+                "a": {"san": "Nf3", "fen": f"{board} 2 3"},
+                "b": {"san": "Nf6", "fen": f"{board} 4 3"},
+                # Same board later in the game: move-number gated tags differ
+                "c": {"san": "Nf6", "fen": f"{board} 0 16"},
+                "a1": {"parent_id": "a", "san": "e4", "uci": "e2e4"},
+                "b1": {"parent_id": "b", "san": "e4", "uci": "e2e4"},
+                "c1": {"parent_id": "c", "san": "e4", "uci": "e2e4"},
+            }
+        }
+
+        results = asyncio.run(pipeline.run_fen_index({}, tree_data=tree_data, verbose=False))
+
+        assert stub_engine.tag.call_count == 2
+        assert stub_engine.primary.call_count == 2
+        tagged_fens = {call.kwargs["fen"] for call in stub_engine.tag.call_args_list}
+        assert tagged_fens == {f"{board} 2 3", f"{board} 0 16"}
+        tagged = {r.node_id: r.tags for r in results if r.move_uci}
+        assert tagged == {"a1": ["x"], "b1": ["x"], "c1": ["x"]}
+        # Fanned-out results keep their own node's FEN
+        fens = {r.node_id: r.fen for r in results if r.move_uci}
+        assert fens == {"a1": f"{board} 2 3", "b1": f"{board} 4 3", "c1": f"{board} 0 16"}
+        # Only the unique nodes' positions go into the engine batch
+        assert len(stub_engine.prefetch.call_args.args[0]) == 4
+
+    def test_fen_index_concurrency_not_capped_by_default_executor(
+        self, sample_pgn, output_dir, stub_engine
+    ):
+        """Test that max_concurrency engine calls really run at once."""
+        import threading
+
+        pipeline = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir, max_concurrency=12)
+        nodes = {"root": {"san": "e4", "fen": START_FEN}}
+        ucis = [f"{f}2{f}{r}" for f in "abcdefgh" for r in "34"][:12]
+        for uci in ucis:
+            nodes[uci] = {"parent_id": "root", "san": uci, "uci": uci}
+
+        # Only passes once all 12 calls are in flight together
+        barrier = threading.Barrier(len(ucis), timeout=5)
+
+        def tag(fen, played_move_uci, **kwargs):
+            barrier.wait()
+            return object()
+
+        stub_engine.tag.side_effect = tag
+        results = asyncio.run(pipeline.run_fen_index({}, tree_data={"nodes": nodes}, verbose=False))
+
+        assert all(r.error is None for r in results)
+
+    def test_tag_cache_survives_across_runs(
+        self, sample_pgn, output_dir, single_move_tree, stub_engine
+    ):
+        """Test that a second run over the same tree skips the engine."""
+        pipeline = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir)
+
+        first = asyncio.run(pipeline.run_fen_index({}, tree_data=single_move_tree, verbose=False))
+        second = asyncio.run(pipeline.run_fen_index({}, tree_data=single_move_tree, verbose=False))
+        pipeline.depth += 1
+        asyncio.run(pipeline.run_fen_index({}, tree_data=single_move_tree, verbose=False))
+
+        # The depth change is a new cache key
+        assert stub_engine.tag.call_count == 2
+        assert [r.tags for r in first] == [r.tags for r in second] == [[], ["x"]]
+
+    def test_tag_cache_keyed_on_move_number(
+        self, sample_pgn, output_dir, single_move_tree, stub_engine
+    ):
+        """Test that the same board at another move number is not a cache hit."""
+        pipeline = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir)
+
+        asyncio.run(pipeline.run_fen_index({}, tree_data=single_move_tree, verbose=False))
+        single_move_tree["nodes"]["root"]["fen"] = START_FEN.replace(" 0 1", " 3 1")
+        asyncio.run(pipeline.run_fen_index({}, tree_data=single_move_tree, verbose=False))
+        single_move_tree["nodes"]["root"]["fen"] = START_FEN.replace(" 0 1", " 0 16")
+        asyncio.run(pipeline.run_fen_index({}, tree_data=single_move_tree, verbose=False))
+
+        # Only the halfmove clock is ignored
+        assert stub_engine.tag.call_count == 2
+
+    def test_batch_prefetch_skips_cached_nodes(
+        self, sample_pgn, output_dir, single_move_tree, stub_engine
+    ):
+        """Test that a warm tag cache sends no batched engine request."""
+        pipeline = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir)
+        tree_data = single_move_tree
+        tree_data["nodes"]["b"] = {"parent_id": "root", "san": "d4", "uci": "d2d4"}
+
+        asyncio.run(pipeline.run_fen_index({}, tree_data=tree_data, verbose=False))
+        asyncio.run(pipeline.run_fen_index({}, tree_data=tree_data, verbose=False))
+
+        assert stub_engine.prefetch.call_count == 1
+        # Both nodes' before/after positions share one batch
+        assert len(stub_engine.prefetch.call_args.args[0]) == 4
+
+    def test_adaptive_depth_reduces_quiet_moves_only(self, sample_pgn, output_dir, stub_engine):
+        """Test that adaptive_depth lowers depth/MultiPV only for quiet moves."""
+        pipeline = AnalysisPipeline(
+            pgn_path=sample_pgn, output_dir=output_dir, depth=14, multipv=6, adaptive_depth=True
+        )
+        italian = "r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 2 3"
+        tree_data = {
+            "nodes": {
+                "root": {"san": "Bc4", "fen": italian},
+                "quiet": {"parent_id": "root", "san": "O-O", "uci": "e1g1"},
+                "capture": {"parent_id": "root", "san": "Bxf7+", "uci": "c4f7"},
+                "hit": {"parent_id": "root", "san": "Nxe5", "uci": "f3e5"},
+            }
+        }
+
+        asyncio.run(pipeline.run_fen_index({}, tree_data=tree_data, verbose=False))
+
+        settings = {
+            call.kwargs["played_move_uci"]: (call.kwargs["depth"], call.kwargs["multipv"])
+            for call in stub_engine.tag.call_args_list
+        }
+        assert settings == {"e1g1": (10, 2), "c4f7": (14, 6), "f3e5": (14, 6)}
+
+    def test_fen_index_warms_engine_connection(
+        self, sample_pgn, output_dir, single_move_tree, stub_engine, warm_up
+    ):
+        """Test that http mode warms the engine only when a node needs it."""
+        import threading
+
+        pipeline = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir)
+        run_returned = threading.Event()
+        warmed = threading.Event()
+        outlived_run = []
+
+        def slow_warm_up():
+            outlived_run.append(run_returned.wait(5))
+            warmed.set()
+            return True
+
+        warm_up.side_effect = slow_warm_up
+        asyncio.run(pipeline.run_fen_index({}, tree_data=single_move_tree, verbose=False))
+        run_returned.set()
+        assert warmed.wait(5)
+        # Loop shutdown did not wait for the warm-up
+        assert outlived_run == [True]
+
+        # Fully cached and empty runs never reach the engine
+        asyncio.run(pipeline.run_fen_index({}, tree_data=single_move_tree, verbose=False))
+        asyncio.run(pipeline.run_fen_index({}, verbose=False))
+        assert warm_up.call_count == 1
+
+    def test_disk_tag_cache_shared_between_pipelines(
+        self, sample_pgn, output_dir, single_move_tree, stub_engine
+    ):
+        """Test that a fresh pipeline reuses tags persisted by an earlier one."""
+        cache_path = output_dir / "tags.sqlite"
+
+        for _ in range(2):
+            pipeline = AnalysisPipeline(
+                pgn_path=sample_pgn, output_dir=output_dir, tag_cache_path=cache_path
+            )
+            results = asyncio.run(
+                pipeline.run_fen_index({}, tree_data=single_move_tree, verbose=False)
+            )
+            # Reopen from disk, as after a restart
+            close_shared_tag_caches()
+
+        assert stub_engine.tag.call_count == 1
+        assert [r.tags for r in results] == [[], ["x"]]
+
+    def test_disk_tag_cache_keyed_on_move_number(
+        self, sample_pgn, output_dir, single_move_tree, stub_engine
+    ):
+        """Test that persisted tags are not reused at another move number."""
+        cache_path = output_dir / "tags.sqlite"
+
+        for fen in (START_FEN, START_FEN.replace(" 0 1", " 0 16")):
+            single_move_tree["nodes"]["root"]["fen"] = fen
+            pipeline = AnalysisPipeline(
+                pgn_path=sample_pgn, output_dir=output_dir, tag_cache_path=cache_path
+            )
+            asyncio.run(pipeline.run_fen_index({}, tree_data=single_move_tree, verbose=False))
+            close_shared_tag_caches()
+
+        assert stub_engine.tag.call_count == 2
+
+    def test_disk_tag_cache_stays_off_event_loop(
+        self, sample_pgn, output_dir, single_move_tree, stub_engine
+    ):
+        """Test that SQLite reads, writes and flushes run in worker threads."""
+        import threading
+
+        from backend.core.tagger.analysis.tag_cache import TagCache
+
+        threads = []
+
+        def record(method):
+            def wrapper(cache, *args):
+                threads.append(threading.current_thread())
+                return method(cache, *args)
+            return wrapper
+
+        pipeline = AnalysisPipeline(
+            pgn_path=sample_pgn, output_dir=output_dir, tag_cache_path=output_dir / "tags.sqlite"
+        )
+        with patch.object(TagCache, "get", record(TagCache.get)), \
+                patch.object(TagCache, "put", record(TagCache.put)), \
+                patch.object(TagCache, "flush", record(TagCache.flush)):
+            asyncio.run(pipeline.run_fen_index({}, tree_data=single_move_tree, verbose=False))
+        close_shared_tag_caches()
+
+        # Prefetch lookup, tagging lookup, store and flush
+        assert len(threads) == 4
+        assert threading.main_thread() not in threads
+
+    def test_fen_index_save_encodes_tags_once(
+        self, sample_pgn, output_dir, single_move_tree, stub_engine
+    ):
+        """Test that the file and the R2 upload share one encoded document."""
+        from unittest.mock import MagicMock
+
+        repo = MagicMock()
+        pipeline = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir, pgn_v2_repo=repo)
+
+        output_path = asyncio.run(pipeline.run_fen_index_and_save(
+            {}, chapter_id="ch1", tree_data=single_move_tree, verbose=False
+        ))
+        pipeline.close()
+
+        assert output_path == Path(output_dir) / "ch1.tags.json"
+        written = output_path.read_bytes()
+        assert repo.save_tags_json.call_args.kwargs["tags_json"] == written
+        tags_output = json.loads(written)
+        assert tags_output["metadata"]["total_nodes"] == 2
+        assert tags_output["nodes"] == {
+            "root": {"tags": [], "features": {}, "error": None},
+            "a": {"tags": ["x"], "features": {}, "error": None},
+        }
+
+    def test_fen_index_save_does_not_wait_for_r2(self, sample_pgn, output_dir):
+        """Test that the R2 upload runs in the background until close()."""
+        import threading
+        import time
+        from unittest.mock import MagicMock
+
+        release = threading.Event()
+        repo = MagicMock()
+        repo.save_tags_json.side_effect = lambda **kwargs: release.wait(5)
+        pipeline = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir, pgn_v2_repo=repo)
+
+        started = time.perf_counter()
+        output_path = asyncio.run(pipeline.run_fen_index_and_save(
+            {"virtual_root": "x"}, chapter_id="ch2", verbose=False
+        ))
+
+        # A synchronous upload would block here until release.wait times out
+        assert time.perf_counter() - started < 2
+        assert output_path.exists()
+        release.set()
+        pipeline.close()
+        assert repo.save_tags_json.call_count == 1
+
+    def test_fen_index_file_uses_uvloop_when_installed(self, sample_pgn, output_dir, tmp_path):
+        """Test that the sync file entry point runs on the uvloop factory if present."""
+        import asyncio
+        from unittest.mock import MagicMock
+
+        from backend.core.tagger.analysis import pipeline as pipeline_module
+
+        path = tmp_path / "chapter.fen_index.json"
+        path.write_text(json.dumps({"virtual_root": "x", "n1": "fen"}), encoding="utf-8")
+        fake_uvloop = MagicMock(new_event_loop=MagicMock(side_effect=asyncio.new_event_loop))
+        pipeline = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir)
+
+        with patch.object(pipeline_module, "HAS_UVLOOP", True), \
+                patch.object(pipeline_module, "uvloop", fake_uvloop, create=True):
+            results = pipeline.run_fen_index_file(path, verbose=False)
+
+        assert fake_uvloop.new_event_loop.call_count == 1
+        assert [(r.node_id, r.move_uci) for r in results] == [("n1", None)]
+
+    def test_run_tags_positions_concurrently(self, sample_pgn, output_dir):
+        """Test that PGN mode overlaps engine calls and still records errors."""
+        import threading
+
+        from backend.core.tagger.tag_result import TagResult
+
+        pipeline = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir)
+        threads = set()
+        # All three positions must be in flight together to get past this
+        barrier = threading.Barrier(3, timeout=5)
+
+        def slow_tag(fen, played_move_uci, **kwargs):
+            threads.add(threading.get_ident())
+            barrier.wait()
+            if played_move_uci == "g1f3":
+                raise RuntimeError("engine down")
+            return TagResult(
+                played_move=played_move_uci,
+                played_kind="quiet",
+                best_move=played_move_uci,
+                best_kind="quiet",
+                eval_before=0.0,
+                eval_played=0.0,
+                eval_best=0.0,
+                delta_eval=0.0,
+                first_choice=played_move_uci in ("e2e4", "e7e5"),
+            )
+
+        with patch("backend.core.tagger.analysis.pipeline.tag_position", side_effect=slow_tag):
+            stats = pipeline.run(verbose=False)
+
+        # e4 e5 Nf3: Nf3 fails, the two pawn moves are counted
+        assert stats.total_positions == 2
+        assert stats.tag_counts["first_choice"] == 2
+        assert len(threads) == 3
+
+    def test_max_concurrency_defaults_by_engine_mode(self, sample_pgn, output_dir):
+        """Test that http mode fans out wider than local Stockfish."""
+        http = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir)
+        local = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir, engine_mode="local")
+        custom = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir, max_concurrency=3)
+
+        assert http.max_concurrency == AnalysisPipeline.HTTP_MAX_CONCURRENCY
+        assert local.max_concurrency == (os.cpu_count() or 1)
+        assert custom.max_concurrency == 3
+
+    def test_fen_index_slow_node_does_not_block_others(self, sample_pgn, output_dir, stub_engine):
+        """Test that a slow node only holds its own slot, not a whole chunk."""
+        import threading
+        import time
+
+        pipeline = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir, max_concurrency=2)
+        nodes = {"root": {"san": "e4", "fen": START_FEN}}
+        ucis = ["e2e4", "d2d4", "c2c4", "g1f3", "b1c3", "f2f4"]
+        for uci in ucis:
+            nodes[uci] = {"parent_id": "root", "san": uci, "uci": uci}
+
+        others_done = threading.Event()
+        finished = []
+
+        def tag(fen, played_move_uci, **kwargs):
+            if played_move_uci == "e2e4":
+                # Chunked barriers would never free the other slot while this waits
+                if not others_done.wait(5):
+                    raise TimeoutError("other nodes blocked behind the slow one")
+                time.sleep(0.15)
+            else:
+                time.sleep(0.05)
+                finished.append(played_move_uci)
+                if len(finished) == len(ucis) - 1:
+                    others_done.set()
+            return object()
+
+        stub_engine.tag.side_effect = tag
+        results = asyncio.run(pipeline.run_fen_index({}, tree_data={"nodes": nodes}, verbose=False))
+
+        assert [r.move_uci for r in results if r.move_uci] == ucis
+        assert all(r.error is None for r in results)
+        timings = {r.move_uci: r.elapsed_ms for r in results}
+        assert timings.pop(None) is None
+        assert timings["e2e4"] > 150 and all(ms > 0 for ms in timings.values())
+        # Six moves fit in one engine batch: a board before and after each
+        positions = stub_engine.prefetch.call_args.args[0]
+        assert stub_engine.prefetch.call_count == 1
+        assert len(positions) == 2 * len(ucis)
+
+    def test_fen_index_slow_prefetch_does_not_block_nodes(
+        self, sample_pgn, output_dir, single_move_tree, stub_engine
+    ):
+        """Test that nodes fall back to their own requests when the batch stalls."""
+        import threading
+
+        pipeline = AnalysisPipeline(pgn_path=sample_pgn, output_dir=output_dir)
+        pipeline.PREFETCH_WAIT_SECONDS = 0.05
+        tagged = threading.Event()
+        batch_done = threading.Event()
+        batch_outlived_tagging = []
+
+        def prefetch(positions):
+            # Stalls until the node has been tagged without it
+            batch_outlived_tagging.append(tagged.wait(5))
+            batch_done.set()
+            return 0
+
+        def tag(fen, played_move_uci, **kwargs):
+            tagged.set()
+            return object()
+
+        stub_engine.prefetch.side_effect = prefetch
+        stub_engine.tag.side_effect = tag
+        results = asyncio.run(
+            pipeline.run_fen_index({}, tree_data=single_move_tree, verbose=False)
+        )
+
+        assert [r.tags for r in results] == [[], ["x"]]
+        assert batch_done.wait(5)
+        assert batch_outlived_tagging == [True]
+
+class TestFenIndexProcessor:
+    """Test fen_index loading."""
+
+    def test_file_and_json_string_give_same_entries(self, tmp_path):
+        """Both loaders parse the index and skip the virtual root."""
+        from backend.core.tagger.analysis.fen_processor import (
+            FenIndexProcessor,
+            process_fen_index_json,
+        )
+
+        fen_index = {
+            "virtual_root": START_FEN,
+            "n1": "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1",
+        }
+        path = tmp_path / "chapter.fen_index.json"
+        path.write_text(json.dumps(fen_index), encoding="utf-8")
+
+        from_file = FenIndexProcessor().process_fen_index_file(path)
+        from_json = process_fen_index_json(json.dumps(fen_index))
+
+        assert [(e.node_id, e.fen) for e in from_file] == [("n1", fen_index["n1"])]
+        assert from_file == from_json
+
+    async def test_load_many_overlaps_downloads(self):
+        """Chapter downloads run concurrently off the event loop."""
+        import threading
+
+        from backend.core.tagger.analysis.fen_processor import FenIndexProcessor
+
+        class SlowR2Client:
+            def __init__(self):
+                self.threads = set()
+                # Only passes once all three downloads are in flight together
+                self.barrier = threading.Barrier(3, timeout=5)
+
+            def download_json(self, key):
+                self.threads.add(threading.get_ident())
+                self.barrier.wait()
+                return json.dumps({"virtual_root": "root", key: "fen"})
+
+        client = SlowR2Client()
+        processor = FenIndexProcessor(r2_client=client)
+
+        results = await processor.load_and_process_many(["c1", "c2", "c3", "c1"])
+
+        assert list(results) == ["c1", "c2", "c3"]
+        assert results["c2"][0].node_id == "chapters/c2.fen_index.json"
+        assert len(client.threads) == 3
+
+    def test_tree_siblings_share_parsed_parent_board(self):
+        """Tree nodes carry a pre-parsed board, parsed once per parent FEN."""
+        from backend.core.tagger.analysis.fen_processor import FenIndexProcessor
+
+        start = START_FEN
+        tree = {
+            "nodes": {
+                "virtual_root": {"san": "<root>", "fen": start},
+                "a": {"parent_id": "virtual_root", "san": "e4", "uci": "e2e4"},
+                "b": {"parent_id": "virtual_root", "san": "d4", "uci": "d2d4"},
+            }
+        }
+
+        entries = FenIndexProcessor().process_tree_with_moves(tree)
+
+        assert [e.node_id for e in entries] == ["a", "b"]
+        assert entries[0].board is entries[1].board
+        assert entries[0].board.fen() == start
+
+    def test_entry_key_ignores_halfmove_clock_only(self):
+        """Entries carry a position key without the halfmove clock."""
+        from backend.core.tagger.analysis.fen_processor import NodeFenEntry
+
+        board = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3"
+        early = NodeFenEntry(node_id="a", fen=f"{board} 0 1")
+        same_move = NodeFenEntry(node_id="a", fen=f"{board} 4 1")
+        late = NodeFenEntry(node_id="a", fen=f"{board} 0 9")
+
+        assert early.key == same_move.key == f"{board} 1"
+        assert late.key == f"{board} 9"
+        assert early != same_move
+
+    def test_json_io_matches_stdlib_output(self, tmp_path):
+        """orjson and the json fallback write the same indented document."""
+        from backend.core.tagger.analysis import json_io
+
+        data = {"metadata": {"depth": 14, "name": "Réti"}, "nodes": {"n1": {"tags": ["x"], "error": None}}}
+        fast = tmp_path / "fast.json"
+        slow = tmp_path / "slow.json"
+
+        json_io.write_json(fast, data)
+        with patch.object(json_io, "HAS_ORJSON", False):
+            json_io.write_json(slow, data)
+            assert json_io.read_json(fast) == data
+
+        assert json_io.read_json(slow) == data
+        assert json.loads(fast.read_text(encoding="utf-8")) == data
+        assert fast.read_text(encoding="utf-8").splitlines()[1] == '  "metadata": {'
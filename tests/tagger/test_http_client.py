@@ -0,0 +1,187 @@
+"""
+Tests for the HTTP Stockfish client (no network).
+"""
+from unittest.mock import MagicMock, patch
+
+import chess
+
+from backend.core.tagger.engine import http_client
+from backend.core.tagger.engine.http_client import HTTPStockfishClient
+
+
+def test_clients_share_one_pooled_session():
+    """Every client instance reuses the same keep-alive session."""
+    response = MagicMock()
+    response.json.return_value = {"info": ["info depth 10 multipv 1 score cp 31 pv e2e4 e7e5"]}
+    session = http_client._shared_session()
+
+    with patch.object(session, "post", return_value=response) as post:
+        for _ in range(2):
+            client = HTTPStockfishClient(base_url="http://engine.test/engine")
+            candidates, best_score, _ = client.analyse_candidates(chess.Board(), depth=10, multipv=1)
+
+    assert post.call_count == 2
+    assert best_score == 31
+    assert candidates[0].move == chess.Move.from_uci("e2e4")
+    assert http_client._shared_session() is session
+
+
+def test_prefetch_batches_positions_for_post_analyze():
+    """One batch request answers later per-position calls without a round trip."""
+    base_url = "http://batch.test/engine"
+    board = chess.Board()
+    after = board.copy()
+    after.push_uci("e2e4")
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"results": [
+        {"info": ["info depth 10 multipv 1 score cp 31 pv e2e4 e7e5"]},
+        {"info": ["info depth 10 multipv 1 score cp -25 pv e7e5"]},
+    ]}
+    session = http_client._shared_session()
+    client = HTTPStockfishClient(base_url=base_url)
+
+    with patch.object(session, "post", return_value=response) as post:
+        assert client.prefetch([(board.fen(), 10, 1), (after.fen(), 10, 1)]) == 2
+        _, best_score, _ = client.analyse_candidates(board, depth=10, multipv=1)
+        played_score = client.eval_specific(board, chess.Move.from_uci("e2e4"), depth=10)
+
+    assert post.call_count == 1
+    assert post.call_args.args[0] == f"{base_url}/analyze/batch"
+    assert len(post.call_args.kwargs["json"]["batch"]) == 2
+    assert (best_score, played_score) == (31, -25)
+
+
+def test_prefetched_position_serves_every_sibling():
+    """Siblings share the parent's position; each reads the one prefetched entry."""
+    board = chess.Board()
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"results": [
+        {"info": ["info depth 10 multipv 1 score cp 31 pv e2e4 e7e5"]},
+    ]}
+    session = http_client._shared_session()
+    client = HTTPStockfishClient(base_url="http://siblings.test/engine")
+
+    with patch.object(session, "post", return_value=response) as post:
+        assert client.prefetch([(board.fen(), 10, 1), (board.fen(), 10, 1)]) == 1
+        for _ in range(2):
+            _, best_score, _ = client.analyse_candidates(board, depth=10, multipv=1)
+
+    assert post.call_count == 1
+    assert best_score == 31
+
+
+def test_prefetch_sends_batches_concurrently():
+    """Positions beyond BATCH_SIZE go out as overlapping batch requests."""
+    import threading
+
+    board = chess.Board()
+    positions = [(board.fen(), 10, 1)]
+    for move in list(board.legal_moves)[:http_client.BATCH_SIZE]:
+        after = board.copy()
+        after.push(move)
+        positions.append((after.fen(), 10, 1))
+    # Only passes once both batch requests are in flight together
+    barrier = threading.Barrier(2, timeout=5)
+
+    def post(url, json, **kwargs):
+        barrier.wait()
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"results": [
+            {"info": ["info depth 10 multipv 1 score cp 0 pv e2e4"]} for _ in json["batch"]
+        ]}
+        return response
+
+    client = HTTPStockfishClient(base_url="http://concurrent.test/engine")
+    with patch.object(http_client._shared_session(), "post", side_effect=post) as mock_post:
+        assert client.prefetch(positions) == len(positions)
+
+    assert mock_post.call_count == 2
+
+
+def test_prefetch_falls_back_without_batch_endpoint():
+    """A 404 from /analyze/batch disables batching for that service."""
+    response = MagicMock(status_code=404)
+    session = http_client._shared_session()
+    client = HTTPStockfishClient(base_url="http://nobatch.test/engine")
+    positions = [(chess.Board().fen(), 10, 1)]
+
+    with patch.object(session, "post", return_value=response) as post:
+        assert client.prefetch(positions) == 0
+        assert client.prefetch(positions) == 0
+
+    assert post.call_count == 1
+
+
+def test_shared_session_retries_transient_failures():
+    """Connection failures are retried for any method; HTTP error statuses are not."""
+    adapter = http_client._shared_session().get_adapter("https://sf.catachess.com/engine")
+    retries = adapter.max_retries
+
+    assert retries.total == 2
+    assert retries.connect == 2
+    assert retries.read is False
+    assert retries.is_retry("POST", 503) is False
+    assert retries.allowed_methods is None
+
+
+def test_shared_session_does_not_resend_on_read_timeout():
+    """A slow engine sees one POST and the caller gets ReadTimeout."""
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    import pytest
+    import requests
+
+    hits = []
+
+    class SlowHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            hits.append(1)
+            time.sleep(0.5)
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with pytest.raises(requests.ReadTimeout):
+            http_client._shared_session().post(
+                f"http://127.0.0.1:{server.server_port}/analyze", json={}, timeout=0.1
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(hits) == 1
+
+
+def test_eval_specific_scores_finished_games_locally():
+    """Checkmate and stalemate after the move never reach the engine."""
+    client = HTTPStockfishClient(base_url="http://engine.test/engine")
+    mate = chess.Board("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    stalemate = chess.Board("7k/8/6Q1/8/8/8/8/6K1 w - - 0 1")
+
+    with patch.object(http_client._shared_session(), "post") as post:
+        assert client.eval_specific(mate, chess.Move.from_uci("a1a8"), depth=10) == -10000
+        assert client.eval_specific(stalemate, chess.Move.from_uci("g1g2"), depth=10) == 0
+
+    assert post.call_count == 0
+
+
+def test_warm_up_hits_health_and_swallows_errors():
+    """Warm-up opens a pooled connection and never raises."""
+    import requests
+
+    client = HTTPStockfishClient(base_url="http://engine.test/engine")
+    session = http_client._shared_session()
+
+    with patch.object(session, "get") as get:
+        assert client.warm_up() is True
+    assert get.call_args.args[0] == "http://engine.test/engine/health"
+
+    with patch.object(session, "get", side_effect=requests.ConnectionError("down")):
+        assert client.warm_up() is False
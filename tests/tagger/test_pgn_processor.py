@@ -76,6 +76,15 @@ class TestPGNProcessor:
         processor = PGNProcessor(sample_pgn)
         assert processor.count_games() == 2
 
+    def test_games_read_counts_games_without_positions(self, sample_pgn):
+        """Test that games shorter than skip_opening_moves are still counted."""
+        processor = PGNProcessor(sample_pgn)
+        positions = list(processor.extract_positions(skip_opening_moves=3))
+
+        # Game 2 has only 3 plies, so every position comes from game 1
+        assert {p.game_index for p in positions} == {0}
+        assert processor.games_read == 2
+
     def test_position_metadata(self, sample_pgn):
         """Test that position metadata is correctly extracted."""
         processor = PGNProcessor(sample_pgn)
@@ -85,3 +94,122 @@ class TestPGNProcessor:
         assert "Event" in first_pos.game_headers
         assert first_pos.game_headers["Event"] == "Test"
         assert first_pos.game_headers["White"] == "White Player"
+
+    def test_game_headers_shared_and_read_only(self, sample_pgn):
+        """Test that positions of one game share a single read-only header map."""
+        positions = list(PGNProcessor(sample_pgn).extract_positions())
+        first_game = [p for p in positions if p.game_index == 0]
+
+        assert all(p.game_headers is first_game[0].game_headers for p in first_game)
+        assert positions[-1].game_headers["Site"] is first_game[0].game_headers["Site"]
+        with pytest.raises(TypeError):
+            first_game[0].game_headers["Event"] = "changed"
+
+    def test_positions_are_frozen_slots_records(self, sample_pgn):
+        """Test that Position has no per-instance __dict__ and cannot be mutated."""
+        import dataclasses
+
+        position = next(PGNProcessor(sample_pgn).extract_positions())
+
+        assert not hasattr(position, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            position.fen = ""
+
+    def test_position_fens_match_python_chess(self, sample_pgn):
+        """Test that extracted FENs are identical to board.fen()."""
+        import chess
+
+        processor = PGNProcessor(sample_pgn)
+        board = chess.Board()
+        for position in list(processor.extract_positions())[:5]:
+            assert position.fen == board.fen()
+            board.push_uci(position.played_move_uci)
+
+    def test_bom_and_latin1_bytes_are_tolerated(self, tmp_path):
+        """Test that a BOM and non-UTF-8 header bytes do not break parsing."""
+        path = tmp_path / "latin1.pgn"
+        path.write_bytes(
+            b'\xef\xbb\xbf[Event "Test"]\n[White "R\xe9ti"]\n[Black "Nimzowitsch"]\n\n'
+            b'1. Nf3 d5 2. c4 *\n'
+        )
+
+        processor = PGNProcessor(path)
+        positions = list(processor.extract_positions())
+
+        assert processor.count_games() == 1
+        assert [p.played_move_uci for p in positions] == ["g1f3", "d7d5", "c2c4"]
+        assert positions[0].game_headers["Event"] == "Test"
+        assert positions[0].game_headers["White"] == "R\ufffdti"
+
+    def test_variations_are_skipped(self, tmp_path):
+        """Test that only mainline moves are yielded and comments survive."""
+        path = tmp_path / "variations.pgn"
+        path.write_text(
+            '[Event "Var"]\n\n'
+            "1. e4 {best by test} (1. d4 d5 (1... Nf6 2. c4) 2. c4) 1... c5 "
+            "(1... e5 2. Nf3) 2. Nf3 *\n",
+            encoding="utf-8",
+        )
+
+        positions = list(PGNProcessor(path).extract_positions())
+
+        assert [p.played_move_uci for p in positions] == ["e2e4", "c7c5", "g1f3"]
+
+    def test_fen_header_and_illegal_move(self, tmp_path):
+        """Test SetUp/FEN starts, roster defaults and stopping at an illegal move."""
+        path = tmp_path / "edge.pgn"
+        path.write_text(
+            '[SetUp "1"]\n[FEN "4k3/8/8/8/8/8/4P3/4K3 w - - 0 1"]\n\n1. e4 Kd7 1-0\n\n'
+            "1. d4 d5 2. Qxh7 Nf6 *\n",
+            encoding="utf-8",
+        )
+
+        positions = list(PGNProcessor(path).extract_positions())
+
+        assert [(p.game_index, p.played_move_uci) for p in positions] == [
+            (0, "e2e4"), (0, "e8d7"), (1, "d2d4"), (1, "d7d5"),
+        ]
+        assert positions[0].fen == "4k3/8/8/8/8/8/4P3/4K3 w - - 0 1"
+        assert positions[0].game_headers["Event"] == "?"
+        assert positions[0].game_headers["Result"] == "1-0"
+
+    def test_parallel_extraction_matches_sequential(self, tmp_path, monkeypatch):
+        """Test that byte-range workers give the same positions in the same order."""
+        from backend.core.tagger.analysis import pgn_processor
+
+        games = [
+            f'[Event "G{i}"]\n[White "W{i}"]\n\n1. e4 e5 2. Nf3 (2. f4) Nc6 3. Bb5 a6 1-0'
+            for i in range(12)
+        ]
+        path = tmp_path / "many.pgn"
+        path.write_text("\n\n".join(games) + "\n", encoding="utf-8")
+        monkeypatch.setattr(pgn_processor, "_PARALLEL_MIN_BYTES", 0)
+
+        def as_tuples(positions):
+            return [
+                (p.game_index, p.move_number, p.fen, p.played_move_uci, dict(p.game_headers))
+                for p in positions
+            ]
+
+        processor = PGNProcessor(path)
+        sequential = as_tuples(processor.extract_positions(skip_opening_moves=1))
+        parallel = as_tuples(processor.extract_positions_parallel(n_workers=2, skip_opening_moves=1))
+
+        assert parallel == sequential
+        assert len(parallel) == 12 * 5
+        assert parallel[-1][0] == 11
+
+
+@pytest.mark.parametrize("fen", [
+    "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3",  # legal en passant
+    "4k3/8/8/8/3pP3/8/8/q3K3 b - e3 0 1",  # en passant capture is pinned
+    "r3k2r/8/8/8/8/8/8/R3K1R1 b Qk - 7 40",
+    "8/8/8/8/8/8/8/K6k w - - 0 1",
+])
+def test_fast_fen_matches_board_fen(fen):
+    """Test the bitboard FEN builder against python-chess."""
+    import chess
+    from backend.core.tagger.analysis.pgn_processor import _fast_fen
+
+    board = chess.Board(fen)
+    assert _fast_fen(board) == board.fen()
@@ -142,3 +142,26 @@ class TestTagStatistics:
         assert "Total Positions Analyzed: 1" in report
         assert "first_choice" in report
         assert "100.00%" in report
+
+    def test_only_boolean_tag_fields_are_counted(self):
+        """Test that scores, metrics and mode never show up as tags."""
+        stats = TagStatistics()
+
+        result = TagResult(
+            played_move="e2e4",
+            played_kind="quiet",
+            best_move="e2e4",
+            best_kind="quiet",
+            eval_before=0.0,
+            eval_played=0.0,
+            eval_best=0.0,
+            delta_eval=1.0,
+            first_choice=True,
+            prophylaxis_score=0.7,
+            coverage_delta=3,
+            mode="tactical",
+            notes={"x": "y"},
+        )
+        stats.add_result(result)
+
+        assert dict(stats.tag_counts) == {"first_choice": 1}
@@ -169,9 +169,40 @@ def test_error_mapping():
     print("\n" + "=" * 60)
 
 
+def test_error_slots():
+    """Test that every error class keeps message/details in slots"""
+    import core.errors as errors
+
+    error_classes = [
+        obj for obj in vars(errors).values()
+        if isinstance(obj, type) and issubclass(obj, errors.AppError)
+    ]
+    for cls in error_classes:
+        assert "__slots__" in cls.__dict__, cls.__name__
+
+    error = errors.InvalidFENError("bad_fen")
+    assert error.message == "Invalid FEN notation: bad_fen"
+    assert error.details == {"fen": "bad_fen"}
+
+
+def test_error_response_format():
+    """Test that API responses use the concrete class name"""
+    from core.errors import AppError, InvalidFENError
+
+    assert get_error_response(InvalidFENError("bad_fen")) == {
+        "error": "InvalidFENError",
+        "message": "Invalid FEN notation: bad_fen",
+        "details": {"fen": "bad_fen"},
+    }
+    assert get_error_response(InvalidCredentialsError())["details"] is None
+    assert get_error_response(AppError("boom"))["error"] == "AppError"
+
+
 if __name__ == "__main__":
     test_error_handling()
     test_error_mapping()
+    test_error_slots()
+    test_error_response_format()
 
     print("\n" + "🎯 " * 20)
     print("PROFESSIONAL ERROR HANDLING IN PLACE")
@@ -18,6 +18,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from core.db.base import Base
+from models.user import User
 from services.user_service import create_user, authenticate_user
 from core.security.jwt import create_access_token, decode_token
 from core.security.current_user import get_current_user_sync
@@ -255,6 +256,95 @@ def test_jwt_token_properties():
         db.close()
 
 
+def test_jwt_hs256_fast_path():
+    """Test the HS256 fast path agrees with PyJWT"""
+    import jwt
+    from core.config import settings
+    from core.security.jwt import _verify_and_decode
+
+    token = create_access_token("fast-path-user")
+    assert _verify_and_decode(token) == jwt.decode(
+        token, settings.JWT_SECRET_KEY, algorithms=["HS256"]
+    )
+
+    # Tampered signatures are rejected on both paths
+    header, payload, signature = token.split(".")
+    tampered = f"{header}.{payload}.{signature[::-1]}"
+    assert _verify_and_decode(tampered) is None
+    assert decode_token(tampered) is None
+
+    # Expired, unsigned and extra-claim tokens are left to PyJWT
+    expired = jwt.encode({"sub": "u", "exp": int(time.time()) - 10}, settings.JWT_SECRET_KEY, algorithm="HS256")
+    unsigned = jwt.encode({"sub": "u", "exp": int(time.time()) + 60}, None, algorithm="none")
+    with_iat = jwt.encode({"sub": "u", "exp": int(time.time()) + 60, "iat": int(time.time())}, settings.JWT_SECRET_KEY, algorithm="HS256")
+    assert _verify_and_decode(expired) is None and decode_token(expired) is None
+    assert _verify_and_decode(unsigned) is None and decode_token(unsigned) is None
+    assert _verify_and_decode(with_iat) is None and decode_token(with_iat) == "u"
+
+
+def test_jwt_decode_cache():
+    """Test repeat decodes are served from the token cache until expiry"""
+    from unittest.mock import patch
+    from core.security import jwt as jwt_module
+
+    token = create_access_token("cached-user")
+    assert decode_token(token) == "cached-user"
+
+    with patch.object(jwt_module, "_verify_and_decode") as verify:
+        assert decode_token(token) == "cached-user"
+        verify.assert_not_called()
+
+    # Entries past their exp are dropped and the token is re-verified
+    jwt_module._DECODE_CACHE[token] = (time.time() - 1, "cached-user")
+    with patch.object(jwt_module, "_verify_and_decode", return_value=None):
+        assert decode_token(token) == "cached-user"
+
+
+def test_current_user_cache():
+    """Test get_current_user reuses recently loaded users across sessions"""
+    from unittest.mock import patch
+    from core.security import current_user as current_user_module
+    from core.security.current_user import get_current_user
+    from services.user_service import update_user_profile
+
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    User.__table__.create(engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    setup_db = SessionLocal()
+    user = create_user(
+        db=setup_db,
+        identifier="cache_test@example.com",
+        identifier_type="email",
+        password="password123",
+        role="student",
+        username="cache_tester"
+    )
+    user_id = user.id
+    token = create_access_token(str(user_id))
+    setup_db.close()
+
+    first_db = SessionLocal()
+    assert get_current_user(token=token, db=first_db).id == user_id
+    first_db.close()
+
+    # Second request: served from the cache and attached to the new session
+    second_db = SessionLocal()
+    with patch.object(second_db, "get", side_effect=AssertionError("cache miss")):
+        cached_user = get_current_user(token=token, db=second_db)
+    assert cached_user in second_db
+    assert cached_user.username == "cache_tester"
+
+    # Profile writes invalidate the cached snapshot
+    update_user_profile(second_db, user_id, {"username": "renamed"})
+    second_db.close()
+    assert user_id not in current_user_module._USER_CACHE
+
+    third_db = SessionLocal()
+    assert get_current_user(token=token, db=third_db).username == "renamed"
+    third_db.close()
+
+
 if __name__ == "__main__":
     print("\n" + "🔐 " * 20)
     print("JWT AUTHENTICATION SYSTEM TESTS")
@@ -120,5 +120,19 @@ def test_logging_system():
     print("  - api.log")
 
 
+def test_loggers_only_enqueue():
+    """File I/O and rollover run on the listener thread, never the caller's."""
+    from logging.handlers import QueueHandler, RotatingFileHandler
+    import core.log as log_module
+    from core.log.log_api import logger as api_logger
+
+    assert api_logger.handlers
+    assert all(isinstance(h, QueueHandler) for h in api_logger.handlers)
+
+    routed = log_module._ROUTER.routes["api"]
+    assert any(isinstance(h, RotatingFileHandler) for h in routed)
+    assert log_module._LISTENER is not None
+
+
 if __name__ == "__main__":
     test_logging_system()
@@ -164,6 +164,30 @@ def test_user_creation_and_authentication():
         db.close()
 
 
+def test_role_permissions():
+    """Test role checks against the plain role strings stored on users"""
+    import pytest
+    from fastapi import HTTPException
+    from models.user import User
+    from core.security.permissions import Role, require_role, require_student, require_teacher
+
+    teacher = User(username="t", role="teacher")
+    student = User(username="s", role="student")
+
+    require_teacher(teacher)
+    require_student(student)
+    require_role(teacher, Role.TEACHER)
+
+    with pytest.raises(HTTPException) as exc_info:
+        require_teacher(student)
+    assert exc_info.value.status_code == 403
+    assert exc_info.value.detail == "Teacher permission required"
+
+    with pytest.raises(HTTPException) as exc_info:
+        require_role(teacher, Role.STUDENT)
+    assert exc_info.value.detail == "Student permission required"
+
+
 def test_with_postgres():
     """Test with actual PostgreSQL database"""
     print("\n" + "=" * 60)
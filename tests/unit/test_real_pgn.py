@@ -1,8 +1,11 @@
+import sys
+
 import pytest
+from backend.core.real_pgn.models import NodeTree, PgnNode
 from backend.core.real_pgn.parser import parse_pgn
 from backend.core.real_pgn.builder import build_pgn
-from backend.core.real_pgn.fen import build_fen_index
-from backend.core.real_pgn.show import build_show
+from backend.core.real_pgn.fen import apply_move, build_fen_index
+from backend.core.real_pgn.show import _yield_tokens, build_show
 
 SAMPLE_PGN = """
 [Event "Sample Game"]
@@ -70,6 +73,76 @@ def test_fen_indexer():
     
     expected_fen = "r1bqkbnr/pppp1ppp/2n5/1B2p3/4P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3"
     assert fen_index[bb5_node_id] == expected_fen
+
+def test_apply_move_reuses_parsed_position():
+    """
+    Tests that repeated apply_move calls from one FEN don't leak state.
+    """
+    start = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    fen_e4, _, _ = apply_move(start, "e4")
+    fen_d4, _, _ = apply_move(start, "d2d4")
+
+    assert fen_e4 == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+    assert fen_d4 == "rnbqkbnr/pppppppp/8/8/3P4/8/PPP1PPPP/RNBQKBNR b KQkq - 0 1"
+    with pytest.raises(ValueError):
+        apply_move(start, "e5")
+
+def _long_shuffle_tree(plies: int) -> NodeTree:
+    """Builds a main line of knight shuffles longer than the recursion limit."""
+    tree = NodeTree()
+    tree.nodes["root"] = PgnNode(
+        node_id="root", parent_id=None, san="<root>", uci="<root>", ply=0, move_number=0,
+        fen="rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    )
+    tree.root_id = "root"
+    sans = ["Nf3", "Nf6", "Ng1", "Ng8"]
+    parent_id = "root"
+    for ply in range(1, plies + 1):
+        node_id = f"n{ply}"
+        tree.nodes[node_id] = PgnNode(
+            node_id=node_id, parent_id=parent_id, san=sans[(ply - 1) % 4], uci="",
+            ply=ply, move_number=(ply + 1) // 2,
+        )
+        tree.nodes[parent_id].main_child = node_id
+        parent_id = node_id
+    return tree
+
+def test_deep_tree_does_not_recurse():
+    """
+    Tests that FEN indexing and rendering handle lines deeper than the recursion limit.
+    """
+    plies = sys.getrecursionlimit() + 200
+    tree = _long_shuffle_tree(plies)
+
+    fen_index = build_fen_index(tree)
+    assert len(fen_index) == plies + 1
+    assert fen_index[f"n{plies}"].startswith("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq -")
+
+    render = build_show(tree)["render"]
+    assert len([t for t in render if t["t"] == "move"]) == plies
+
+def test_show_dto_nodes_share_node_fields():
+    """
+    Tests that ShowDTO nodes expose each node's fields without copying them.
+    """
+    tree = parse_pgn(SAMPLE_PGN)
+    nodes = build_show(tree)["nodes"]
+    for node_id, node in tree.nodes.items():
+        assert nodes[node_id] is vars(node)
+        assert nodes[node_id]["san"] == node.san
+
+    empty = build_show(NodeTree())
+    assert empty["root_fen"] is None and empty["nodes"] == {} and empty["render"] == []
+
+def test_render_tokens_are_streamed():
+    """
+    Tests that the render stream can be consumed lazily and matches build_show.
+    """
+    tree = parse_pgn(SAMPLE_PGN)
+    stream = _yield_tokens(tree, tree.root_id)
+    assert next(stream)["san"] == "e4"
+    assert [next(stream)] + list(stream) == build_show(tree)["render"][1:]
+
 def test_show_dto_builder():
     """
     Tests the build_show function with the final, detailed DTO spec.
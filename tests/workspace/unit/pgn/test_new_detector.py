@@ -2,7 +2,9 @@
 Tests for new PGN detector.
 """
 
-from core.new_pgn import detect_games
+import types
+
+from core.new_pgn import detect_games, iter_games
 
 
 SINGLE_GAME_PGN = """[Event "Test Event"]
@@ -31,6 +33,14 @@ MULTI_GAME_PGN = """[Event "Game 1"]
 1. d4 d5 1/2-1/2
 """
 
+NO_BLANK_LINES_PGN = """[Event "Game 1"]
+[Result "*"]
+1. e4 {[%clk 0:03:00]} e5 *
+[Event "Game 2"]
+[Result "*"]
+1. d4 d5 *
+"""
+
 NO_HEADER_PGN = """1. e4 e5 2. Nf3 Nc6 3. Bb5 1-0"""
 
 CUSTOM_FEN_PGN = """[Event "FEN Test"]
@@ -60,6 +70,12 @@ def test_detect_multiple_games():
     assert games[1].headers["Event"] == "Game 2"
 
 
+def test_detect_games_without_blank_lines():
+    games = detect_games(NO_BLANK_LINES_PGN)
+    assert [g.headers["Event"] for g in games] == ["Game 1", "Game 2"]
+    assert games[0].movetext == "1. e4 {[%clk 0:03:00]} e5 *"
+
+
 def test_detect_missing_headers_returns_empty():
     games = detect_games(NO_HEADER_PGN)
     assert games == []
@@ -70,3 +86,28 @@ def test_detect_preserves_custom_fen_headers():
     assert len(games) == 1
     game = games[0]
     assert game.headers["FEN"].startswith("rnbqkbnr/pppppppp")
+
+
+def test_iter_games_streams_same_games():
+    stream = iter_games(MULTI_GAME_PGN)
+    assert isinstance(stream, types.GeneratorType)
+    first = next(stream)
+    assert first.headers["Event"] == "Game 1"
+    rest = list(stream)
+    assert [g.index for g in [first, *rest]] == [g.index for g in detect_games(MULTI_GAME_PGN)]
+
+
+def test_games_share_source_text():
+    games = detect_games(MULTI_GAME_PGN)
+    assert games[0].source is games[1].source
+    assert games[1].raw.startswith('[Event "Game 2"]')
+    assert games[1].raw.endswith("1. d4 d5 1/2-1/2")
+    assert games[1].movetext == "1. d4 d5 1/2-1/2"
+
+
+def test_get_header_without_dict():
+    game = detect_games(SINGLE_GAME_PGN)[0]
+    assert game.get_header("White") == "Player1"
+    assert game.get_header("ECO") is None
+    assert game.get_header("ECO", "?") == "?"
+    assert game.header_items[:2] == ("Event", "Test Event")